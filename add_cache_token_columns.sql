@@ -0,0 +1,53 @@
+-- Add prompt cache token columns to translations table
+-- Cache writes are billed at 1.25x and cache reads at 0.1x the input price;
+-- without these columns the logged tokens and costs leave both out.
+-- Run this in Supabase SQL Editor on databases created before the columns existed.
+
+-- The stats view reads the generated columns, so it is recreated below
+DROP VIEW IF EXISTS user_translation_stats;
+
+-- Generated columns cannot change their expression in place
+ALTER TABLE translations
+DROP COLUMN IF EXISTS total_tokens,
+DROP COLUMN IF EXISTS cost_input_usd,
+DROP COLUMN IF EXISTS cost_total_usd;
+
+ALTER TABLE translations
+ADD COLUMN IF NOT EXISTS cache_creation_input_tokens INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS cache_read_input_tokens INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE translations
+ADD COLUMN total_tokens INTEGER GENERATED ALWAYS AS (
+    input_tokens + output_tokens + cache_creation_input_tokens + cache_read_input_tokens
+) STORED,
+ADD COLUMN cost_input_usd DECIMAL(10, 4) GENERATED ALWAYS AS (
+    ((input_tokens::DECIMAL / 1000000) * 0.80) +
+    ((cache_creation_input_tokens::DECIMAL / 1000000) * 1.00) +
+    ((cache_read_input_tokens::DECIMAL / 1000000) * 0.08)
+) STORED,
+ADD COLUMN cost_total_usd DECIMAL(10, 4) GENERATED ALWAYS AS (
+    ((input_tokens::DECIMAL / 1000000) * 0.80) +
+    ((cache_creation_input_tokens::DECIMAL / 1000000) * 1.00) +
+    ((cache_read_input_tokens::DECIMAL / 1000000) * 0.08) +
+    ((output_tokens::DECIMAL / 1000000) * 4.00)
+) STORED;
+
+-- Recreate the stats view (same as update_view.sql)
+CREATE OR REPLACE VIEW user_translation_stats AS
+SELECT
+    t.user_id,
+    u.email as user_email,
+    COUNT(*) as total_translations,
+    SUM(t.total_tokens) as total_tokens_used,
+    SUM(t.cost_total_usd) as total_cost_usd,
+    MAX(t.created_at) as last_translation_at
+FROM translations t
+LEFT JOIN auth.users u ON t.user_id = u.id
+WHERE t.status = 'completed'
+GROUP BY t.user_id, u.email;
+
+-- Grant access to the view
+GRANT SELECT ON user_translation_stats TO authenticated;
+
+-- RLS for the view
+ALTER VIEW user_translation_stats SET (security_invoker = true);
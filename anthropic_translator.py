@@ -1,24 +1,56 @@
 """Anthropic API Translation Helper using Claude Haiku 4.5"""
 import json
-from anthropic import Anthropic
+import math
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from anthropic import DEFAULT_CONNECTION_LIMITS, Anthropic, DefaultHttpxClient, Timeout
 
-def translate_with_haiku(french_texts: dict, api_key: str) -> dict:
-    """
-    Translate French texts to English using Claude Haiku 4.5
+# Maximum number of batches in flight at once (override with HAIKU_MAX_CONCURRENCY)
+MAX_CONCURRENCY = int(os.environ.get("HAIKU_MAX_CONCURRENCY", "4"))
 
-    Args:
-        french_texts: Dict of {index: french_text}
-        api_key: Anthropic API key
+# HTTP connection pool shared by every request in the process
+MAX_CONNECTIONS = int(os.environ.get("HAIKU_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("HAIKU_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection stays open
 
-    Returns:
-        Dict of {index: english_translation}
-    """
-    client = Anthropic(api_key=api_key)
+# Timeouts (seconds); a full 8000-token reply can take over a minute
+REQUEST_TIMEOUT = float(os.environ.get("HAIKU_REQUEST_TIMEOUT", "120"))
+CONNECT_TIMEOUT = 10.0
+
+# Claude Haiku 4.5
+MODEL = "claude-haiku-4-5-20251001"
+
+# Response size limit per request
+MAX_OUTPUT_TOKENS = 8000
+
+# Estimated output tokens each batch is packed up to (headroom below MAX_OUTPUT_TOKENS)
+OUTPUT_TOKEN_BUDGET = int(os.environ.get("HAIKU_OUTPUT_TOKEN_BUDGET", "6000"))
 
-    # Prepare prompt
-    prompt = f"""You are translating architectural/construction documents from French to English.
+# Estimated input tokens each batch is packed up to
+INPUT_TOKEN_BUDGET = int(os.environ.get("HAIKU_INPUT_TOKEN_BUDGET", "20000"))
 
-Translate the following French texts to English. Return ONLY a JSON object with the same keys.
+# Local token estimate: accented uppercase French averages ~3 UTF-8 bytes per token
+BYTES_PER_TOKEN = 3.0
+
+# Per-item cost of the key, quotes and separators around each text
+ITEM_OVERHEAD_TOKENS = 6
+
+# English output vs French input length, with safety margin
+OUTPUT_RATIO = 1.2
+
+# Optional project glossary: JSON file of {french: english} appended to the cached instructions
+GLOSSARY_PATH = os.environ.get("TRANSLATION_GLOSSARY", "glossary.json")
+
+# Request/response encoding: "lines" (one key|text per line) or "json" (minified object)
+WIRE_FORMAT = os.environ.get("HAIKU_WIRE_FORMAT", "lines")
+WIRE_FORMATS = ("lines", "json")
+
+# Static instructions, sent as a cacheable system prefix ahead of the varying texts
+TRANSLATION_INSTRUCTIONS = """You are translating architectural/construction documents from French to English.
+
+Translate the French texts you are given to English, keeping each text's key.
 
 **IMPORTANT RULES:**
 - Complete translations only - NO French words in output
@@ -27,84 +59,483 @@ Translate the following French texts to English. Return ONLY a JSON object with
 - Keep abbreviations like "mm", "GA", "TYP."
 - Preserve formatting (parentheses, dashes, etc.)
 - Material codes stay as-is (DOM, INTL, etc.)
-- DO NOT use emojis or special Unicode characters - text only
+- Placeholders like {n1}, {dim1}, {ref1}, {sheet1}, {code1} stand for numbers and codes: copy each one exactly once, unchanged
+- DO NOT use emojis or special Unicode characters - text only"""
+
+# Token counters summed across requests
+USAGE_KEYS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+CACHE_USAGE_KEYS = USAGE_KEYS[2:]
+
+# Pricing used for cost estimates ($ per 1M tokens); prompt cache writes and
+# reads are billed as multiples of the input price
+INPUT_PRICE = 0.80
+OUTPUT_PRICE = 4.00
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+# Long-lived clients, one per API key
+_clients = {}
+_clients_lock = threading.Lock()
+
+# Requests in flight across every thread of the process (stream mode, app
+# sessions); set_request_limiter swaps in a cross-process limit
+_request_limiter = threading.BoundedSemaphore(MAX_CONCURRENCY)
 
-French texts to translate:
-{json.dumps(french_texts, ensure_ascii=False, indent=2)}
+# Glossaries already loaded, by path
+_glossaries = {}
+
+# One "key": "value" pair, tolerant of escapes; used to salvage broken JSON
+JSON_PAIR_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def get_client(api_key: str) -> Anthropic:
+    """
+    Return the process-wide Anthropic client for an API key
+
+    The client is created once and reused by every batch, worker thread and
+    filename translation, so connections stay alive between requests instead
+    of paying a new TLS handshake each time. In Streamlit this means one
+    client per server process, shared by all sessions.
+    """
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = Anthropic(
+                api_key=api_key,
+                timeout=Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+                http_client=DefaultHttpxClient(
+                    # Same limits class as the SDK's own default, whichever HTTP library it ships with
+                    limits=type(DEFAULT_CONNECTION_LIMITS)(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY
+                    )
+                )
+            )
+            _clients[api_key] = client
+        return client
+
+
+def set_request_limiter(limiter) -> None:
+    """
+    Cap API requests in flight across processes
+
+    Args:
+        limiter: Semaphore-like object shared by all workers (e.g. a
+                 multiprocessing.Manager().BoundedSemaphore), or None for the
+                 process-wide MAX_CONCURRENCY limit
+    """
+    global _request_limiter
+    _request_limiter = limiter or threading.BoundedSemaphore(MAX_CONCURRENCY)
+
+
+def load_glossary(path: str = None) -> dict:
+    """Load the project glossary once per process (empty if the file does not exist)"""
+    path = path or GLOSSARY_PATH
+    if path not in _glossaries:
+        glossary = {}
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                glossary = json.load(f)
+        _glossaries[path] = glossary
+    return _glossaries[path]
+
+
+def build_system_prompt(glossary: dict = None) -> list:
+    """
+    Build the static system prompt as a cacheable prefix
+
+    The instructions and glossary are identical for every batch, so they are
+    marked with cache_control and billed at the cache-read rate after the
+    first request. Prefixes shorter than the model's minimum cacheable
+    length are simply not cached; a project glossary usually pushes the
+    prefix past that minimum.
+    """
+    text = TRANSLATION_INSTRUCTIONS
+    if glossary:
+        terms = "\n".join(f"{french} = {english}" for french, english in sorted(glossary.items()))
+        text += f"\n\n**PROJECT GLOSSARY (use these translations):**\n{terms}"
 
-Return format:
-{{
-  "index1": "English translation 1",
-  "index2": "English translation 2",
-  ...
-}}
+    return [{
+        "type": "text",
+        "text": text,
+        "cache_control": {"type": "ephemeral"}
+    }]
 
-Return ONLY the JSON, no markdown code blocks."""
 
-    # Call Claude Haiku 4.5
-    message = client.messages.create(
-        model="claude-haiku-4-5-20251001",
-        max_tokens=8000,
-        messages=[{
+def usage_tokens(usage) -> dict:
+    """Token counts from an API usage object, with cache reads/writes kept separate"""
+    return {
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0
+    }
+
+
+def build_user_prompt(french_texts: dict, wire_format: str = None) -> str:
+    """
+    Encode the texts to translate in the compact wire format
+
+    "lines" sends one key|text per line and asks for the same back, which
+    avoids JSON quoting on both sides. "json" sends and asks for minified
+    JSON. Both drop the indentation the old pretty-printed prompt paid for.
+    """
+    wire_format = wire_format or WIRE_FORMAT
+    if wire_format == "lines":
+        lines = "\n".join(f"{key}|{' '.join(text.split())}" for key, text in french_texts.items())
+        return f"""French texts to translate, one per line as key|text:
+{lines}
+
+Reply with exactly one line per text in the form key|English translation, same keys, nothing else."""
+    if wire_format == "json":
+        return f"""French texts to translate (JSON):
+{json.dumps(french_texts, ensure_ascii=False, separators=(",", ":"))}
+
+Reply with one minified JSON object mapping the same keys to the English translations, no markdown."""
+    raise ValueError(f"Unknown wire format: {wire_format} (expected one of {WIRE_FORMATS})")
+
+
+def parse_lines(response_text: str, truncated: bool = False) -> dict:
+    """
+    Parse a key|text line response strictly
+
+    Only lines of the exact form key|text count; anything else (code fences,
+    commentary, blank lines) is ignored. If the reply hit max_tokens the last
+    line may be cut mid-sentence, so it is dropped and re-requested instead.
+
+    Args:
+        response_text: Raw model output
+        truncated: True if the response stopped at max_tokens
+
+    Returns:
+        Dict of {index: english_translation} (possibly empty)
+    """
+    lines = response_text.strip().split("\n")
+    if truncated and lines:
+        lines = lines[:-1]
+
+    translations = {}
+    for line in lines:
+        key, sep, english = line.partition("|")
+        key = key.strip()
+        english = english.strip()
+        if sep and key and " " not in key and english:
+            translations[key] = english
+    return translations
+
+
+def parse_response(response_text: str, wire_format: str = None, truncated: bool = False) -> dict:
+    """Parse a response in the given wire format (see build_user_prompt)"""
+    if (wire_format or WIRE_FORMAT) == "lines":
+        return parse_lines(response_text, truncated)
+    return parse_translations(response_text)
+
+
+def parse_translations(response_text: str) -> dict:
+    """
+    Parse a translation response, keeping every pair that is readable
+
+    Well-formed JSON is parsed as-is. A truncated or malformed response
+    (e.g. cut off at max_tokens) falls back to scanning for complete
+    "key": "value" pairs, so only the broken tail is lost.
+
+    Args:
+        response_text: Raw model output
+
+    Returns:
+        Dict of {index: english_translation} (possibly empty)
+    """
+    text = response_text.strip()
+
+    # Remove markdown code blocks if present
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    text = text.strip()
+    if text.startswith("json"):
+        text = text[4:].strip()
+
+    try:
+        parsed = json.loads(text)
+        if isinstance(parsed, dict):
+            return {str(key): value for key, value in parsed.items() if isinstance(value, str)}
+    except json.JSONDecodeError:
+        pass
+
+    salvaged = {}
+    for match in JSON_PAIR_PATTERN.finditer(text):
+        try:
+            key = json.loads(f'"{match.group(1)}"')
+            value = json.loads(f'"{match.group(2)}"')
+        except json.JSONDecodeError:
+            continue
+        salvaged[key] = value
+    return salvaged
+
+def build_request(french_texts: dict, max_tokens: int = MAX_OUTPUT_TOKENS, wire_format: str = None) -> dict:
+    """
+    Build the Messages API parameters for one batch of texts
+
+    Shared by the interactive path (messages.create) and the offline
+    Message Batches path, so both send exactly the same prompt.
+    """
+    return {
+        "model": MODEL,
+        "max_tokens": max_tokens,
+        # Static rules live in the cached system prompt; only the texts vary
+        "system": build_system_prompt(load_glossary()),
+        "messages": [{
             "role": "user",
-            "content": prompt
+            "content": build_user_prompt(french_texts, wire_format)
         }]
+    }
+
+
+def read_response(message, french_texts: dict, wire_format: str = None) -> dict:
+    """
+    Turn an API message into a translation result for the requested texts
+
+    Returns:
+        Dict with "translations" ({index: english_translation} for the requested
+        keys that parsed), "missing" and "extra" key lists, and token usage
+        (input_tokens excludes cache reads/writes, which are reported separately)
+    """
+    # Parse response, salvaging whatever survived a truncated/malformed reply
+    parsed = parse_response(
+        message.content[0].text if message.content else "",
+        wire_format,
+        truncated=message.stop_reason == "max_tokens"
     )
+    translations = {key: parsed[key] for key in french_texts if key in parsed}
 
-    # Parse response
-    response_text = message.content[0].text.strip()
+    return {
+        "translations": translations,
+        "missing": [key for key in french_texts if key not in parsed],
+        "extra": [key for key in parsed if key not in french_texts],
+        **usage_tokens(message.usage)
+    }
 
-    # Remove markdown code blocks if present
-    if response_text.startswith("```"):
-        lines = response_text.split("\n")
-        response_text = "\n".join(lines[1:-1])  # Remove first and last lines
-    if response_text.startswith("json"):
-        response_text = response_text[4:].strip()
 
-    # Parse JSON
-    try:
-        translations = json.loads(response_text)
-        # Return translations with token usage
-        return {
-            "translations": translations,
-            "input_tokens": message.usage.input_tokens,
-            "output_tokens": message.usage.output_tokens
-        }
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse API response as JSON: {e}\n\nResponse:\n{response_text}")
+def translate_with_haiku(french_texts: dict, api_key: str, max_tokens: int = MAX_OUTPUT_TOKENS,
+                         wire_format: str = None) -> dict:
+    """
+    Translate French texts to English using Claude Haiku 4.5
+
+    Args:
+        french_texts: Dict of {index: french_text}
+        api_key: Anthropic API key
+        max_tokens: Response size limit
+        wire_format: "lines" or "json" (defaults to WIRE_FORMAT)
+
+    Returns:
+        Translation result dict (see read_response)
+    """
+    client = get_client(api_key)
+    with _request_limiter:
+        message = client.messages.create(**build_request(french_texts, max_tokens, wire_format))
+    return read_response(message, french_texts, wire_format)
+
+
+def estimate_cost(input_tokens: int, output_tokens: int, cache_creation_input_tokens: int = 0,
+                  cache_read_input_tokens: int = 0) -> dict:
+    """
+    Estimated cost in USD of a run's token usage
+
+    Returns:
+        Dict with "input", "cache_write", "cache_read", "output" and "total"
+    """
+    cost = {
+        "input": input_tokens / 1_000_000 * INPUT_PRICE,
+        "cache_write": cache_creation_input_tokens / 1_000_000 * INPUT_PRICE * CACHE_WRITE_MULTIPLIER,
+        "cache_read": cache_read_input_tokens / 1_000_000 * INPUT_PRICE * CACHE_READ_MULTIPLIER,
+        "output": output_tokens / 1_000_000 * OUTPUT_PRICE
+    }
+    cost["total"] = sum(cost.values())
+    return cost
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text locally (no API call)"""
+    return int(len(text.encode("utf-8")) / BYTES_PER_TOKEN) + 1
+
+
+def estimate_request_tokens(text: str) -> int:
+    """Estimated input + output tokens one French text adds to a translation request"""
+    tokens = estimate_tokens(text)
+    return tokens + int(tokens * OUTPUT_RATIO) + 2 * ITEM_OVERHEAD_TOKENS
+
+
+def pack_batches(french_texts: dict, output_budget: int = None, input_budget: int = None,
+                 max_items: int = None) -> list:
+    """
+    Group texts into batches that fill a token budget
+
+    Items are taken in order and a new batch is started whenever the next item
+    would push the estimated input or output tokens over budget, so batches of
+    short labels grow and batches of long notes shrink. An item larger than
+    the budget on its own still gets a batch of one.
+
+    Args:
+        french_texts: Dict of {index: french_text}
+        output_budget: Estimated output tokens per batch (defaults to OUTPUT_TOKEN_BUDGET)
+        input_budget: Estimated input tokens per batch (defaults to INPUT_TOKEN_BUDGET)
+        max_items: Optional hard cap on texts per batch
+
+    Returns:
+        List of {index: french_text} dicts
+    """
+    output_budget = output_budget or OUTPUT_TOKEN_BUDGET
+    input_budget = input_budget or INPUT_TOKEN_BUDGET
+
+    batches = []
+    current = {}
+    current_input = 0
+    current_output = 0
+
+    for key, text in french_texts.items():
+        item_input = estimate_tokens(key) + estimate_tokens(text) + ITEM_OVERHEAD_TOKENS
+        item_output = estimate_tokens(key) + int(estimate_tokens(text) * OUTPUT_RATIO) + ITEM_OVERHEAD_TOKENS
+
+        full = (
+            current_input + item_input > input_budget
+            or current_output + item_output > output_budget
+            or (max_items and len(current) >= max_items)
+        )
+        if current and full:
+            batches.append(current)
+            current = {}
+            current_input = 0
+            current_output = 0
+
+        current[key] = text
+        current_input += item_input
+        current_output += item_output
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def max_resilient_calls(count: int) -> int:
+    """API calls translate_resilient may spend on a batch of count texts (about 2·log2(count))"""
+    return 2 + 2 * math.ceil(math.log2(max(count, 1)))
+
+
+def translate_resilient(french_texts: dict, api_key: str, on_batch=None) -> dict:
+    """
+    Translate one batch, re-requesting only the keys the response lost
+
+    Keys missing from the first response are re-sent once as a smaller
+    request. If that still comes back incomplete, the remainder is bisected
+    until single texts that keep failing are given up on. A retry that
+    salvages nothing (refusal, ignored format, empty reply) is not bisected
+    further, and the calls per batch are capped at about 2·log2(N), so a
+    failure that repeats on every call costs a small retry, not N calls.
+
+    Args:
+        french_texts: Dict of {index: french_text}
+        api_key: Anthropic API key
+        on_batch: Optional callback(batch, result) run for every partial success
+
+    Returns:
+        Dict with "translations", "unresolved" keys and summed token usage
+    """
+    translations = {}
+    unresolved = []
+    usage = dict.fromkeys(USAGE_KEYS, 0)
+    calls_left = [max_resilient_calls(len(french_texts))]
+
+    def attempt(batch, retried):
+        if calls_left[0] <= 0:
+            unresolved.extend(batch)
+            return
+        calls_left[0] -= 1
+        result = translate_with_haiku(batch, api_key)
+        for key in USAGE_KEYS:
+            usage[key] += result[key]
+        if result["translations"]:
+            translations.update(result["translations"])
+            if on_batch:
+                on_batch(batch, result)
+
+        missing = {key: batch[key] for key in result["missing"]}
+        if not missing:
+            return
+        if not retried:
+            attempt(missing, True)
+        elif not result["translations"]:
+            unresolved.extend(missing)  # Smaller pieces of a request that salvaged nothing fail the same way
+        elif len(missing) > 1:
+            items = list(missing.items())
+            half = len(items) // 2
+            attempt(dict(items[:half]), True)
+            attempt(dict(items[half:]), True)
+        else:
+            unresolved.extend(missing)
+
+    attempt(french_texts, False)
 
+    return {
+        "translations": translations,
+        "unresolved": unresolved,
+        **usage
+    }
 
-def translate_batch(french_texts: dict, api_key: str, batch_size: int = 50) -> dict:
+
+def translate_batch(french_texts: dict, api_key: str, batch_size: int = None,
+                    max_concurrency: int = None, on_batch=None, token_budget: int = None) -> dict:
     """
     Translate texts in batches to avoid token limits
 
+    Batches are packed up to an estimated output token budget (see
+    pack_batches) and dispatched concurrently on a thread pool; results are
+    merged back in batch order so the output is the same as a serial run.
+    Incomplete responses are repaired by translate_resilient, so one bad
+    reply costs a small retry rather than the whole document.
+
     Args:
         french_texts: Dict of {index: french_text}
         api_key: Anthropic API key
-        batch_size: Number of texts per API call
+        batch_size: Optional hard cap on texts per API call
+        max_concurrency: Maximum batches in flight (defaults to MAX_CONCURRENCY, 1 = serial)
+        on_batch: Optional callback(batch, result) run as soon as each (partial) batch succeeds
+        token_budget: Estimated output tokens per API call (defaults to OUTPUT_TOKEN_BUDGET)
 
     Returns:
-        Dict with "translations" and token usage stats
+        Dict with "translations", "unresolved" keys and token usage stats
+        (including cache_creation_input_tokens / cache_read_input_tokens)
     """
-    all_translations = {}
-    total_input_tokens = 0
-    total_output_tokens = 0
+    if max_concurrency is None:
+        max_concurrency = MAX_CONCURRENCY
 
-    # Convert to list of items for batching
-    items = list(french_texts.items())
+    batches = pack_batches(french_texts, output_budget=token_budget, max_items=batch_size)
 
-    # Process in batches
-    for i in range(0, len(items), batch_size):
-        batch = dict(items[i:i + batch_size])
-        result = translate_with_haiku(batch, api_key)
+    def run_batch(batch):
+        return translate_resilient(batch, api_key, on_batch)
+
+    if max_concurrency <= 1 or len(batches) <= 1:
+        results = [run_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(batches))) as executor:
+            # map() yields in submission order and re-raises the first failure
+            results = list(executor.map(run_batch, batches))
+
+    all_translations = {}
+    unresolved = []
+    usage = dict.fromkeys(USAGE_KEYS, 0)
+
+    for result in results:
         all_translations.update(result["translations"])
-        total_input_tokens += result["input_tokens"]
-        total_output_tokens += result["output_tokens"]
+        unresolved.extend(result["unresolved"])
+        for key in USAGE_KEYS:
+            usage[key] += result[key]
 
     return {
         "translations": all_translations,
-        "input_tokens": total_input_tokens,
-        "output_tokens": total_output_tokens
+        "unresolved": unresolved,
+        **usage
     }
 
 
@@ -7,6 +7,7 @@ from pathlib import Path
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from anthropic_translator import CACHE_USAGE_KEYS, estimate_cost
 from translate_haiku_100 import process_pdf
 from auth import require_auth, display_user_info, get_user_id
 from supabase_client import get_supabase_client
@@ -115,6 +116,7 @@ with tab1:
                 completed = 0
                 total_input_tokens = 0
                 total_output_tokens = 0
+                total_cache_tokens = dict.fromkeys(CACHE_USAGE_KEYS, 0)
 
                 for idx, uploaded_file in enumerate(uploaded_files):
                     elapsed = time.time() - start_time
@@ -132,13 +134,14 @@ with tab1:
                     output_path = OUTPUT_DIR / safe_output_name
 
                     try:
-                        # Translate entire PDF with 100% Haiku
+                        # Translate entire PDF (cached and local tiers first, then Haiku)
                         status_text.text(f"Translating {uploaded_file.name}...")
 
-                        success, input_tokens, output_tokens = process_pdf(
+                        success, input_tokens, output_tokens, cache_tokens = process_pdf(
                             str(input_path),
                             str(output_path),
-                            st.session_state["anthropic_api_key"]
+                            st.session_state["anthropic_api_key"],
+                            source_name=uploaded_file.name
                         )
 
                         if success:
@@ -167,6 +170,8 @@ with tab1:
                             completed += 1
                             total_input_tokens += input_tokens
                             total_output_tokens += output_tokens
+                            for key, value in cache_tokens.items():
+                                total_cache_tokens[key] += value
 
                             # Log to database if Supabase is configured
                             user_id = get_user_id()
@@ -179,6 +184,7 @@ with tab1:
                                         translated_filename=final_output_name,
                                         input_tokens=input_tokens,
                                         output_tokens=output_tokens,
+                                        **cache_tokens,
                                         file_size_bytes=file_size,
                                         status="completed"
                                     )
@@ -187,8 +193,10 @@ with tab1:
                                     print(f"Failed to log translation to database: {e}")
 
                             # Show tokens for this file
-                            file_tokens = input_tokens + output_tokens
-                            st.success(f"✅ {uploaded_file.name}: {file_tokens:,} tokens ({input_tokens:,} in + {output_tokens:,} out)")
+                            cached = sum(cache_tokens.values())
+                            file_tokens = input_tokens + output_tokens + cached
+                            st.success(f"✅ {uploaded_file.name}: {file_tokens:,} tokens ({input_tokens:,} in + "
+                                       f"{cached:,} cached + {output_tokens:,} out)")
                         else:
                             st.warning(f"⚠️ {uploaded_file.name} needs manual translation - check console")
 
@@ -210,11 +218,9 @@ with tab1:
                 else:
                     time_str = f"{seconds:.1f}s"
 
-                # Calculate cost (Haiku 4.5 pricing: $0.80/1M input, $4.00/1M output)
-                total_tokens = total_input_tokens + total_output_tokens
-                cost_input = (total_input_tokens / 1_000_000) * 0.80
-                cost_output = (total_output_tokens / 1_000_000) * 4.00
-                total_cost = cost_input + cost_output
+                # Calculate cost (Haiku 4.5 pricing, prompt cache writes/reads at their own rates)
+                total_tokens = total_input_tokens + total_output_tokens + sum(total_cache_tokens.values())
+                total_cost = estimate_cost(total_input_tokens, total_output_tokens, **total_cache_tokens)["total"]
 
                 # Show final summary
                 status_text.text("")
@@ -224,12 +230,14 @@ with tab1:
                 st.success(f"✅ Batch translation complete! Processed {completed}/{total_files} files in {time_str}")
 
                 # Show token usage and cost
-                col1, col2, col3 = st.columns(3)
+                col1, col2, col3, col4 = st.columns(4)
                 with col1:
                     st.metric("Total Tokens", f"{total_tokens:,}")
                 with col2:
                     st.metric("Input", f"{total_input_tokens:,}")
                 with col3:
+                    st.metric("Cached", f"{sum(total_cache_tokens.values()):,}")
+                with col4:
                     st.metric("Output", f"{total_output_tokens:,}")
 
                 st.info(f"💰 Estimated cost: ${total_cost:.4f} USD")
@@ -307,6 +315,8 @@ with tab3:
                         with col2:
                             st.markdown(f"**Tokens:** {trans.get('total_tokens', 0):,}")
                             st.markdown(f"**Input:** {trans.get('input_tokens', 0):,}")
+                            st.markdown(f"**Cached:** {trans.get('cache_creation_input_tokens', 0):,} written + "
+                                        f"{trans.get('cache_read_input_tokens', 0):,} read")
                             st.markdown(f"**Output:** {trans.get('output_tokens', 0):,}")
                             st.markdown(f"**Cost:** ${trans.get('cost_total_usd', 0):.4f}")
             else:
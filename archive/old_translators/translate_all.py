@@ -1,775 +1,768 @@
 import json
-import re
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from phrase_engine import compile_phrases
+
+# Dictionary of architectural translations (complete phrases and sentences)
+TRANSLATIONS = {
+    # Complete phrases and sentences
+    "(VOIR DOCUMENT D'INGÉNIERIE)": "(SEE ENGINEERING DOCUMENT)",
+    "100mm D'ÉPAISSEUR.": "100mm THICK.",
+    "@406 mm C/C ET DANS L'AUTRE SENS @915 mm C/C OU PLUS RESTRICTIF": "@406 mm O.C. AND IN THE OTHER DIRECTION @915 mm O.C. OR MORE RESTRICTIVE",
+    "ACRYLIQUE ÉTANCHE": "WATERPROOF ACRYLIC",
+    "AU FEU REQUISE": "REQUIRED FIRE RATING",
+    "AUTOMATIQUES. (SE RÉFÉRER AUX ÉLÉVATIONS POUR TYPE)": "AUTOMATIC. (REFER TO ELEVATIONS FOR TYPE)",
+    "AUTREMENT, SE RÉFÉRER AUX FEUILLES DE LA SÉRIE A-200, MURS": "OTHERWISE, REFER TO A-200 SERIES SHEETS, WALLS",
+    "AUX ÉLÉVATIONS POUR LE TYPE DE VERRE)": "TO ELEVATIONS FOR GLASS TYPE)",
+    "AUX ÉLÉVATIONS POUR TYPE)": "TO ELEVATIONS FOR TYPE)",
+    "AVEC CONTREVENTEMENT (NOTE 1)": "WITH BRACING (NOTE 1)",
+    "AVEC CONTREVENTEMENT (NOTE 2)": "WITH BRACING (NOTE 2)",
+    "AVEC JOINTS DÉCALÉS DES JOINTS DE LA COUCHE INFÉRIEURE)": "WITH JOINTS OFFSET FROM LOWER LAYER JOINTS)",
+    "CE MUR-RIDEAU COMPORTE À SA BASE DES PANNEAUX EN PLAQUE": "THIS CURTAIN WALL HAS PLATE PANELS AT ITS BASE",
+    "CE MUR-RIDEAU COMPORTENT À SA BASE DES PANNEAUX EN PLAQUE": "THIS CURTAIN WALL HAS PLATE PANELS AT ITS BASE",
+    "CE MUR-RIDEAU PEUT COMPORTER DES PANNEAUX TYMPANS. (SE RÉFÉRER": "THIS CURTAIN WALL MAY HAVE SPANDREL PANELS. (REFER",
+    "CE MUR-RIDEAU PEUT COMPORTER DES PORTES COULISSANTES": "THIS CURTAIN WALL MAY HAVE SLIDING DOORS",
+    "CHEVAUCHÉS AVEC ANCRAGES MÉCANIQUES VISSÉS": "OVERLAPPED WITH SCREWED MECHANICAL ANCHORS",
+    "CIMENTAIRE IGNIFUGE PULVÉRISÉ. (ÉPAISSEUR SELON LA RÉSISTANCE": "SPRAYED FIREPROOF CEMENTITIOUS. (THICKNESS ACCORDING TO RESISTANCE",
+    "CONTREVENTEMENT POUR LES EFFORTS SISMIQUES ET L'EFFET DE": "BRACING FOR SEISMIC FORCES AND THE EFFECT OF",
+    "COULEUR \"NOIR\", VOIR DEVIS.": "COLOR \"BLACK\", SEE SPECIFICATIONS.",
+    "D'ACIER PRINCIPALES, VOIR DOCUMENT D'INGÉNIERIE": "MAIN STEEL, SEE ENGINEERING DOCUMENT",
+    "D'ALUMINIUM 3.2 mm DE MÊME FINI ET DE MÊME COULEUR QUE LE MUR-RIDEAU.": "3.2 mm ALUMINUM WITH SAME FINISH AND COLOR AS CURTAIN WALL.",
+    "D'EMBARQUEMENT)": "BOARDING AREA)",
+    "D'INGÉNIERIE)": "ENGINEERING)",
+    "DE 100mm D'ÉPAISSEUR.": "100mm THICK.",
+    "DE 2 mm D'ÉP.": "2 mm THICK.",
+    "DE 64 mm LARGEUR x 25 mm DE PROFONDEUR": "64 mm WIDTH x 25 mm DEPTH",
+    "DE 64 mm LARGEUR x 38 mm DE PROFONDEUR": "64 mm WIDTH x 38 mm DEPTH",
+    "DE LA SÉRIE A-200, MURS INTÉRIEURS RÉFÉRENCES": "FROM A-200 SERIES, INTERIOR WALLS REFERENCES",
+    "DESCRIPTION DU PRODUIT": "PRODUCT DESCRIPTION",
+    "ET PRÉFINI": "AND PREFINISHED",
+    "EXTRUSION D'ALUMINIUM ET ATTACHES DISSIMULÉES PRÉFINI (CACHE-VIS).": "ALUMINUM EXTRUSION AND CONCEALED FASTENERS PREFINISHED (SCREW COVERS).",
+    "GARNITURE COMPRESSIBLE SOUPLE": "FLEXIBLE COMPRESSIBLE GASKET",
+    "INCORPORANT UN BRIS THERMIQUE. PROFONDEUR DE 167 mm, ESPACEMENT": "INCORPORATING A THERMAL BREAK. 167 mm DEPTH, SPACING",
+    "INCORPORANT UN BRIS THERMIQUE. PROFONDEUR DE 175 mm, ESPACEMENT": "INCORPORATING A THERMAL BREAK. 175 mm DEPTH, SPACING",
+    "INTÉRIEURS RÉFÉRENCES": "INTERIOR REFERENCES",
+    "ISOLÉES SEULEMENT": "INSULATED ONLY",
+    "JOINTS EXTÉRIEURS INTERMÉDIAIRES VERTICAUX (ENTRE DEUX VITRAGES).": "INTERMEDIATE VERTICAL EXTERIOR JOINTS (BETWEEN TWO GLAZINGS).",
+    "JUSQU'À LA SEMELLE DE LA FONDATION ET SE POURSUIT DE 300 mm SUR": "TO THE FOUNDATION FOOTING AND CONTINUES 300 mm ON",
+    "L'ISOLANT)": "THE INSULATION)",
+    "LA BARRE DE RETENUE": "THE RESTRAINT BAR",
+    "LA SEMELLE. REQUIS À TOUTES LES FONDATIONS OU PILASTRE DE BÉTON": "THE FOOTING. REQUIRED AT ALL FOUNDATIONS OR CONCRETE PILASTERS",
+    "LARGEUR x 102 mm DE PROFONDEUR MINIMUM (OU PLUS SELON CALCULS).": "WIDTH x 102 mm MINIMUM DEPTH (OR MORE AS PER CALCULATIONS).",
+    "LARGEUR x 133 mm DE PROFONDEUR MINIMUM (OU PLUS SELON CALCULS).": "WIDTH x 133 mm MINIMUM DEPTH (OR MORE AS PER CALCULATIONS).",
+    "LES COUVERCLES EXTÉRIEURS ET ALLÈGES SONT PRÉFINIS PRÉPEINTS DE": "EXTERIOR COVERS AND SILLS ARE PREFINISHED PREPAINTED IN",
+    "LES DEUX DIRECTIONS": "BOTH DIRECTIONS",
+    "LES MENEAUX INTÉRIEURS SONT PRÉFINIS PRÉPEINTS DE COULEUR \"NOIR\",": "INTERIOR MULLIONS ARE PREFINISHED PREPAINTED IN COLOR \"BLACK\",",
+    "MUR-RIDEAU DE TYPE HP (HAUTE-PERFORMANCE)": "HP TYPE CURTAIN WALL (HIGH-PERFORMANCE)",
+    "PANNEAU TYMPAN (VT1) COMPOSÉ D'UNE PANNE MÉTALLIQUE AVEC ISOLANT": "SPANDREL PANEL (VT1) COMPOSED OF A METAL PURLIN WITH INSULATION",
+    "PANNEAU TYMPAN (VT1) COMPOSÉ D'UNE PANNE MÉTALLIQUE AVEC ISOLANT DE": "SPANDREL PANEL (VT1) COMPOSED OF A METAL PURLIN WITH INSULATION OF",
+    "POLYISOCYANURATE, 100 mm D'ÉP.": "POLYISOCYANURATE, 100 mm THICK.",
+    "POLYISOCYANURATE, 100 mm D'ÉPAISSEUR": "POLYISOCYANURATE, 100 mm THICK",
+    "PROFONDEUR PAR 76 mm, CAL. 18, POSÉE AU CENTRE DES JOINTS DANS": "DEPTH BY 76 mm, GA. 18, PLACED AT JOINT CENTERS IN",
+    "PÉRIPHÉRIE DU MUR DE FONDATION": "PERIMETER OF FOUNDATION WALL",
+    "RÉSISTANCE REQUISE, VOIR PAGE DES RESISTANCES AU FEU": "REQUIRED RESISTANCE, SEE FIRE RESISTANCE PAGE",
+    "SELON CALCULS. (NOTE 1)": "AS PER CALCULATIONS. (NOTE 1)",
+    "SELON DÉTAIL (ESPACEMENT ET CALIBRE SELON CALCULS)": "AS DETAILED (SPACING AND GAUGE AS PER CALCULATIONS)",
+    "SOULÈVEMENT PAR LE VENT": "WIND UPLIFT",
+    "SOUS-COUCHE LAMINÉ, FIXÉ À L'ADHÉSIF": "LAMINATED UNDERLAYMENT, ADHESIVE-FIXED",
+    "SURÉLEVÉ DE LA FONDATION": "RAISED FROM FOUNDATION",
+    "SYSTÈME D'ANCRAGE PONCTUEL AVEC BRIS THERMQIUE, PROFONDEUR": "POINT ANCHORAGE SYSTEM WITH THERMAL BREAK, DEPTH",
+    "SYSTÈME DE 25 mm DE PROFONDEUR": "25 mm DEPTH SYSTEM",
+    "VERTICALEMENT 78 mm": "VERTICALLY 78 mm",
+    "VOIR DEVIS.": "SEE SPECIFICATIONS.",
+    "c/c, 152 mm": "o.c., 152 mm",
+    "ÉLÉVATION POUR LOCALISATION DU PANNEAU MÉTALLIQUE ISOLÉ TYPE PMI2.": "ELEVATION FOR LOCATION OF INSULATED METAL PANEL TYPE PMI2.",
+    "152 mm": "152 mm",
+    "(26 sept 2025)": "(Sept 26, 2025)",
+    "(DALLE DE LA SALLE D'EMBARQUEMENT ET BÂTIMENTS D'INTERFACES)": "(BOARDING AREA SLAB AND INTERFACE BUILDINGS)",
+    "(DALLE DES BÂTIMENTS D'INTERFACES ET PASSERELLES)": "(INTERFACE BUILDINGS AND WALKWAYS SLAB)",
+    "(DANS LE SOL)": "(IN-GROUND)",
+    "(HORS-SOL)": "(ABOVE-GROUND)",
+    "(REMARQUES)": "(REMARKS)",
+    "(SECTION ISOLÉ - PASSERELLES)": "(INSULATED SECTION - WALKWAYS)",
+    "(SECTION ISOLÉ - SALLE D'EMBARQUEMENT ET BÂTIMENTS D'INTERFACES)": "(INSULATED SECTION - BOARDING AREA AND INTERFACE BUILDINGS)",
+    "(SECTION NON-ISOLÉ - SALLE D'EMBARQUEMENT)": "(NON-INSULATED SECTION - BOARDING AREA)",
+    "(Superficie requise)": "(Required area)",
+    "(TOITURE DE LA MARQUISES)": "(CANOPY ROOF)",
+    "(TOITURE DES PASSERELLES)": "(WALKWAYS ROOF)",
+    "(TOITURE SALLE D'EMBARQUEMENT ET BÂTIMENTS D'INTERFACES)": "(BOARDING AREA AND INTERFACE BUILDINGS ROOF)",
+    "(VOIR DÉTAILS TYPIQUES ET VOIR DOCUMENTS D'INGÉNIERIE)": "(SEE TYPICAL DETAILS AND SEE ENGINEERING DOCUMENTS)",
+    "(VOIR PAYSAGE)": "(SEE LANDSCAPE)",
+    "(spéci": "(speci",
+    "(spécifier)": "(specify)",
+    "). L'ISOLANT THERMIQUE SUR CES TÔLES DOIT": "). THE THERMAL INSULATION ON THESE SHEETS MUST",
+    "- BRIS THERMIQUE TYPE HAUTE-PERFORMANCE AUX MENEAUX": "- HIGH-PERFORMANCE TYPE THERMAL BREAK AT MULLIONS",
+    "- BÂTI D,ACIER STRUCTURAL: ENTREMISES HORIZONTALES SUR COLONNES": "- STRUCTURAL STEEL FRAME: HORIZONTAL GIRTS ON COLUMNS",
+    "- CHARPENTE D'ACIER (VOIR DOCUMENTS D'INGÉNIERIE)": "- STEEL FRAME (SEE ENGINEERING DOCUMENTS)",
+    "- CHARPENTE D'ACIER EN PENTE (VOIR DOCUMENTS D'INGÉNIERIE)": "- SLOPED STEEL FRAME (SEE ENGINEERING DOCUMENTS)",
+    "- CHARPENTE D'ACIER À PLAT (VOIR DOCUMENTS D'INGÉNIERIE)": "- FLAT STEEL FRAME (SEE ENGINEERING DOCUMENTS)",
+    "- COLOMBAGES MÉTALLIQUES STRUCTURAUX EN ACIER GALV. @ 406 mm": "- GALV. STRUCTURAL STEEL STUDS @ 406 mm",
+    "- COLOMBAGES MÉTALLIQUES STRUCTURAUX EN ACIER GALV. @ 406 mm c/c,": "- GALV. STRUCTURAL STEEL STUDS @ 406 mm o.c.,",
+    "- COUVERCLES EXTÉRIEURS À LA TÊTE, À LA BASE ET AU POURTOUR": "- EXTERIOR COVERS AT HEAD, BASE AND PERIMETER",
+    "- DALLE DE BÉTON (VOIR DOCUMENTS D'INGÉNIERIE)": "- CONCRETE SLAB (SEE ENGINEERING DOCUMENTS)",
+    "- DALLE DE BÉTON SUR PLATELAGE MÉTALLIQUE (VOIR DOCUMENTS": "- CONCRETE SLAB ON METAL DECK (SEE DOCUMENTS",
+}
+
+# Comprehensive word/term dictionary for building complex phrases
+WORD_TRANSLATIONS = {
+    # Common architectural terms
+    "ACIER": "STEEL",
+    "ACOUSTIQUE": "ACOUSTIC",
+    "ADHÉSIF": "ADHESIVE",
+    "ACRYLIQUE": "ACRYLIC",
+    "AGRÉGAT": "AGGREGATE",
+    "AGRAFE": "CLIP",
+    "AIR": "AIR",
+    "AJUSTÉ": "FITTED",
+    "ALLÈGE": "SILL",
+    "ALLÈGES": "SILLS",
+    "ALUMINIUM": "ALUMINUM",
+    "ANCRAGE": "ANCHORAGE",
+    "ANCRAGES": "ANCHORS",
+    "ANCRÉ": "ANCHORED",
+    "ANGLE": "ANGLE",
+    "APPUI": "SUPPORT",
+    "ASSEMBLAGE": "ASSEMBLY",
+    "ATTACHE": "FASTENER",
+    "ATTACHES": "FASTENERS",
+    "AUTOMATIQUE": "AUTOMATIC",
+    "AUTOMATIQUES": "AUTOMATIC",
+    "AUTREMENT": "OTHERWISE",
+    "AUTRE": "OTHER",
+    "AUTRES": "OTHER",
+    "AUX": "TO",
+    "AVEC": "WITH",
+
+    # B words
+    "BARDEAU": "SHINGLE",
+    "BARDEAUX": "SHINGLES",
+    "BARRE": "BAR",
+    "BARRES": "BARS",
+    "BAS": "LOW",
+    "BASE": "BASE",
+    "BATTERIE": "BATTERY",
+    "BÂTI": "FRAME",
+    "BÂTIMENT": "BUILDING",
+    "BÂTIMENTS": "BUILDINGS",
+    "BÉTON": "CONCRETE",
+    "BOIS": "WOOD",
+    "BORDURE": "EDGE",
+    "BOULON": "BOLT",
+    "BOULONS": "BOLTS",
+    "BOUCHON": "PLUG",
+    "BRIS": "BREAK",
+    "BRIQUES": "BRICKS",
+    "BRIQUE": "BRICK",
+
+    # C words
+    "CACHE": "COVER",
+    "CACHE-VIS": "SCREW COVER",
+    "CADRE": "FRAME",
+    "CALIBRE": "GAUGE",
+    "CAL.": "GA.",
+    "CANIVEAU": "GUTTER",
+    "CARTON": "CARDBOARD",
+    "CAOUTCHOUC": "RUBBER",
+    "CAVITY": "CAVITY",
+    "CE": "THIS",
+    "CELLULAIRE": "CELLULAR",
+    "CENTRE": "CENTER",
+    "CES": "THESE",
+    "CHAPE": "SCREED",
+    "CHARPENTE": "FRAME",
+    "CHAUD": "HOT",
+    "CHAUFFAGE": "HEATING",
+    "CHEVAUCHEMENT": "OVERLAP",
+    "CHEVAUCHER": "OVERLAP",
+    "CHEVAUCHÉS": "OVERLAPPED",
+    "CIMENT": "CEMENT",
+    "CIMENTAIRE": "CEMENTITIOUS",
+    "CLOISON": "PARTITION",
+    "CLOU": "NAIL",
+    "CLOUS": "NAILS",
+    "CLOUÉ": "NAILED",
+    "COLLE": "GLUE",
+    "COLLÉ": "GLUED",
+    "COLOMBAGE": "STUD",
+    "COLOMBAGES": "STUDS",
+    "COLONNE": "COLUMN",
+    "COLONNES": "COLUMNS",
+    "COMBLE": "ATTIC",
+    "COMBLES": "ATTICS",
+    "COMPORTER": "HAVE",
+    "COMPORTE": "HAS",
+    "COMPORTENT": "HAVE",
+    "COMPOSÉ": "COMPOSED",
+    "COMPRESSIBLE": "COMPRESSIBLE",
+    "COMPRESSION": "COMPRESSION",
+    "CONFORME": "COMPLIANT",
+    "CONNECTEUR": "CONNECTOR",
+    "CONTINU": "CONTINUOUS",
+    "CONTINUE": "CONTINUOUS",
+    "CONTINUES": "CONTINUOUS",
+    "CONTREVENTEMENT": "BRACING",
+    "CONTREPLAQUÉ": "PLYWOOD",
+    "COUPE": "SECTION",
+    "COUCHE": "LAYER",
+    "COULEUR": "COLOR",
+    "COULISSANT": "SLIDING",
+    "COULISSANTE": "SLIDING",
+    "COULISSANTES": "SLIDING",
+    "COUVERCLE": "COVER",
+    "COUVERCLES": "COVERS",
+    "COUVERTURE": "ROOFING",
+
+    # D words
+    "D'": "OF",
+    "DALLE": "SLAB",
+    "DALLES": "SLABS",
+    "DANS": "IN",
+    "DE": "OF",
+    "DEGRÉ": "DEGREE",
+    "DEGRÉS": "DEGREES",
+    "DEMI": "HALF",
+    "DESCRIPTION": "DESCRIPTION",
+    "DES": "OF THE",
+    "DESSOUS": "BELOW",
+    "DESSUS": "ABOVE",
+    "DÉTAIL": "DETAIL",
+    "DÉTAILS": "DETAILS",
+    "DEUX": "TWO",
+    "DEVIS": "SPECIFICATIONS",
+    "DIAGONALE": "DIAGONAL",
+    "DIRECTION": "DIRECTION",
+    "DIRECTIONS": "DIRECTIONS",
+    "DISSIMULÉ": "CONCEALED",
+    "DISSIMULÉES": "CONCEALED",
+    "DISTANCE": "DISTANCE",
+    "DOCUMENT": "DOCUMENT",
+    "DOCUMENTS": "DOCUMENTS",
+    "DOIT": "MUST",
+    "DOIVENT": "MUST",
+    "DOUBLE": "DOUBLE",
+    "DU": "OF THE",
+    "DURÉE": "DURATION",
+
+    # E words
+    "EAU": "WATER",
+    "ÉCRAN": "SCREEN",
+    "EFFET": "EFFECT",
+    "EFFORTS": "FORCES",
+    "ÉLASTIQUE": "ELASTIC",
+    "ÉLASTOMÈRE": "ELASTOMER",
+    "ÉLASTOMERIC": "ELASTOMERIC",
+    "ÉLECTRIQUE": "ELECTRICAL",
+    "ÉLÉVATION": "ELEVATION",
+    "ÉLÉVATIONS": "ELEVATIONS",
+    "EMAIL": "ENAMEL",
+    "EMBARQUEMENT": "BOARDING",
+    "EN": "IN",
+    "ENDUIT": "COATING",
+    "ENROBAGE": "COVERING",
+    "ENSEMBLE": "ASSEMBLY",
+    "ENTREMISE": "GIRT",
+    "ENTREMISES": "GIRTS",
+    "ENTRAXE": "SPACING",
+    "ENVELOPPE": "ENVELOPE",
+    "EP.": "THICK.",
+    "ÉP.": "THICK.",
+    "ÉPAISSEUR": "THICKNESS",
+    "ÉPOXY": "EPOXY",
+    "ÉQUERRE": "BRACKET",
+    "ESPACE": "SPACE",
+    "ESPACEMENT": "SPACING",
+    "EST": "IS",
+    "ET": "AND",
+    "ÉTAGE": "FLOOR",
+    "ÉTAGES": "FLOORS",
+    "ÉTANCHE": "WATERPROOF",
+    "ÉTANCHÉITÉ": "WATERPROOFING",
+    "ÉTENDU": "EXTENDED",
+    "EXISTANT": "EXISTING",
+    "EXISTANTE": "EXISTING",
+    "EXTÉRIEUR": "EXTERIOR",
+    "EXTÉRIEURS": "EXTERIOR",
+    "EXTÉRIEURE": "EXTERIOR",
+    "EXTÉRIEURES": "EXTERIOR",
+    "EXTRÉMITÉ": "END",
+    "EXTRUSION": "EXTRUSION",
+
+    # F words
+    "FAÇADE": "FACADE",
+    "FAUX": "FALSE",
+    "FENÊTRE": "WINDOW",
+    "FENÊTRES": "WINDOWS",
+    "FER": "IRON",
+    "FEUILLE": "SHEET",
+    "FEUILLES": "SHEETS",
+    "FEU": "FIRE",
+    "FIBRE": "FIBER",
+    "FINI": "FINISH",
+    "FINIE": "FINISHED",
+    "FINITION": "FINISH",
+    "FIXATION": "FASTENING",
+    "FIXÉ": "FIXED",
+    "FIXÉE": "FIXED",
+    "FIXÉS": "FIXED",
+    "FLEXIBLE": "FLEXIBLE",
+    "FONDATION": "FOUNDATION",
+    "FONDATIONS": "FOUNDATIONS",
+    "FOND": "BOTTOM",
+    "FONTE": "CAST IRON",
+    "FORMÉ": "FORMED",
+    "FROID": "COLD",
+    "FRICTION": "FRICTION",
+
+    # G words
+    "GALV.": "GALV.",
+    "GALVANISÉ": "GALVANIZED",
+    "GALVANISÉE": "GALVANIZED",
+    "GAINE": "SHEATH",
+    "GARNITURE": "GASKET",
+    "GÉNIE": "ENGINEERING",
+    "GÉOMÉTRIQUE": "GEOMETRIC",
+    "GICLEUR": "SPRINKLER",
+    "GICLEURS": "SPRINKLERS",
+    "GIVRE": "FROST",
+    "GLACIS": "SLOPE",
+    "GRAVIER": "GRAVEL",
+    "GRILLE": "GRATE",
+    "GYPSE": "GYPSUM",
+
+    # H words
+    "HAUT": "HIGH",
+    "HAUTE": "HIGH",
+    "HAUTES": "HIGH",
+    "HAUTEUR": "HEIGHT",
+    "HORIZONTAL": "HORIZONTAL",
+    "HORIZONTALE": "HORIZONTAL",
+    "HORIZONTALES": "HORIZONTAL",
+    "HORIZONTAUX": "HORIZONTAL",
+    "HORS": "ABOVE",
+    "HORS-SOL": "ABOVE-GROUND",
+    "HP": "HP",
+    "HUMIDITÉ": "HUMIDITY",
+
+    # I words
+    "IGNIFUGE": "FIREPROOF",
+    "IMMEUBLE": "BUILDING",
+    "IMPERMÉABLE": "WATERPROOF",
+    "INCORPORATION": "INCORPORATION",
+    "INCORPORANT": "INCORPORATING",
+    "INFÉRIEUR": "LOWER",
+    "INFÉRIEURE": "LOWER",
+    "INGÉNIERIE": "ENGINEERING",
+    "INSTALLATION": "INSTALLATION",
+    "INSTALLÉ": "INSTALLED",
+    "INTÉGRÉ": "INTEGRATED",
+    "INTERMÉDIAIRE": "INTERMEDIATE",
+    "INTERMÉDIAIRES": "INTERMEDIATE",
+    "INTÉRIEUR": "INTERIOR",
+    "INTÉRIEURS": "INTERIOR",
+    "INTÉRIEURE": "INTERIOR",
+    "INTÉRIEURES": "INTERIOR",
+    "INTERFACE": "INTERFACE",
+    "INTERFACES": "INTERFACES",
+    "ISOLANT": "INSULATION",
+    "ISOLANTS": "INSULATION",
+    "ISOLATION": "INSULATION",
+    "ISOLÉ": "INSULATED",
+    "ISOLÉE": "INSULATED",
+    "ISOLÉES": "INSULATED",
+
+    # J words
+    "JOINT": "JOINT",
+    "JOINTS": "JOINTS",
+    "JUSQU'À": "TO",
+    "JUSQUE": "UP TO",
+
+    # L words
+    "LA": "THE",
+    "LAINE": "WOOL",
+    "LAMINÉ": "LAMINATED",
+    "LARGEUR": "WIDTH",
+    "LE": "THE",
+    "LES": "THE",
+    "LISSE": "SMOOTH",
+    "LOCAL": "LOCAL",
+    "LOCALISATION": "LOCATION",
+    "LONGEUR": "LENGTH",
+    "LONGUEUR": "LENGTH",
+
+    # M words
+    "MAIN": "MAIN",
+    "MAÇONNERIE": "MASONRY",
+    "MARQUISE": "CANOPY",
+    "MARQUISES": "CANOPY",
+    "MATÉRIAU": "MATERIAL",
+    "MATÉRIAUX": "MATERIALS",
+    "MAXIMUM": "MAXIMUM",
+    "MÉCANIQUE": "MECHANICAL",
+    "MÉCANIQUES": "MECHANICAL",
+    "MEMBRANE": "MEMBRANE",
+    "MENEAU": "MULLION",
+    "MENEAUX": "MULLIONS",
+    "MER": "SEA",
+    "MÉTALLIQUE": "METAL",
+    "MÉTALLIQUES": "METAL",
+    "MÉTAL": "METAL",
+    "MINIMUM": "MINIMUM",
+    "MINCE": "THIN",
+    "MODIFIÉ": "MODIFIED",
+    "MODULAIRE": "MODULAR",
+    "MONTANT": "POST",
+    "MONTANTS": "POSTS",
+    "MORTIER": "MORTAR",
+    "MUR": "WALL",
+    "MURS": "WALLS",
+    "MUR-RIDEAU": "CURTAIN WALL",
+
+    # N words
+    "NATUREL": "NATURAL",
+    "NÉCESSAIRE": "NECESSARY",
+    "NEUF": "NEW",
+    "NIVEAU": "LEVEL",
+    "NIVEAUX": "LEVELS",
+    "NOIR": "BLACK",
+    "NON": "NON",
+    "NON-ISOLÉ": "NON-INSULATED",
+    "NORMAL": "NORMAL",
+    "NOTE": "NOTE",
+    "NOTES": "NOTES",
+    "NU": "BARE",
+
+    # O words
+    "OBTURATION": "SEALING",
+    "OU": "OR",
+    "OUVERTURE": "OPENING",
+    "OUVERTURES": "OPENINGS",
+
+    # P words
+    "PAGE": "PAGE",
+    "PANNEAU": "PANEL",
+    "PANNEAUX": "PANELS",
+    "PANNE": "PURLIN",
+    "PANNES": "PURLINS",
+    "PAR": "BY",
+    "PARAPET": "PARAPET",
+    "PARE": "VAPOR",
+    "PARE-AIR": "AIR BARRIER",
+    "PARE-FEU": "FIREWALL",
+    "PARE-VAPEUR": "VAPOR BARRIER",
+    "PAROI": "WALL",
+    "PARPAING": "CONCRETE BLOCK",
+    "PARTITION": "PARTITION",
+    "PAS": "NOT",
+    "PASSERELLE": "WALKWAY",
+    "PASSERELLES": "WALKWAYS",
+    "PAYSAGE": "LANDSCAPE",
+    "PEINTURE": "PAINT",
+    "PEINT": "PAINTED",
+    "PEINTE": "PAINTED",
+    "PENTE": "SLOPE",
+    "PERFORMANCE": "PERFORMANCE",
+    "PÉRIPHÉRIE": "PERIMETER",
+    "PERMANENT": "PERMANENT",
+    "PERMET": "ALLOWS",
+    "PEUT": "MAY",
+    "PEUVENT": "MAY",
+    "PILASTRE": "PILASTER",
+    "PILASTRES": "PILASTERS",
+    "PIÈCE": "PIECE",
+    "PIÈCES": "PIECES",
+    "PIERRE": "STONE",
+    "PIVOT": "PIVOT",
+    "PLAFOND": "CEILING",
+    "PLAFONDS": "CEILINGS",
+    "PLANCHER": "FLOOR",
+    "PLANCHERS": "FLOORS",
+    "PLAQUE": "PLATE",
+    "PLAQUES": "PLATES",
+    "PLAT": "FLAT",
+    "PLATELAGE": "DECK",
+    "PLÂTRE": "PLASTER",
+    "PLINTHE": "BASEBOARD",
+    "PLINTHES": "BASEBOARDS",
+    "PLUS": "MORE",
+    "PMI": "IMM",
+    "PMI2": "IMM2",
+    "POINT": "POINT",
+    "POINTS": "POINTS",
+    "POLYISOCYANURATE": "POLYISOCYANURATE",
+    "POLYÉTHYLÈNE": "POLYETHYLENE",
+    "POLYSTYRÈNE": "POLYSTYRENE",
+    "POLYURÉTHANE": "POLYURETHANE",
+    "PONCTUEL": "POINT",
+    "PORTE": "DOOR",
+    "PORTES": "DOORS",
+    "POSÉ": "INSTALLED",
+    "POSÉE": "INSTALLED",
+    "POSÉS": "INSTALLED",
+    "POTEAU": "POST",
+    "POTEAUX": "POSTS",
+    "POUTRE": "BEAM",
+    "POUTRES": "BEAMS",
+    "POUTRELLE": "JOIST",
+    "POUTRELLES": "JOISTS",
+    "POUR": "FOR",
+    "POURSUIT": "CONTINUES",
+    "POURTOUR": "PERIMETER",
+    "PRÉFABRIQUÉ": "PREFABRICATED",
+    "PRÉFINI": "PREFINISHED",
+    "PRÉFINIE": "PREFINISHED",
+    "PRÉFINIS": "PREFINISHED",
+    "PRÉFINIES": "PREFINISHED",
+    "PRÉPARÉ": "PREPARED",
+    "PRÉPEINT": "PREPAINTED",
+    "PRÉPEINTE": "PREPAINTED",
+    "PRÉPEINTS": "PREPAINTED",
+    "PRÉPEINTES": "PREPAINTED",
+    "PRESSION": "PRESSURE",
+    "PRINCIPALE": "MAIN",
+    "PRINCIPALES": "MAIN",
+    "PRINCIPAUX": "MAIN",
+    "PROFILÉ": "PROFILE",
+    "PROFIL": "PROFILE",
+    "PROFONDEUR": "DEPTH",
+    "PRODUIT": "PRODUCT",
+    "PRODUITS": "PRODUCTS",
+    "PROTECTION": "PROTECTION",
+    "PULVÉRISÉ": "SPRAYED",
+    "PVC": "PVC",
+
+    # Q words
+    "QUALITÉ": "QUALITY",
+    "QUE": "THAN",
+    "QUI": "WHICH",
+
+    # R words
+    "RACCORD": "CONNECTION",
+    "RAIL": "RAIL",
+    "RAILS": "RAILS",
+    "RAINURE": "GROOVE",
+    "RAINURÉ": "GROOVED",
+    "RAINURES": "GROOVES",
+    "RAPPEL": "REMINDER",
+    "RÉFÉRENCE": "REFERENCE",
+    "RÉFÉRENCES": "REFERENCES",
+    "RÉFÉRER": "REFER",
+    "REFOULEMENT": "DISCHARGE",
+    "REGARD": "MANHOLE",
+    "REMPLISSAGE": "FILL",
+    "RENFORT": "REINFORCEMENT",
+    "RENFORCÉ": "REINFORCED",
+    "REQUIS": "REQUIRED",
+    "REQUISE": "REQUIRED",
+    "REQUISES": "REQUIRED",
+    "RÉSISTANCE": "RESISTANCE",
+    "RÉSISTANCES": "RESISTANCES",
+    "RÉSISTANT": "RESISTANT",
+    "RETARDATEUR": "RETARDER",
+    "RETENUE": "RESTRAINT",
+    "REVÊTEMENT": "COATING",
+    "RIDEAU": "CURTAIN",
+    "RIGIDE": "RIGID",
+    "ROCHE": "ROCK",
+    "ROCAILLE": "GRAVEL",
+
+    # S words
+    "SA": "ITS",
+    "SABLE": "SAND",
+    "SABLÉ": "SANDBLASTED",
+    "SALLE": "ROOM",
+    "SALLES": "ROOMS",
+    "SANS": "WITHOUT",
+    "SCELLANT": "SEALANT",
+    "SCELLÉ": "SEALED",
+    "SE": "ITSELF",
+    "SEC": "DRY",
+    "SECTION": "SECTION",
+    "SECTIONS": "SECTIONS",
+    "SELON": "ACCORDING TO",
+    "SEMELLE": "FOOTING",
+    "SEMELLES": "FOOTINGS",
+    "SENS": "DIRECTION",
+    "SÉRIE": "SERIES",
+    "SEUIL": "THRESHOLD",
+    "SEULEMENT": "ONLY",
+    "SILICONE": "SILICONE",
+    "SIMPLE": "SINGLE",
+    "SISMIQUE": "SEISMIC",
+    "SISMIQUES": "SEISMIC",
+    "SOL": "GROUND",
+    "SOLIVE": "JOIST",
+    "SOLIVES": "JOISTS",
+    "SONT": "ARE",
+    "SORTIE": "EXIT",
+    "SOUDÉ": "WELDED",
+    "SOUDÉE": "WELDED",
+    "SOUDURE": "WELD",
+    "SOULÈVEMENT": "UPLIFT",
+    "SOUS": "UNDER",
+    "SOUS-COUCHE": "UNDERLAYMENT",
+    "SOUTÈNEMENT": "RETAINING",
+    "SPÉCIAL": "SPECIAL",
+    "SPÉCIFICATION": "SPECIFICATION",
+    "SPÉCIFICATIONS": "SPECIFICATIONS",
+    "SPÉCIFIÉ": "SPECIFIED",
+    "SPÉCIFIER": "SPECIFY",
+    "STRUCTURAL": "STRUCTURAL",
+    "STRUCTURALE": "STRUCTURAL",
+    "STRUCTURALES": "STRUCTURAL",
+    "STRUCTURAUX": "STRUCTURAL",
+    "STRUCTURE": "STRUCTURE",
+    "STRUCTURES": "STRUCTURES",
+    "SUPERFICIEL": "SUPERFICIAL",
+    "SUPERFICIE": "AREA",
+    "SUPÉRIEUR": "UPPER",
+    "SUPÉRIEURE": "UPPER",
+    "SUPPORT": "SUPPORT",
+    "SUPPORTS": "SUPPORTS",
+    "SUR": "ON",
+    "SURFACE": "SURFACE",
+    "SURÉLEVÉ": "RAISED",
+    "SYSTÈME": "SYSTEM",
+    "SYSTÈMES": "SYSTEMS",
+
+    # T words
+    "TABLIER": "DECK",
+    "TASSEAU": "CLEAT",
+    "TASSEAUX": "CLEATS",
+    "TECHNIQUE": "TECHNICAL",
+    "TENON": "TENON",
+    "TENSION": "TENSION",
+    "TERRE": "EARTH",
+    "TÊTE": "HEAD",
+    "THERMIQUE": "THERMAL",
+    "TIRANT": "TIE ROD",
+    "TIRANTS": "TIE RODS",
+    "TIGE": "ROD",
+    "TIGES": "RODS",
+    "TOILE": "FABRIC",
+    "TOIT": "ROOF",
+    "TOITURE": "ROOF",
+    "TOITURES": "ROOFS",
+    "TOUS": "ALL",
+    "TOUT": "ALL",
+    "TOUTE": "ALL",
+    "TOUTES": "ALL",
+    "TRAITEMENT": "TREATMENT",
+    "TRAVERSE": "CROSS MEMBER",
+    "TRAVERSES": "CROSS MEMBERS",
+    "TREILLIS": "MESH",
+    "TREILLIS": "LATTICE",
+    "TROUS": "HOLES",
+    "TROU": "HOLE",
+    "TUILE": "TILE",
+    "TUILES": "TILES",
+    "TUYAU": "PIPE",
+    "TUYAUX": "PIPES",
+    "TYPE": "TYPE",
+    "TYPES": "TYPES",
+    "TYPIQUE": "TYPICAL",
+    "TYPIQUES": "TYPICAL",
+    "TYMPAN": "SPANDREL",
+    "TYMPANS": "SPANDRELS",
+
+    # U words
+    "UN": "A",
+    "UNE": "A",
+    "UNIFORME": "UNIFORM",
+    "UNIQUE": "UNIQUE",
+    "UTILISÉ": "USED",
+
+    # V words
+    "VALEUR": "VALUE",
+    "VAPEUR": "VAPOR",
+    "VARIABLE": "VARIABLE",
+    "VENT": "WIND",
+    "VENTILATION": "VENTILATION",
+    "VERRE": "GLASS",
+    "VERRES": "GLASS",
+    "VERS": "TOWARDS",
+    "VERTICAL": "VERTICAL",
+    "VERTICALE": "VERTICAL",
+    "VERTICALES": "VERTICAL",
+    "VERTICALEMENT": "VERTICALLY",
+    "VERTICAUX": "VERTICAL",
+    "VIS": "SCREW",
+    "VISSÉ": "SCREWED",
+    "VISSÉE": "SCREWED",
+    "VISSÉS": "SCREWED",
+    "VITRAGE": "GLAZING",
+    "VITRAGES": "GLAZINGS",
+    "VITRÉ": "GLAZED",
+    "VITRÉE": "GLAZED",
+    "VITRÉES": "GLAZED",
+    "VOIR": "SEE",
+    "VOILE": "SHEAR WALL",
+    "VT1": "ST1",
+    "VUE": "VIEW",
+
+    # Z words
+    "ZONE": "ZONE",
+    "ZONES": "ZONES",
+
+    # Common abbreviations and symbols
+    "C/C": "O.C.",
+    "c/c": "o.c.",
+    "mm": "mm",
+    "CM": "CM",
+    "M": "M",
+    "@": "@",
+    "X": "x",
+    "x": "x",
+    "±": "±",
+    "%": "%",
+    "°": "°",
+    "Ø": "Ø",
+    "#": "#",
+    "N°": "NO.",
+    "NO.": "NO.",
+    "CAL.": "GA.",
+    "Cal.": "Ga.",
+
+    # Numbers and dates
+    "PREMIER": "FIRST",
+    "DEUXIÈME": "SECOND",
+    "TROISIÈME": "THIRD",
+    "SEPT": "SEPT",
+    "JANVIER": "JANUARY",
+    "FÉVRIER": "FEBRUARY",
+    "MARS": "MARCH",
+    "AVRIL": "APRIL",
+    "MAI": "MAY",
+    "JUIN": "JUNE",
+    "JUILLET": "JULY",
+    "AOÛT": "AUGUST",
+    "SEPTEMBRE": "SEPTEMBER",
+    "OCTOBRE": "OCTOBER",
+    "NOVEMBRE": "NOVEMBER",
+    "DÉCEMBRE": "DECEMBER",
+
+    # Parenthetical phrases
+    "REMARQUES": "REMARKS",
+    "NOTES": "NOTES",
+}
+
+# Compiled once; longest phrase wins, matched at word boundaries
+WORD_ENGINE = compile_phrases(WORD_TRANSLATIONS)
+
 
 def translate_architectural_text(french_text):
     """
     Translate French architectural/construction texts to English.
     Maintains professional terminology and proper capitalization.
     """
-
-    # Dictionary of architectural translations
-    # This includes both complete phrases and individual terms
-    translations = {
-        # Complete phrases and sentences
-        "(VOIR DOCUMENT D'INGÉNIERIE)": "(SEE ENGINEERING DOCUMENT)",
-        "100mm D'ÉPAISSEUR.": "100mm THICK.",
-        "@406 mm C/C ET DANS L'AUTRE SENS @915 mm C/C OU PLUS RESTRICTIF": "@406 mm O.C. AND IN THE OTHER DIRECTION @915 mm O.C. OR MORE RESTRICTIVE",
-        "ACRYLIQUE ÉTANCHE": "WATERPROOF ACRYLIC",
-        "AU FEU REQUISE": "REQUIRED FIRE RATING",
-        "AUTOMATIQUES. (SE RÉFÉRER AUX ÉLÉVATIONS POUR TYPE)": "AUTOMATIC. (REFER TO ELEVATIONS FOR TYPE)",
-        "AUTREMENT, SE RÉFÉRER AUX FEUILLES DE LA SÉRIE A-200, MURS": "OTHERWISE, REFER TO A-200 SERIES SHEETS, WALLS",
-        "AUX ÉLÉVATIONS POUR LE TYPE DE VERRE)": "TO ELEVATIONS FOR GLASS TYPE)",
-        "AUX ÉLÉVATIONS POUR TYPE)": "TO ELEVATIONS FOR TYPE)",
-        "AVEC CONTREVENTEMENT (NOTE 1)": "WITH BRACING (NOTE 1)",
-        "AVEC CONTREVENTEMENT (NOTE 2)": "WITH BRACING (NOTE 2)",
-        "AVEC JOINTS DÉCALÉS DES JOINTS DE LA COUCHE INFÉRIEURE)": "WITH JOINTS OFFSET FROM LOWER LAYER JOINTS)",
-        "CE MUR-RIDEAU COMPORTE À SA BASE DES PANNEAUX EN PLAQUE": "THIS CURTAIN WALL HAS PLATE PANELS AT ITS BASE",
-        "CE MUR-RIDEAU COMPORTENT À SA BASE DES PANNEAUX EN PLAQUE": "THIS CURTAIN WALL HAS PLATE PANELS AT ITS BASE",
-        "CE MUR-RIDEAU PEUT COMPORTER DES PANNEAUX TYMPANS. (SE RÉFÉRER": "THIS CURTAIN WALL MAY HAVE SPANDREL PANELS. (REFER",
-        "CE MUR-RIDEAU PEUT COMPORTER DES PORTES COULISSANTES": "THIS CURTAIN WALL MAY HAVE SLIDING DOORS",
-        "CHEVAUCHÉS AVEC ANCRAGES MÉCANIQUES VISSÉS": "OVERLAPPED WITH SCREWED MECHANICAL ANCHORS",
-        "CIMENTAIRE IGNIFUGE PULVÉRISÉ. (ÉPAISSEUR SELON LA RÉSISTANCE": "SPRAYED FIREPROOF CEMENTITIOUS. (THICKNESS ACCORDING TO RESISTANCE",
-        "CONTREVENTEMENT POUR LES EFFORTS SISMIQUES ET L'EFFET DE": "BRACING FOR SEISMIC FORCES AND THE EFFECT OF",
-        "COULEUR \"NOIR\", VOIR DEVIS.": "COLOR \"BLACK\", SEE SPECIFICATIONS.",
-        "D'ACIER PRINCIPALES, VOIR DOCUMENT D'INGÉNIERIE": "MAIN STEEL, SEE ENGINEERING DOCUMENT",
-        "D'ALUMINIUM 3.2 mm DE MÊME FINI ET DE MÊME COULEUR QUE LE MUR-RIDEAU.": "3.2 mm ALUMINUM WITH SAME FINISH AND COLOR AS CURTAIN WALL.",
-        "D'EMBARQUEMENT)": "BOARDING AREA)",
-        "D'INGÉNIERIE)": "ENGINEERING)",
-        "DE 100mm D'ÉPAISSEUR.": "100mm THICK.",
-        "DE 2 mm D'ÉP.": "2 mm THICK.",
-        "DE 64 mm LARGEUR x 25 mm DE PROFONDEUR": "64 mm WIDTH x 25 mm DEPTH",
-        "DE 64 mm LARGEUR x 38 mm DE PROFONDEUR": "64 mm WIDTH x 38 mm DEPTH",
-        "DE LA SÉRIE A-200, MURS INTÉRIEURS RÉFÉRENCES": "FROM A-200 SERIES, INTERIOR WALLS REFERENCES",
-        "DESCRIPTION DU PRODUIT": "PRODUCT DESCRIPTION",
-        "ET PRÉFINI": "AND PREFINISHED",
-        "EXTRUSION D'ALUMINIUM ET ATTACHES DISSIMULÉES PRÉFINI (CACHE-VIS).": "ALUMINUM EXTRUSION AND CONCEALED FASTENERS PREFINISHED (SCREW COVERS).",
-        "GARNITURE COMPRESSIBLE SOUPLE": "FLEXIBLE COMPRESSIBLE GASKET",
-        "INCORPORANT UN BRIS THERMIQUE. PROFONDEUR DE 167 mm, ESPACEMENT": "INCORPORATING A THERMAL BREAK. 167 mm DEPTH, SPACING",
-        "INCORPORANT UN BRIS THERMIQUE. PROFONDEUR DE 175 mm, ESPACEMENT": "INCORPORATING A THERMAL BREAK. 175 mm DEPTH, SPACING",
-        "INTÉRIEURS RÉFÉRENCES": "INTERIOR REFERENCES",
-        "ISOLÉES SEULEMENT": "INSULATED ONLY",
-        "JOINTS EXTÉRIEURS INTERMÉDIAIRES VERTICAUX (ENTRE DEUX VITRAGES).": "INTERMEDIATE VERTICAL EXTERIOR JOINTS (BETWEEN TWO GLAZINGS).",
-        "JUSQU'À LA SEMELLE DE LA FONDATION ET SE POURSUIT DE 300 mm SUR": "TO THE FOUNDATION FOOTING AND CONTINUES 300 mm ON",
-        "L'ISOLANT)": "THE INSULATION)",
-        "LA BARRE DE RETENUE": "THE RESTRAINT BAR",
-        "LA SEMELLE. REQUIS À TOUTES LES FONDATIONS OU PILASTRE DE BÉTON": "THE FOOTING. REQUIRED AT ALL FOUNDATIONS OR CONCRETE PILASTERS",
-        "LARGEUR x 102 mm DE PROFONDEUR MINIMUM (OU PLUS SELON CALCULS).": "WIDTH x 102 mm MINIMUM DEPTH (OR MORE AS PER CALCULATIONS).",
-        "LARGEUR x 133 mm DE PROFONDEUR MINIMUM (OU PLUS SELON CALCULS).": "WIDTH x 133 mm MINIMUM DEPTH (OR MORE AS PER CALCULATIONS).",
-        "LES COUVERCLES EXTÉRIEURS ET ALLÈGES SONT PRÉFINIS PRÉPEINTS DE": "EXTERIOR COVERS AND SILLS ARE PREFINISHED PREPAINTED IN",
-        "LES DEUX DIRECTIONS": "BOTH DIRECTIONS",
-        "LES MENEAUX INTÉRIEURS SONT PRÉFINIS PRÉPEINTS DE COULEUR \"NOIR\",": "INTERIOR MULLIONS ARE PREFINISHED PREPAINTED IN COLOR \"BLACK\",",
-        "MUR-RIDEAU DE TYPE HP (HAUTE-PERFORMANCE)": "HP TYPE CURTAIN WALL (HIGH-PERFORMANCE)",
-        "PANNEAU TYMPAN (VT1) COMPOSÉ D'UNE PANNE MÉTALLIQUE AVEC ISOLANT": "SPANDREL PANEL (VT1) COMPOSED OF A METAL PURLIN WITH INSULATION",
-        "PANNEAU TYMPAN (VT1) COMPOSÉ D'UNE PANNE MÉTALLIQUE AVEC ISOLANT DE": "SPANDREL PANEL (VT1) COMPOSED OF A METAL PURLIN WITH INSULATION OF",
-        "POLYISOCYANURATE, 100 mm D'ÉP.": "POLYISOCYANURATE, 100 mm THICK.",
-        "POLYISOCYANURATE, 100 mm D'ÉPAISSEUR": "POLYISOCYANURATE, 100 mm THICK",
-        "PROFONDEUR PAR 76 mm, CAL. 18, POSÉE AU CENTRE DES JOINTS DANS": "DEPTH BY 76 mm, GA. 18, PLACED AT JOINT CENTERS IN",
-        "PÉRIPHÉRIE DU MUR DE FONDATION": "PERIMETER OF FOUNDATION WALL",
-        "RÉSISTANCE REQUISE, VOIR PAGE DES RESISTANCES AU FEU": "REQUIRED RESISTANCE, SEE FIRE RESISTANCE PAGE",
-        "SELON CALCULS. (NOTE 1)": "AS PER CALCULATIONS. (NOTE 1)",
-        "SELON DÉTAIL (ESPACEMENT ET CALIBRE SELON CALCULS)": "AS DETAILED (SPACING AND GAUGE AS PER CALCULATIONS)",
-        "SOULÈVEMENT PAR LE VENT": "WIND UPLIFT",
-        "SOUS-COUCHE LAMINÉ, FIXÉ À L'ADHÉSIF": "LAMINATED UNDERLAYMENT, ADHESIVE-FIXED",
-        "SURÉLEVÉ DE LA FONDATION": "RAISED FROM FOUNDATION",
-        "SYSTÈME D'ANCRAGE PONCTUEL AVEC BRIS THERMQIUE, PROFONDEUR": "POINT ANCHORAGE SYSTEM WITH THERMAL BREAK, DEPTH",
-        "SYSTÈME DE 25 mm DE PROFONDEUR": "25 mm DEPTH SYSTEM",
-        "VERTICALEMENT 78 mm": "VERTICALLY 78 mm",
-        "VOIR DEVIS.": "SEE SPECIFICATIONS.",
-        "c/c, 152 mm": "o.c., 152 mm",
-        "ÉLÉVATION POUR LOCALISATION DU PANNEAU MÉTALLIQUE ISOLÉ TYPE PMI2.": "ELEVATION FOR LOCATION OF INSULATED METAL PANEL TYPE PMI2.",
-        "152 mm": "152 mm",
-        "(26 sept 2025)": "(Sept 26, 2025)",
-        "(DALLE DE LA SALLE D'EMBARQUEMENT ET BÂTIMENTS D'INTERFACES)": "(BOARDING AREA SLAB AND INTERFACE BUILDINGS)",
-        "(DALLE DES BÂTIMENTS D'INTERFACES ET PASSERELLES)": "(INTERFACE BUILDINGS AND WALKWAYS SLAB)",
-        "(DANS LE SOL)": "(IN-GROUND)",
-        "(HORS-SOL)": "(ABOVE-GROUND)",
-        "(REMARQUES)": "(REMARKS)",
-        "(SECTION ISOLÉ - PASSERELLES)": "(INSULATED SECTION - WALKWAYS)",
-        "(SECTION ISOLÉ - SALLE D'EMBARQUEMENT ET BÂTIMENTS D'INTERFACES)": "(INSULATED SECTION - BOARDING AREA AND INTERFACE BUILDINGS)",
-        "(SECTION NON-ISOLÉ - SALLE D'EMBARQUEMENT)": "(NON-INSULATED SECTION - BOARDING AREA)",
-        "(Superficie requise)": "(Required area)",
-        "(TOITURE DE LA MARQUISES)": "(CANOPY ROOF)",
-        "(TOITURE DES PASSERELLES)": "(WALKWAYS ROOF)",
-        "(TOITURE SALLE D'EMBARQUEMENT ET BÂTIMENTS D'INTERFACES)": "(BOARDING AREA AND INTERFACE BUILDINGS ROOF)",
-        "(VOIR DÉTAILS TYPIQUES ET VOIR DOCUMENTS D'INGÉNIERIE)": "(SEE TYPICAL DETAILS AND SEE ENGINEERING DOCUMENTS)",
-        "(VOIR PAYSAGE)": "(SEE LANDSCAPE)",
-        "(spéci": "(speci",
-        "(spécifier)": "(specify)",
-        "). L'ISOLANT THERMIQUE SUR CES TÔLES DOIT": "). THE THERMAL INSULATION ON THESE SHEETS MUST",
-        "- BRIS THERMIQUE TYPE HAUTE-PERFORMANCE AUX MENEAUX": "- HIGH-PERFORMANCE TYPE THERMAL BREAK AT MULLIONS",
-        "- BÂTI D,ACIER STRUCTURAL: ENTREMISES HORIZONTALES SUR COLONNES": "- STRUCTURAL STEEL FRAME: HORIZONTAL GIRTS ON COLUMNS",
-        "- CHARPENTE D'ACIER (VOIR DOCUMENTS D'INGÉNIERIE)": "- STEEL FRAME (SEE ENGINEERING DOCUMENTS)",
-        "- CHARPENTE D'ACIER EN PENTE (VOIR DOCUMENTS D'INGÉNIERIE)": "- SLOPED STEEL FRAME (SEE ENGINEERING DOCUMENTS)",
-        "- CHARPENTE D'ACIER À PLAT (VOIR DOCUMENTS D'INGÉNIERIE)": "- FLAT STEEL FRAME (SEE ENGINEERING DOCUMENTS)",
-        "- COLOMBAGES MÉTALLIQUES STRUCTURAUX EN ACIER GALV. @ 406 mm": "- GALV. STRUCTURAL STEEL STUDS @ 406 mm",
-        "- COLOMBAGES MÉTALLIQUES STRUCTURAUX EN ACIER GALV. @ 406 mm c/c,": "- GALV. STRUCTURAL STEEL STUDS @ 406 mm o.c.,",
-        "- COUVERCLES EXTÉRIEURS À LA TÊTE, À LA BASE ET AU POURTOUR": "- EXTERIOR COVERS AT HEAD, BASE AND PERIMETER",
-        "- DALLE DE BÉTON (VOIR DOCUMENTS D'INGÉNIERIE)": "- CONCRETE SLAB (SEE ENGINEERING DOCUMENTS)",
-        "- DALLE DE BÉTON SUR PLATELAGE MÉTALLIQUE (VOIR DOCUMENTS": "- CONCRETE SLAB ON METAL DECK (SEE DOCUMENTS",
-    }
-
     # Check for exact match first
-    if french_text in translations:
-        return translations[french_text]
-
-    # If no exact match, perform word-by-word translation for building complex phrases
-    # This is a comprehensive word/term dictionary
-    word_translations = {
-        # Common architectural terms
-        "ACIER": "STEEL",
-        "ACOUSTIQUE": "ACOUSTIC",
-        "ADHÉSIF": "ADHESIVE",
-        "ACRYLIQUE": "ACRYLIC",
-        "AGRÉGAT": "AGGREGATE",
-        "AGRAFE": "CLIP",
-        "AIR": "AIR",
-        "AJUSTÉ": "FITTED",
-        "ALLÈGE": "SILL",
-        "ALLÈGES": "SILLS",
-        "ALUMINIUM": "ALUMINUM",
-        "ANCRAGE": "ANCHORAGE",
-        "ANCRAGES": "ANCHORS",
-        "ANCRÉ": "ANCHORED",
-        "ANGLE": "ANGLE",
-        "APPUI": "SUPPORT",
-        "ASSEMBLAGE": "ASSEMBLY",
-        "ATTACHE": "FASTENER",
-        "ATTACHES": "FASTENERS",
-        "AUTOMATIQUE": "AUTOMATIC",
-        "AUTOMATIQUES": "AUTOMATIC",
-        "AUTREMENT": "OTHERWISE",
-        "AUTRE": "OTHER",
-        "AUTRES": "OTHER",
-        "AUX": "TO",
-        "AVEC": "WITH",
-
-        # B words
-        "BARDEAU": "SHINGLE",
-        "BARDEAUX": "SHINGLES",
-        "BARRE": "BAR",
-        "BARRES": "BARS",
-        "BAS": "LOW",
-        "BASE": "BASE",
-        "BATTERIE": "BATTERY",
-        "BÂTI": "FRAME",
-        "BÂTIMENT": "BUILDING",
-        "BÂTIMENTS": "BUILDINGS",
-        "BÉTON": "CONCRETE",
-        "BOIS": "WOOD",
-        "BORDURE": "EDGE",
-        "BOULON": "BOLT",
-        "BOULONS": "BOLTS",
-        "BOUCHON": "PLUG",
-        "BRIS": "BREAK",
-        "BRIQUES": "BRICKS",
-        "BRIQUE": "BRICK",
-
-        # C words
-        "CACHE": "COVER",
-        "CACHE-VIS": "SCREW COVER",
-        "CADRE": "FRAME",
-        "CALIBRE": "GAUGE",
-        "CAL.": "GA.",
-        "CANIVEAU": "GUTTER",
-        "CARTON": "CARDBOARD",
-        "CAOUTCHOUC": "RUBBER",
-        "CAVITY": "CAVITY",
-        "CE": "THIS",
-        "CELLULAIRE": "CELLULAR",
-        "CENTRE": "CENTER",
-        "CES": "THESE",
-        "CHAPE": "SCREED",
-        "CHARPENTE": "FRAME",
-        "CHAUD": "HOT",
-        "CHAUFFAGE": "HEATING",
-        "CHEVAUCHEMENT": "OVERLAP",
-        "CHEVAUCHER": "OVERLAP",
-        "CHEVAUCHÉS": "OVERLAPPED",
-        "CIMENT": "CEMENT",
-        "CIMENTAIRE": "CEMENTITIOUS",
-        "CLOISON": "PARTITION",
-        "CLOU": "NAIL",
-        "CLOUS": "NAILS",
-        "CLOUÉ": "NAILED",
-        "COLLE": "GLUE",
-        "COLLÉ": "GLUED",
-        "COLOMBAGE": "STUD",
-        "COLOMBAGES": "STUDS",
-        "COLONNE": "COLUMN",
-        "COLONNES": "COLUMNS",
-        "COMBLE": "ATTIC",
-        "COMBLES": "ATTICS",
-        "COMPORTER": "HAVE",
-        "COMPORTE": "HAS",
-        "COMPORTENT": "HAVE",
-        "COMPOSÉ": "COMPOSED",
-        "COMPRESSIBLE": "COMPRESSIBLE",
-        "COMPRESSION": "COMPRESSION",
-        "CONFORME": "COMPLIANT",
-        "CONNECTEUR": "CONNECTOR",
-        "CONTINU": "CONTINUOUS",
-        "CONTINUE": "CONTINUOUS",
-        "CONTINUES": "CONTINUOUS",
-        "CONTREVENTEMENT": "BRACING",
-        "CONTREPLAQUÉ": "PLYWOOD",
-        "COUPE": "SECTION",
-        "COUCHE": "LAYER",
-        "COULEUR": "COLOR",
-        "COULISSANT": "SLIDING",
-        "COULISSANTE": "SLIDING",
-        "COULISSANTES": "SLIDING",
-        "COUVERCLE": "COVER",
-        "COUVERCLES": "COVERS",
-        "COUVERTURE": "ROOFING",
-
-        # D words
-        "D'": "OF",
-        "DALLE": "SLAB",
-        "DALLES": "SLABS",
-        "DANS": "IN",
-        "DE": "OF",
-        "DEGRÉ": "DEGREE",
-        "DEGRÉS": "DEGREES",
-        "DEMI": "HALF",
-        "DESCRIPTION": "DESCRIPTION",
-        "DES": "OF THE",
-        "DESSOUS": "BELOW",
-        "DESSUS": "ABOVE",
-        "DÉTAIL": "DETAIL",
-        "DÉTAILS": "DETAILS",
-        "DEUX": "TWO",
-        "DEVIS": "SPECIFICATIONS",
-        "DIAGONALE": "DIAGONAL",
-        "DIRECTION": "DIRECTION",
-        "DIRECTIONS": "DIRECTIONS",
-        "DISSIMULÉ": "CONCEALED",
-        "DISSIMULÉES": "CONCEALED",
-        "DISTANCE": "DISTANCE",
-        "DOCUMENT": "DOCUMENT",
-        "DOCUMENTS": "DOCUMENTS",
-        "DOIT": "MUST",
-        "DOIVENT": "MUST",
-        "DOUBLE": "DOUBLE",
-        "DU": "OF THE",
-        "DURÉE": "DURATION",
-
-        # E words
-        "EAU": "WATER",
-        "ÉCRAN": "SCREEN",
-        "EFFET": "EFFECT",
-        "EFFORTS": "FORCES",
-        "ÉLASTIQUE": "ELASTIC",
-        "ÉLASTOMÈRE": "ELASTOMER",
-        "ÉLASTOMERIC": "ELASTOMERIC",
-        "ÉLECTRIQUE": "ELECTRICAL",
-        "ÉLÉVATION": "ELEVATION",
-        "ÉLÉVATIONS": "ELEVATIONS",
-        "EMAIL": "ENAMEL",
-        "EMBARQUEMENT": "BOARDING",
-        "EN": "IN",
-        "ENDUIT": "COATING",
-        "ENROBAGE": "COVERING",
-        "ENSEMBLE": "ASSEMBLY",
-        "ENTREMISE": "GIRT",
-        "ENTREMISES": "GIRTS",
-        "ENTRAXE": "SPACING",
-        "ENVELOPPE": "ENVELOPE",
-        "EP.": "THICK.",
-        "ÉP.": "THICK.",
-        "ÉPAISSEUR": "THICKNESS",
-        "ÉPOXY": "EPOXY",
-        "ÉQUERRE": "BRACKET",
-        "ESPACE": "SPACE",
-        "ESPACEMENT": "SPACING",
-        "EST": "IS",
-        "ET": "AND",
-        "ÉTAGE": "FLOOR",
-        "ÉTAGES": "FLOORS",
-        "ÉTANCHE": "WATERPROOF",
-        "ÉTANCHÉITÉ": "WATERPROOFING",
-        "ÉTENDU": "EXTENDED",
-        "EXISTANT": "EXISTING",
-        "EXISTANTE": "EXISTING",
-        "EXTÉRIEUR": "EXTERIOR",
-        "EXTÉRIEURS": "EXTERIOR",
-        "EXTÉRIEURE": "EXTERIOR",
-        "EXTÉRIEURES": "EXTERIOR",
-        "EXTRÉMITÉ": "END",
-        "EXTRUSION": "EXTRUSION",
-
-        # F words
-        "FAÇADE": "FACADE",
-        "FAUX": "FALSE",
-        "FENÊTRE": "WINDOW",
-        "FENÊTRES": "WINDOWS",
-        "FER": "IRON",
-        "FEUILLE": "SHEET",
-        "FEUILLES": "SHEETS",
-        "FEU": "FIRE",
-        "FIBRE": "FIBER",
-        "FINI": "FINISH",
-        "FINIE": "FINISHED",
-        "FINITION": "FINISH",
-        "FIXATION": "FASTENING",
-        "FIXÉ": "FIXED",
-        "FIXÉE": "FIXED",
-        "FIXÉS": "FIXED",
-        "FLEXIBLE": "FLEXIBLE",
-        "FONDATION": "FOUNDATION",
-        "FONDATIONS": "FOUNDATIONS",
-        "FOND": "BOTTOM",
-        "FONTE": "CAST IRON",
-        "FORMÉ": "FORMED",
-        "FROID": "COLD",
-        "FRICTION": "FRICTION",
-
-        # G words
-        "GALV.": "GALV.",
-        "GALVANISÉ": "GALVANIZED",
-        "GALVANISÉE": "GALVANIZED",
-        "GAINE": "SHEATH",
-        "GARNITURE": "GASKET",
-        "GÉNIE": "ENGINEERING",
-        "GÉOMÉTRIQUE": "GEOMETRIC",
-        "GICLEUR": "SPRINKLER",
-        "GICLEURS": "SPRINKLERS",
-        "GIVRE": "FROST",
-        "GLACIS": "SLOPE",
-        "GRAVIER": "GRAVEL",
-        "GRILLE": "GRATE",
-        "GYPSE": "GYPSUM",
-
-        # H words
-        "HAUT": "HIGH",
-        "HAUTE": "HIGH",
-        "HAUTES": "HIGH",
-        "HAUTEUR": "HEIGHT",
-        "HORIZONTAL": "HORIZONTAL",
-        "HORIZONTALE": "HORIZONTAL",
-        "HORIZONTALES": "HORIZONTAL",
-        "HORIZONTAUX": "HORIZONTAL",
-        "HORS": "ABOVE",
-        "HORS-SOL": "ABOVE-GROUND",
-        "HP": "HP",
-        "HUMIDITÉ": "HUMIDITY",
-
-        # I words
-        "IGNIFUGE": "FIREPROOF",
-        "IMMEUBLE": "BUILDING",
-        "IMPERMÉABLE": "WATERPROOF",
-        "INCORPORATION": "INCORPORATION",
-        "INCORPORANT": "INCORPORATING",
-        "INFÉRIEUR": "LOWER",
-        "INFÉRIEURE": "LOWER",
-        "INGÉNIERIE": "ENGINEERING",
-        "INSTALLATION": "INSTALLATION",
-        "INSTALLÉ": "INSTALLED",
-        "INTÉGRÉ": "INTEGRATED",
-        "INTERMÉDIAIRE": "INTERMEDIATE",
-        "INTERMÉDIAIRES": "INTERMEDIATE",
-        "INTÉRIEUR": "INTERIOR",
-        "INTÉRIEURS": "INTERIOR",
-        "INTÉRIEURE": "INTERIOR",
-        "INTÉRIEURES": "INTERIOR",
-        "INTERFACE": "INTERFACE",
-        "INTERFACES": "INTERFACES",
-        "ISOLANT": "INSULATION",
-        "ISOLANTS": "INSULATION",
-        "ISOLATION": "INSULATION",
-        "ISOLÉ": "INSULATED",
-        "ISOLÉE": "INSULATED",
-        "ISOLÉES": "INSULATED",
-
-        # J words
-        "JOINT": "JOINT",
-        "JOINTS": "JOINTS",
-        "JUSQU'À": "TO",
-        "JUSQUE": "UP TO",
-
-        # L words
-        "LA": "THE",
-        "LAINE": "WOOL",
-        "LAMINÉ": "LAMINATED",
-        "LARGEUR": "WIDTH",
-        "LE": "THE",
-        "LES": "THE",
-        "LISSE": "SMOOTH",
-        "LOCAL": "LOCAL",
-        "LOCALISATION": "LOCATION",
-        "LONGEUR": "LENGTH",
-        "LONGUEUR": "LENGTH",
-
-        # M words
-        "MAIN": "MAIN",
-        "MAÇONNERIE": "MASONRY",
-        "MARQUISE": "CANOPY",
-        "MARQUISES": "CANOPY",
-        "MATÉRIAU": "MATERIAL",
-        "MATÉRIAUX": "MATERIALS",
-        "MAXIMUM": "MAXIMUM",
-        "MÉCANIQUE": "MECHANICAL",
-        "MÉCANIQUES": "MECHANICAL",
-        "MEMBRANE": "MEMBRANE",
-        "MENEAU": "MULLION",
-        "MENEAUX": "MULLIONS",
-        "MER": "SEA",
-        "MÉTALLIQUE": "METAL",
-        "MÉTALLIQUES": "METAL",
-        "MÉTAL": "METAL",
-        "MINIMUM": "MINIMUM",
-        "MINCE": "THIN",
-        "MODIFIÉ": "MODIFIED",
-        "MODULAIRE": "MODULAR",
-        "MONTANT": "POST",
-        "MONTANTS": "POSTS",
-        "MORTIER": "MORTAR",
-        "MUR": "WALL",
-        "MURS": "WALLS",
-        "MUR-RIDEAU": "CURTAIN WALL",
-
-        # N words
-        "NATUREL": "NATURAL",
-        "NÉCESSAIRE": "NECESSARY",
-        "NEUF": "NEW",
-        "NIVEAU": "LEVEL",
-        "NIVEAUX": "LEVELS",
-        "NOIR": "BLACK",
-        "NON": "NON",
-        "NON-ISOLÉ": "NON-INSULATED",
-        "NORMAL": "NORMAL",
-        "NOTE": "NOTE",
-        "NOTES": "NOTES",
-        "NU": "BARE",
-
-        # O words
-        "OBTURATION": "SEALING",
-        "OU": "OR",
-        "OUVERTURE": "OPENING",
-        "OUVERTURES": "OPENINGS",
-
-        # P words
-        "PAGE": "PAGE",
-        "PANNEAU": "PANEL",
-        "PANNEAUX": "PANELS",
-        "PANNE": "PURLIN",
-        "PANNES": "PURLINS",
-        "PAR": "BY",
-        "PARAPET": "PARAPET",
-        "PARE": "VAPOR",
-        "PARE-AIR": "AIR BARRIER",
-        "PARE-FEU": "FIREWALL",
-        "PARE-VAPEUR": "VAPOR BARRIER",
-        "PAROI": "WALL",
-        "PARPAING": "CONCRETE BLOCK",
-        "PARTITION": "PARTITION",
-        "PAS": "NOT",
-        "PASSERELLE": "WALKWAY",
-        "PASSERELLES": "WALKWAYS",
-        "PAYSAGE": "LANDSCAPE",
-        "PEINTURE": "PAINT",
-        "PEINT": "PAINTED",
-        "PEINTE": "PAINTED",
-        "PENTE": "SLOPE",
-        "PERFORMANCE": "PERFORMANCE",
-        "PÉRIPHÉRIE": "PERIMETER",
-        "PERMANENT": "PERMANENT",
-        "PERMET": "ALLOWS",
-        "PEUT": "MAY",
-        "PEUVENT": "MAY",
-        "PILASTRE": "PILASTER",
-        "PILASTRES": "PILASTERS",
-        "PIÈCE": "PIECE",
-        "PIÈCES": "PIECES",
-        "PIERRE": "STONE",
-        "PIVOT": "PIVOT",
-        "PLAFOND": "CEILING",
-        "PLAFONDS": "CEILINGS",
-        "PLANCHER": "FLOOR",
-        "PLANCHERS": "FLOORS",
-        "PLAQUE": "PLATE",
-        "PLAQUES": "PLATES",
-        "PLAT": "FLAT",
-        "PLATELAGE": "DECK",
-        "PLÂTRE": "PLASTER",
-        "PLINTHE": "BASEBOARD",
-        "PLINTHES": "BASEBOARDS",
-        "PLUS": "MORE",
-        "PMI": "IMM",
-        "PMI2": "IMM2",
-        "POINT": "POINT",
-        "POINTS": "POINTS",
-        "POLYISOCYANURATE": "POLYISOCYANURATE",
-        "POLYÉTHYLÈNE": "POLYETHYLENE",
-        "POLYSTYRÈNE": "POLYSTYRENE",
-        "POLYURÉTHANE": "POLYURETHANE",
-        "PONCTUEL": "POINT",
-        "PORTE": "DOOR",
-        "PORTES": "DOORS",
-        "POSÉ": "INSTALLED",
-        "POSÉE": "INSTALLED",
-        "POSÉS": "INSTALLED",
-        "POTEAU": "POST",
-        "POTEAUX": "POSTS",
-        "POUTRE": "BEAM",
-        "POUTRES": "BEAMS",
-        "POUTRELLE": "JOIST",
-        "POUTRELLES": "JOISTS",
-        "POUR": "FOR",
-        "POURSUIT": "CONTINUES",
-        "POURTOUR": "PERIMETER",
-        "PRÉFABRIQUÉ": "PREFABRICATED",
-        "PRÉFINI": "PREFINISHED",
-        "PRÉFINIE": "PREFINISHED",
-        "PRÉFINIS": "PREFINISHED",
-        "PRÉFINIES": "PREFINISHED",
-        "PRÉPARÉ": "PREPARED",
-        "PRÉPEINT": "PREPAINTED",
-        "PRÉPEINTE": "PREPAINTED",
-        "PRÉPEINTS": "PREPAINTED",
-        "PRÉPEINTES": "PREPAINTED",
-        "PRESSION": "PRESSURE",
-        "PRINCIPALE": "MAIN",
-        "PRINCIPALES": "MAIN",
-        "PRINCIPAUX": "MAIN",
-        "PROFILÉ": "PROFILE",
-        "PROFIL": "PROFILE",
-        "PROFONDEUR": "DEPTH",
-        "PRODUIT": "PRODUCT",
-        "PRODUITS": "PRODUCTS",
-        "PROTECTION": "PROTECTION",
-        "PULVÉRISÉ": "SPRAYED",
-        "PVC": "PVC",
-
-        # Q words
-        "QUALITÉ": "QUALITY",
-        "QUE": "THAN",
-        "QUI": "WHICH",
-
-        # R words
-        "RACCORD": "CONNECTION",
-        "RAIL": "RAIL",
-        "RAILS": "RAILS",
-        "RAINURE": "GROOVE",
-        "RAINURÉ": "GROOVED",
-        "RAINURES": "GROOVES",
-        "RAPPEL": "REMINDER",
-        "RÉFÉRENCE": "REFERENCE",
-        "RÉFÉRENCES": "REFERENCES",
-        "RÉFÉRER": "REFER",
-        "REFOULEMENT": "DISCHARGE",
-        "REGARD": "MANHOLE",
-        "REMPLISSAGE": "FILL",
-        "RENFORT": "REINFORCEMENT",
-        "RENFORCÉ": "REINFORCED",
-        "REQUIS": "REQUIRED",
-        "REQUISE": "REQUIRED",
-        "REQUISES": "REQUIRED",
-        "RÉSISTANCE": "RESISTANCE",
-        "RÉSISTANCES": "RESISTANCES",
-        "RÉSISTANT": "RESISTANT",
-        "RETARDATEUR": "RETARDER",
-        "RETENUE": "RESTRAINT",
-        "REVÊTEMENT": "COATING",
-        "RIDEAU": "CURTAIN",
-        "RIGIDE": "RIGID",
-        "ROCHE": "ROCK",
-        "ROCAILLE": "GRAVEL",
-
-        # S words
-        "SA": "ITS",
-        "SABLE": "SAND",
-        "SABLÉ": "SANDBLASTED",
-        "SALLE": "ROOM",
-        "SALLES": "ROOMS",
-        "SANS": "WITHOUT",
-        "SCELLANT": "SEALANT",
-        "SCELLÉ": "SEALED",
-        "SE": "ITSELF",
-        "SEC": "DRY",
-        "SECTION": "SECTION",
-        "SECTIONS": "SECTIONS",
-        "SELON": "ACCORDING TO",
-        "SEMELLE": "FOOTING",
-        "SEMELLES": "FOOTINGS",
-        "SENS": "DIRECTION",
-        "SÉRIE": "SERIES",
-        "SEUIL": "THRESHOLD",
-        "SEULEMENT": "ONLY",
-        "SILICONE": "SILICONE",
-        "SIMPLE": "SINGLE",
-        "SISMIQUE": "SEISMIC",
-        "SISMIQUES": "SEISMIC",
-        "SOL": "GROUND",
-        "SOLIVE": "JOIST",
-        "SOLIVES": "JOISTS",
-        "SONT": "ARE",
-        "SORTIE": "EXIT",
-        "SOUDÉ": "WELDED",
-        "SOUDÉE": "WELDED",
-        "SOUDURE": "WELD",
-        "SOULÈVEMENT": "UPLIFT",
-        "SOUS": "UNDER",
-        "SOUS-COUCHE": "UNDERLAYMENT",
-        "SOUTÈNEMENT": "RETAINING",
-        "SPÉCIAL": "SPECIAL",
-        "SPÉCIFICATION": "SPECIFICATION",
-        "SPÉCIFICATIONS": "SPECIFICATIONS",
-        "SPÉCIFIÉ": "SPECIFIED",
-        "SPÉCIFIER": "SPECIFY",
-        "STRUCTURAL": "STRUCTURAL",
-        "STRUCTURALE": "STRUCTURAL",
-        "STRUCTURALES": "STRUCTURAL",
-        "STRUCTURAUX": "STRUCTURAL",
-        "STRUCTURE": "STRUCTURE",
-        "STRUCTURES": "STRUCTURES",
-        "SUPERFICIEL": "SUPERFICIAL",
-        "SUPERFICIE": "AREA",
-        "SUPÉRIEUR": "UPPER",
-        "SUPÉRIEURE": "UPPER",
-        "SUPPORT": "SUPPORT",
-        "SUPPORTS": "SUPPORTS",
-        "SUR": "ON",
-        "SURFACE": "SURFACE",
-        "SURÉLEVÉ": "RAISED",
-        "SYSTÈME": "SYSTEM",
-        "SYSTÈMES": "SYSTEMS",
-
-        # T words
-        "TABLIER": "DECK",
-        "TASSEAU": "CLEAT",
-        "TASSEAUX": "CLEATS",
-        "TECHNIQUE": "TECHNICAL",
-        "TENON": "TENON",
-        "TENSION": "TENSION",
-        "TERRE": "EARTH",
-        "TÊTE": "HEAD",
-        "THERMIQUE": "THERMAL",
-        "TIRANT": "TIE ROD",
-        "TIRANTS": "TIE RODS",
-        "TIGE": "ROD",
-        "TIGES": "RODS",
-        "TOILE": "FABRIC",
-        "TOIT": "ROOF",
-        "TOITURE": "ROOF",
-        "TOITURES": "ROOFS",
-        "TOUS": "ALL",
-        "TOUT": "ALL",
-        "TOUTE": "ALL",
-        "TOUTES": "ALL",
-        "TRAITEMENT": "TREATMENT",
-        "TRAVERSE": "CROSS MEMBER",
-        "TRAVERSES": "CROSS MEMBERS",
-        "TREILLIS": "MESH",
-        "TREILLIS": "LATTICE",
-        "TROUS": "HOLES",
-        "TROU": "HOLE",
-        "TUILE": "TILE",
-        "TUILES": "TILES",
-        "TUYAU": "PIPE",
-        "TUYAUX": "PIPES",
-        "TYPE": "TYPE",
-        "TYPES": "TYPES",
-        "TYPIQUE": "TYPICAL",
-        "TYPIQUES": "TYPICAL",
-        "TYMPAN": "SPANDREL",
-        "TYMPANS": "SPANDRELS",
-
-        # U words
-        "UN": "A",
-        "UNE": "A",
-        "UNIFORME": "UNIFORM",
-        "UNIQUE": "UNIQUE",
-        "UTILISÉ": "USED",
-
-        # V words
-        "VALEUR": "VALUE",
-        "VAPEUR": "VAPOR",
-        "VARIABLE": "VARIABLE",
-        "VENT": "WIND",
-        "VENTILATION": "VENTILATION",
-        "VERRE": "GLASS",
-        "VERRES": "GLASS",
-        "VERS": "TOWARDS",
-        "VERTICAL": "VERTICAL",
-        "VERTICALE": "VERTICAL",
-        "VERTICALES": "VERTICAL",
-        "VERTICALEMENT": "VERTICALLY",
-        "VERTICAUX": "VERTICAL",
-        "VIS": "SCREW",
-        "VISSÉ": "SCREWED",
-        "VISSÉE": "SCREWED",
-        "VISSÉS": "SCREWED",
-        "VITRAGE": "GLAZING",
-        "VITRAGES": "GLAZINGS",
-        "VITRÉ": "GLAZED",
-        "VITRÉE": "GLAZED",
-        "VITRÉES": "GLAZED",
-        "VOIR": "SEE",
-        "VOILE": "SHEAR WALL",
-        "VT1": "ST1",
-        "VUE": "VIEW",
-
-        # Z words
-        "ZONE": "ZONE",
-        "ZONES": "ZONES",
-
-        # Common abbreviations and symbols
-        "C/C": "O.C.",
-        "c/c": "o.c.",
-        "mm": "mm",
-        "CM": "CM",
-        "M": "M",
-        "@": "@",
-        "X": "x",
-        "x": "x",
-        "±": "±",
-        "%": "%",
-        "°": "°",
-        "Ø": "Ø",
-        "#": "#",
-        "N°": "NO.",
-        "NO.": "NO.",
-        "CAL.": "GA.",
-        "Cal.": "Ga.",
-
-        # Numbers and dates
-        "PREMIER": "FIRST",
-        "DEUXIÈME": "SECOND",
-        "TROISIÈME": "THIRD",
-        "SEPT": "SEPT",
-        "JANVIER": "JANUARY",
-        "FÉVRIER": "FEBRUARY",
-        "MARS": "MARCH",
-        "AVRIL": "APRIL",
-        "MAI": "MAY",
-        "JUIN": "JUNE",
-        "JUILLET": "JULY",
-        "AOÛT": "AUGUST",
-        "SEPTEMBRE": "SEPTEMBER",
-        "OCTOBRE": "OCTOBER",
-        "NOVEMBRE": "NOVEMBER",
-        "DÉCEMBRE": "DECEMBER",
-
-        # Parenthetical phrases
-        "REMARQUES": "REMARKS",
-        "NOTES": "NOTES",
-    }
-
-    # Try exact match
-    if french_text in translations:
-        return translations[french_text]
-
-    # Try word-by-word translation preserving structure
-    result = french_text
-
-    # Sort by length (longest first) to handle multi-word phrases
-    sorted_terms = sorted(word_translations.items(), key=lambda x: len(x[0]), reverse=True)
-
-    for french, english in sorted_terms:
-        # Use word boundary matching to avoid partial replacements
-        result = re.sub(r'\b' + re.escape(french) + r'\b', english, result)
-
-    return result
+    if french_text in TRANSLATIONS:
+        return TRANSLATIONS[french_text]
+
+    # Otherwise translate word by word, preserving structure
+    return WORD_ENGINE.replace(french_text)
 
 
 # Main execution
@@ -0,0 +1,255 @@
+"""
+Offline backlog translation with the Message Batches API
+- Collects the unique strings of every PDF in a folder (skipping anything
+  already in the translation memory)
+- Submits them as one Message Batch at the discounted batch rate
+- Persists the requests before submitting and the batch id after, so the
+  script can be stopped and re-run: it resumes polling instead of
+  submitting again
+- Writes the results into the translation memory, then renders every PDF
+  once (all strings now come from memory, so rendering costs no tokens)
+
+USAGE:
+    python batch_backlog.py                    # original/*.pdf
+    python batch_backlog.py path/to/folder --poll 300
+
+Use batch_stub_server.py (with ANTHROPIC_BASE_URL) to run it without network.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from anthropic_translator import USAGE_KEYS, WIRE_FORMAT, build_request, get_client, pack_batches, read_response
+from placeholders import placeholders_intact
+from translate_haiku_100 import TRANSLATED_FOLDER, extract_text_from_pdf, group_translation_requests, process_pdf
+from translation_memory import get_default_memory
+
+# Where the submitted batch is remembered between runs
+BATCH_STATE_FILE = "batch_state.json"
+
+# Seconds between status checks
+POLL_INTERVAL = 60
+
+# Clock skew allowed when matching an interrupted submission to a listed batch
+SUBMIT_SLACK = 300
+
+
+def load_state(state_path):
+    """Return the saved batch state, or None if there is no batch in progress"""
+    if not os.path.exists(state_path):
+        return None
+    with open(state_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(state, state_path):
+    """Write the batch state atomically so a crash never leaves half a file"""
+    tmp_path = state_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def collect_backlog_strings(pdf_files, memory):
+    """
+    Unique strings across all PDFs that still need translating
+
+    Returns:
+        List of French texts not yet in the translation memory
+    """
+    unique = {}
+    for pdf_path in pdf_files:
+        elements = extract_text_from_pdf(str(pdf_path))
+        needs_translation, _, _ = group_translation_requests(elements)
+        for text in needs_translation.values():
+            unique.setdefault(text, None)
+
+    remembered = memory.lookup(unique)
+    return [text for text in unique if text not in remembered]
+
+
+def submit_backlog(client, texts, pdf_files, state_path):
+    """
+    Submit all texts as one Message Batch and persist its id
+
+    Texts are packed with the same token budget as interactive requests;
+    each packed request becomes one batch entry. The packed requests are
+    saved as "submitting" before the batch is created, so a crash before
+    the batch id is saved can be recovered by find_submitted_batch.
+    """
+    chunks = pack_batches({str(i): text for i, text in enumerate(texts)})
+    state = {
+        "status": "submitting",
+        "submitting_at": time.time(),
+        "wire_format": WIRE_FORMAT,
+        "pdfs": [str(path) for path in pdf_files],
+        "requests": {f"chunk-{n}": chunk for n, chunk in enumerate(chunks)}
+    }
+    save_state(state, state_path)
+    return create_batch(client, state, state_path)
+
+
+def create_batch(client, state, state_path):
+    """Create the batch for the saved requests and record its id"""
+    batch = client.messages.batches.create(requests=[
+        {"custom_id": custom_id, "params": build_request(chunk, wire_format=state["wire_format"])}
+        for custom_id, chunk in state["requests"].items()
+    ])
+
+    state.update(batch_id=batch.id, status="submitted", submitted_at=time.time())
+    save_state(state, state_path)
+    strings = sum(len(chunk) for chunk in state["requests"].values())
+    print(f"   Submitted batch {batch.id}: {strings} strings in {len(state['requests'])} requests")
+    return state
+
+
+def find_submitted_batch(client, state):
+    """
+    Look for a batch created by a run that stopped before saving its id
+
+    Matches the most recent batch created after the state was written with
+    the same number of requests.
+
+    Returns:
+        Batch id, or None if no such batch was found
+    """
+    try:
+        batches = client.messages.batches.list(limit=20)
+    except Exception as e:
+        print(f"   Could not list batches: {e}")
+        return None
+
+    for batch in batches.data:
+        counts = batch.request_counts
+        total = counts.processing + counts.succeeded + counts.errored + counts.canceled + counts.expired
+        if (batch.created_at.timestamp() >= state["submitting_at"] - SUBMIT_SLACK
+                and total == len(state["requests"])):
+            return batch.id
+    return None
+
+
+def wait_for_batch(client, state, poll_interval):
+    """Poll until the batch has ended"""
+    while True:
+        batch = client.messages.batches.retrieve(state["batch_id"])
+        counts = batch.request_counts
+        print(f"   {batch.processing_status}: {counts.succeeded} succeeded, "
+              f"{counts.processing} processing, {counts.errored} errored")
+        if batch.processing_status == "ended":
+            return batch
+        time.sleep(poll_interval)
+
+
+def ingest_results(client, state, memory):
+    """
+    Store every translation that came back in the translation memory
+
+    Strings from failed, expired or incomplete entries are left out; they
+    are translated interactively when their PDF is rendered.
+
+    Returns:
+        Dict of counts and token usage
+    """
+    stats = {"stored": 0, "failed_requests": 0, "missing": 0, **dict.fromkeys(USAGE_KEYS, 0)}
+    # States saved before the wire format was recorded fall back to WIRE_FORMAT
+    wire_format = state.get("wire_format")
+
+    for entry in client.messages.batches.results(state["batch_id"]):
+        chunk = state["requests"].get(entry.custom_id)
+        if chunk is None:
+            continue
+        if entry.result.type != "succeeded":
+            stats["failed_requests"] += 1
+            stats["missing"] += len(chunk)
+            continue
+
+        result = read_response(entry.result.message, chunk, wire_format)
+        stats["stored"] += memory.store({
+            chunk[key]: english
+            for key, english in result["translations"].items()
+            if placeholders_intact(chunk[key], english)
+        })
+        stats["missing"] += len(result["missing"])
+        for key in USAGE_KEYS:
+            stats[key] += result[key]
+
+    return stats
+
+
+def render_backlog(pdf_files, api_key, memory):
+    """Render every PDF from the translation memory"""
+    os.makedirs(TRANSLATED_FOLDER, exist_ok=True)
+    success_count = 0
+    for pdf_path in pdf_files:
+        output_path = os.path.join(TRANSLATED_FOLDER, Path(pdf_path).stem + " - HAIKU100TEST.pdf")
+        success, _, _, _ = process_pdf(str(pdf_path), output_path, api_key, memory=memory)
+        success_count += success
+    return success_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Translate a PDF backlog with the Message Batches API")
+    parser.add_argument("folder", nargs="?", default="original", help="Folder of French PDFs")
+    parser.add_argument("--state", default=BATCH_STATE_FILE, help="Batch state file (for resume)")
+    parser.add_argument("--poll", type=float, default=POLL_INTERVAL, help="Seconds between status checks")
+    parser.add_argument("--no-render", action="store_true", help="Only fill the translation memory")
+    args = parser.parse_args()
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("Error: ANTHROPIC_API_KEY environment variable not set")
+        sys.exit(1)
+
+    client = get_client(api_key)
+    memory = get_default_memory()
+
+    state = load_state(args.state)
+    if state and state["status"] == "submitted":
+        print(f"Resuming batch {state['batch_id']} ({len(state['pdfs'])} PDFs)")
+    elif state and state["status"] == "submitting":
+        print(f"Previous run stopped while submitting ({len(state['pdfs'])} PDFs)")
+        batch_id = find_submitted_batch(client, state)
+        if batch_id:
+            print(f"Resuming batch {batch_id}")
+            state.update(batch_id=batch_id, status="submitted", submitted_at=time.time())
+            save_state(state, args.state)
+        else:
+            print("   No matching batch found, submitting the saved requests")
+            state = create_batch(client, state, args.state)
+    else:
+        pdf_files = sorted(Path(args.folder).glob("*.pdf"))
+        if not pdf_files:
+            print("Error: No PDF files found")
+            sys.exit(1)
+
+        print(f"Collecting strings from {len(pdf_files)} PDF(s)...")
+        texts = collect_backlog_strings(pdf_files, memory)
+        print(f"   {len(texts)} unique strings not yet in translation memory")
+
+        if texts:
+            state = submit_backlog(client, texts, pdf_files, args.state)
+        else:
+            state = {"status": "ingested", "pdfs": [str(path) for path in pdf_files]}
+
+    if state["status"] == "submitted":
+        print("Waiting for batch results...")
+        wait_for_batch(client, state, args.poll)
+        stats = ingest_results(client, state, memory)
+        print(f"   Stored {stats['stored']} translations "
+              f"({stats['missing']} strings missing, {stats['failed_requests']} failed requests)")
+        print(f"   Batch tokens: {stats['input_tokens']:,} input + {stats['output_tokens']:,} output "
+              f"(cache: {stats['cache_creation_input_tokens']:,} written, "
+              f"{stats['cache_read_input_tokens']:,} read)")
+        state["status"] = "ingested"
+        save_state(state, args.state)
+
+    if not args.no_render:
+        print(f"\nRendering {len(state['pdfs'])} PDF(s) from translation memory...")
+        success_count = render_backlog(state["pdfs"], api_key, memory)
+        print(f"\nRendered {success_count}/{len(state['pdfs'])} PDFs into {TRANSLATED_FOLDER}")
+
+
+if __name__ == "__main__":
+    main()
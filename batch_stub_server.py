@@ -0,0 +1,197 @@
+"""
+Local stand-in for the Anthropic Message Batches API
+
+Implements just enough of the batch endpoints to run batch_backlog.py
+end to end without network access or API credit:
+    POST /v1/messages/batches                  create a batch
+    GET  /v1/messages/batches                  list batches, newest first
+    GET  /v1/messages/batches/{id}             poll status
+    GET  /v1/messages/batches/{id}/results     JSONL results
+    POST /v1/messages/batches/{id}/cancel      cancel
+
+Each request is "translated" by echoing every text with an [EN] prefix in
+the wire format the prompt asked for. Batches stay in_progress for
+--delay seconds so polling and resume-after-restart can be exercised.
+
+USAGE:
+    python batch_stub_server.py --port 8765 --delay 5
+    set ANTHROPIC_BASE_URL=http://127.0.0.1:8765
+    python batch_backlog.py
+"""
+import argparse
+import json
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# One "key|text" line in the lines wire format
+LINE_PATTERN = re.compile(r"^([^|\s]+)\|(.*)$")
+
+BATCHES = {}
+BATCHES_LOCK = threading.Lock()
+
+
+def isoformat(timestamp):
+    """RFC 3339 timestamp as returned by the API"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def fake_translate(params):
+    """Build a Message that echoes each text with an [EN] prefix"""
+    prompt = params["messages"][0]["content"]
+    if prompt.startswith("French texts to translate (JSON):"):
+        texts = json.loads(prompt.split("\n")[1])
+        reply = json.dumps({key: f"[EN] {text}" for key, text in texts.items()}, ensure_ascii=False)
+    else:
+        body = prompt.split("\n\n")[0].split("\n")[1:]
+        reply = "\n".join(
+            f"{match.group(1)}|[EN] {match.group(2)}"
+            for match in map(LINE_PATTERN.match, body) if match
+        )
+
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": params.get("model"),
+        "content": [{"type": "text", "text": reply}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {
+            "input_tokens": len(prompt) // 3,
+            "output_tokens": len(reply) // 3,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0
+        }
+    }
+
+
+class BatchHandler(BaseHTTPRequestHandler):
+    """Routes the Message Batches endpoints"""
+
+    delay = 5.0
+
+    def log_message(self, format, *args):
+        print(f"[stub] {self.command} {self.path}")
+
+    def send_json(self, payload, status=200):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def batch_object(self, batch):
+        """Batch status, switching to ended once the delay has passed"""
+        ended = batch["canceled"] or time.time() - batch["created"] >= self.delay
+        count = len(batch["requests"])
+        host = self.headers.get("Host")
+        return {
+            "id": batch["id"],
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended and not batch["canceled"] else 0,
+                "errored": 0,
+                "canceled": count if batch["canceled"] else 0,
+                "expired": 0
+            },
+            "created_at": isoformat(batch["created"]),
+            "expires_at": isoformat(batch["created"] + timedelta(days=1).total_seconds()),
+            "ended_at": isoformat(time.time()) if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": isoformat(time.time()) if batch["canceled"] else None,
+            "results_url": f"http://{host}/v1/messages/batches/{batch['id']}/results" if ended else None
+        }
+
+    def find_batch(self, batch_id):
+        with BATCHES_LOCK:
+            batch = BATCHES.get(batch_id)
+        if batch is None:
+            self.send_json({"type": "error", "error": {"type": "not_found_error", "message": batch_id}}, 404)
+        return batch
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        parts = self.path.split("?")[0].strip("/").split("/")
+
+        if parts == ["v1", "messages", "batches"]:
+            batch = {
+                "id": f"msgbatch_{uuid.uuid4().hex[:24]}",
+                "created": time.time(),
+                "requests": payload["requests"],
+                "canceled": False
+            }
+            with BATCHES_LOCK:
+                BATCHES[batch["id"]] = batch
+            self.send_json(self.batch_object(batch))
+        elif len(parts) == 5 and parts[4] == "cancel":
+            batch = self.find_batch(parts[3])
+            if batch:
+                batch["canceled"] = True
+                self.send_json(self.batch_object(batch))
+        else:
+            self.send_json({"type": "error", "error": {"type": "not_found_error", "message": self.path}}, 404)
+
+    def do_GET(self):
+        parts = self.path.split("?")[0].strip("/").split("/")
+        if parts == ["v1", "messages", "batches"]:
+            with BATCHES_LOCK:
+                batches = sorted(BATCHES.values(), key=lambda batch: batch["created"], reverse=True)
+            data = [self.batch_object(batch) for batch in batches]
+            self.send_json({
+                "data": data,
+                "has_more": False,
+                "first_id": data[0]["id"] if data else None,
+                "last_id": data[-1]["id"] if data else None
+            })
+            return
+
+        if len(parts) < 4 or parts[:3] != ["v1", "messages", "batches"]:
+            self.send_json({"type": "error", "error": {"type": "not_found_error", "message": self.path}}, 404)
+            return
+
+        batch = self.find_batch(parts[3])
+        if not batch:
+            return
+
+        if len(parts) == 4:
+            self.send_json(self.batch_object(batch))
+            return
+
+        lines = []
+        for request in batch["requests"]:
+            if batch["canceled"]:
+                result = {"type": "canceled"}
+            else:
+                result = {"type": "succeeded", "message": fake_translate(request["params"])}
+            lines.append(json.dumps({"custom_id": request["custom_id"], "result": result}, ensure_ascii=False))
+
+        body = ("\n".join(lines) + "\n").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/binary")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Message Batches API stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=5.0, help="Seconds before a batch reports ended")
+    args = parser.parse_args()
+
+    BatchHandler.delay = args.delay
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), BatchHandler)
+    print(f"Batch stub listening on http://127.0.0.1:{args.port} (delay {args.delay}s)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Dictionary tier benchmark
+- Collects the request strings of the first N sheets in original/
+- Resolves them with method12's translate_with_dict (exact match, then a
+  linear case-insensitive scan) and with DictionaryIndex
+- Reports hits per tier and the time per lookup
+
+USAGE:
+    python benchmarks/bench_dictionary.py [N_SHEETS]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dictionary_tier import DictionaryIndex, load_dictionary_entries
+from placeholders import mask
+from translate_haiku_100 import extract_text_from_pdf, should_skip, translation_units, unit_text
+
+REPEATS = 5
+
+# Timed source (the tier itself has no default dictionary; only lookup speed is measured here)
+BENCH_DICTIONARY = "archive/method12_data/translations.json"
+
+
+def legacy_translate_with_dict(text, dictionary):
+    """method12_translate.translate_with_dict"""
+    if text in dictionary:
+        return dictionary[text]
+
+    text_lower = text.lower()
+    for key, value in dictionary.items():
+        if key.lower() == text_lower:
+            if text.isupper():
+                return value.upper()
+            elif text.islower():
+                return value.lower()
+            elif text[0].isupper():
+                return value.capitalize()
+            return value
+
+    return None
+
+
+def collect_requests(n_sheets):
+    """Distinct unit texts of the first n_sheets PDFs that would go to translation"""
+    texts = set()
+    for pdf_path in sorted(Path("original").glob("*.pdf"))[:n_sheets]:
+        elements = extract_text_from_pdf(str(pdf_path))
+        for unit in translation_units(elements):
+            text = unit_text(elements, unit)
+            if not should_skip(text):
+                texts.add(text)
+    return sorted(texts)
+
+
+def best_time(fn):
+    """Best wall time over REPEATS"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    n_sheets = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    entries = load_dictionary_entries(BENCH_DICTIONARY)
+    texts = collect_requests(n_sheets)
+    templates = [mask(text)[0] for text in texts]
+
+    start = time.perf_counter()
+    index = DictionaryIndex(entries)
+    build_time = time.perf_counter() - start
+
+    print(f"Dictionary: {len(entries)} entries ({len(index)} indexed in {build_time * 1000:.1f} ms)")
+    print(f"Requests:   {len(texts)} distinct strings from {n_sheets} sheet(s)")
+    print()
+
+    legacy_hits = sum(1 for text in texts if legacy_translate_with_dict(text, entries) is not None)
+    tiers = {"exact": 0, "casefold": 0}
+    for template in templates:
+        _, tier = index.lookup(template)
+        if tier:
+            tiers[tier] += 1
+
+    legacy_time = best_time(lambda: [legacy_translate_with_dict(text, entries) for text in texts])
+    index_time = best_time(lambda: [index.lookup(template) for template in templates])
+
+    print(f"{'Resolver':<22}{'Hits':>8}{'Total':>12}{'Per lookup':>14}")
+    print(f"{'translate_with_dict':<22}{legacy_hits:>8}{legacy_time * 1000:>10.1f}ms"
+          f"{legacy_time / len(texts) * 1e6:>12.2f}us")
+    print(f"{'DictionaryIndex':<22}{tiers['exact'] + tiers['casefold']:>8}{index_time * 1000:>10.1f}ms"
+          f"{index_time / len(texts) * 1e6:>12.2f}us")
+    print()
+    print(f"DictionaryIndex tiers: {tiers['exact']} exact, {tiers['casefold']} case-insensitive")
+    print(f"Speedup: {legacy_time / index_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
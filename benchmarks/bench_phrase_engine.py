@@ -0,0 +1,85 @@
+"""
+Phrase pass benchmark
+- Collects every distinct text element of the sheets in original/
+- Runs the old per-term loop (sort by length, one re.sub(r'\\bTERM\\b') per
+  term) and PhraseEngine over it, for the translate_all.py term table and
+  the full 1500+ entry dictionary
+- Reports build/load time, time per string and how many outputs agree
+
+USAGE:
+    python benchmarks/bench_phrase_engine.py
+"""
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "archive" / "old_translators"))
+
+from phrase_engine import PhraseEngine
+from translate_all import WORD_TRANSLATIONS
+from translate_haiku_100 import extract_text_from_pdf
+from translation_dictionary_full import TRANSLATION_DICT
+
+
+def legacy_phrase_pass(text, terms):
+    """Word-by-word fallback of translate_all.translate_architectural_text as it was"""
+    result = text
+    sorted_terms = sorted(terms.items(), key=lambda x: len(x[0]), reverse=True)
+    for french, english in sorted_terms:
+        result = re.sub(r'\b' + re.escape(french) + r'\b', english, result)
+    return result
+
+
+def collect_texts():
+    """Distinct element texts of every sheet in original/"""
+    texts = set()
+    for pdf_path in sorted((ROOT / "original").glob("*.pdf")):
+        texts.update(elem.text for elem in extract_text_from_pdf(str(pdf_path)))
+    return sorted(texts)
+
+
+def run(name, terms, texts):
+    start = time.perf_counter()
+    engine = PhraseEngine(terms)
+    build_time = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "engine.pkl")
+        engine.save(path)
+        start = time.perf_counter()
+        engine = PhraseEngine.load(path)
+        load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy = [legacy_phrase_pass(text, terms) for text in texts]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [engine.replace(text) for text in texts]
+    engine_time = time.perf_counter() - start
+
+    agree = sum(1 for old, new in zip(legacy, compiled) if old == new)
+    print(f"{name}: {len(terms)} terms")
+    print(f"  Build: {build_time * 1000:.1f} ms, load: {load_time * 1000:.1f} ms")
+    print(f"  Per-term loop: {legacy_time:8.3f}s ({legacy_time / len(texts) * 1e6:8.1f} us/string)")
+    print(f"  PhraseEngine:  {engine_time:8.3f}s ({engine_time / len(texts) * 1e6:8.1f} us/string)")
+    print(f"  Speedup: {legacy_time / engine_time:.0f}x, identical output for {agree}/{len(texts)} strings")
+    for old, new, text in [(o, n, t) for o, n, t in zip(legacy, compiled, texts) if o != n][:3]:
+        print(f"    {text!r}\n      loop:   {old!r}\n      engine: {new!r}")
+    print()
+
+
+def main():
+    texts = collect_texts()
+    print(f"Strings: {len(texts)} distinct elements from original/")
+    print()
+    run("translate_all.py WORD_TRANSLATIONS", WORD_TRANSLATIONS, texts)
+    run("translation_dictionary_full.py TRANSLATION_DICT", TRANSLATION_DICT, texts)
+
+
+if __name__ == "__main__":
+    main()
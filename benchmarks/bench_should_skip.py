@@ -0,0 +1,108 @@
+"""
+Skip classifier benchmark
+- Collects every element and paragraph text of the sheets in original/
+- Classifies them with the old should_skip (sets rebuilt and regexes looked
+  up per call), with SkipClassifier.classify one text at a time and with
+  SkipClassifier.classify_all one page at a time
+- Checks all three agree and reports the time per text and the skip reasons
+
+USAGE:
+    python benchmarks/bench_should_skip.py
+"""
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from placeholders import REFERENCE_CODE, SHEET_NUMBER, UNITS
+from skip_rules import SkipClassifier, load_rules
+from translate_haiku_100 import extract_text_from_pdf, translation_units, unit_text
+
+REPEATS = 5
+
+
+def legacy_should_skip(text):
+    """should_skip as it was before the compiled classifier"""
+    if not text or not text.strip():
+        return True
+    if not any(c.isalpha() for c in text):
+        return True
+    if text.upper().strip('.,;:()[]{}!?-') in UNITS:
+        return True
+    if len(text) <= 4 and not text.isupper():
+        if any(c.isdigit() for c in text):
+            return True
+        material_codes = {'ac', 'aci', 'al', 'ar', 'asp', 'bo', 'br', 'bv', 'bz',
+                          'ca', 'cc', 'cf', 'cg', 'ci', 'cp', 'cr', 'cs', 'ct', 'cu', 'cv',
+                          'ea', 'ec', 'ei', 'pbo', 'pfs', 'pi', 'pla', 'prt', 'ps', 'pt', 'pvb',
+                          'rm', 'rv', 'st', 'ta', 'tc', 'te', 'ti', 'tm', 'tn', 'tep', 'tr',
+                          'vac', 'vc', 'vcr'}
+        if text.lower() in material_codes:
+            return True
+    if re.match(f'^{REFERENCE_CODE}$', text, re.IGNORECASE):
+        return True
+    if re.match(f'^{SHEET_NUMBER}$', text, re.IGNORECASE):
+        return True
+    return False
+
+
+def collect_pages():
+    """Element and translation-unit texts of every sheet in original/, grouped per page"""
+    pages = {}
+    for pdf_path in sorted(Path(__file__).resolve().parent.parent.glob("original/*.pdf")):
+        elements = extract_text_from_pdf(str(pdf_path))
+        for elem in elements:
+            pages.setdefault((pdf_path.name, elem.page), []).append(elem.text)
+        for unit in translation_units(elements):
+            if len(unit) > 1:
+                pages[(pdf_path.name, elements[unit[0]].page)].append(unit_text(elements, unit))
+    return list(pages.values())
+
+
+def best_time(fn):
+    """Best wall time over REPEATS"""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    pages = collect_pages()
+    texts = [text for page in pages for text in page]
+
+    start = time.perf_counter()
+    classifier = SkipClassifier(load_rules())
+    compile_time = time.perf_counter() - start
+
+    legacy = [legacy_should_skip(text) for text in texts]
+    single = [classifier.classify(text) for text in texts]
+    paged = [reason for page in pages for reason in classifier.classify_all(page)]
+    disagree = sum(1 for old, a, b in zip(legacy, single, paged) if old != (a is not None) or a != b)
+
+    legacy_time = best_time(lambda: [legacy_should_skip(text) for text in texts])
+    single_time = best_time(lambda: [classifier.classify(text) for text in texts])
+    paged_time = best_time(lambda: [classifier.classify_all(page) for page in pages])
+
+    print(f"Texts: {len(texts)} from {len(pages)} pages (rules compiled in {compile_time * 1000:.2f} ms)")
+    print(f"Disagreements with the old should_skip: {disagree}")
+    print()
+    print(f"{'Classifier':<32}{'Total':>10}{'Per text':>12}")
+    for name, elapsed in (("should_skip (old)", legacy_time),
+                          ("SkipClassifier.classify", single_time),
+                          ("SkipClassifier.classify_all", paged_time)):
+        print(f"{name:<32}{elapsed * 1000:>8.1f}ms{elapsed / len(texts) * 1e6:>10.2f}us")
+    print()
+    print("Skip reasons:")
+    for reason, count in Counter(reason for reason in paged if reason).most_common():
+        print(f"   {reason:<16}{count:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Text element representation benchmark
+- Extracts the largest sheets in original/ with the old dict-per-span code
+  and with TextElement (__slots__)
+- Reports extraction+merge time and the memory held by the element list
+
+USAGE:
+    python benchmarks/bench_text_elements.py [N_LARGEST]
+"""
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz
+from translate_haiku_100 import extract_page
+
+REPEATS = 5
+
+
+def legacy_merge_text_spans(spans):
+    """merge_text_spans as it was with dict elements"""
+    if not spans:
+        return []
+
+    spans.sort(key=lambda s: (round(s["bbox"][1], 1), s["bbox"][0]))
+
+    merged = []
+    current = spans[0].copy()
+    current["bbox"] = list(current["bbox"])
+
+    for next_span in spans[1:]:
+        same_line = abs(current["bbox"][1] - next_span["bbox"][1]) < 2
+        x_gap = next_span["bbox"][0] - current["bbox"][2]
+        close_horizontal = -1 <= x_gap <= 5
+
+        if same_line and close_horizontal:
+            if x_gap > 0.5:
+                current["text"] += " " + next_span["text"]
+            else:
+                current["text"] += next_span["text"]
+            current["bbox"][2] = max(current["bbox"][2], next_span["bbox"][2])
+        else:
+            merged.append(current)
+            current = next_span.copy()
+            current["bbox"] = list(current["bbox"])
+
+    merged.append(current)
+    return merged
+
+
+def legacy_extract_page(page, page_num):
+    """extract_page as it was with dict elements"""
+    page_spans = []
+    for block in page.get_text("dict")["blocks"]:
+        if block.get("type") == 0:
+            for line in block.get("lines", []):
+                for span in line.get("spans", []):
+                    text = span.get("text", "").strip()
+                    if text:
+                        page_spans.append({
+                            "text": text,
+                            "bbox": list(span["bbox"]),
+                            "size": span["size"],
+                            "color": span.get("color", 0)
+                        })
+
+    return [{
+        "page": page_num,
+        "text": item["text"],
+        "bbox": item["bbox"],
+        "size": item["size"],
+        "color": item["color"]
+    } for item in legacy_merge_text_spans(page_spans)]
+
+
+def measure(extract, pages):
+    """Best time over REPEATS and memory held by the resulting elements"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for page_num, page in enumerate(pages):
+            extract(page, page_num)
+        best = min(best, time.perf_counter() - start)
+
+    # Only the element list is kept alive while measuring
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    elements = [elem for page_num, page in enumerate(pages) for elem in extract(page, page_num)]
+    held = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    return best, held, len(elements)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    pdf_files = sorted(Path("original").glob("*.pdf"), key=lambda p: p.stat().st_size, reverse=True)[:count]
+
+    print(f"{'PDF':<14} {'elements':>8} {'dict ms':>8} {'slots ms':>9} {'dict KB':>8} {'slots KB':>9} {'B/elem':>12}")
+    for pdf_path in pdf_files:
+        doc = fitz.open(str(pdf_path))
+        pages = list(doc)
+        # Warm PyMuPDF's per-page caches so both runs parse equally
+        for page in pages:
+            page.get_text("dict")
+
+        dict_time, dict_bytes, n = measure(legacy_extract_page, pages)
+        slot_time, slot_bytes, _ = measure(extract_page, pages)
+        doc.close()
+
+        print(f"{pdf_path.stem[:14]:<14} {n:>8} {dict_time * 1000:>8.1f} {slot_time * 1000:>9.1f} "
+              f"{dict_bytes / 1024:>8.1f} {slot_bytes / 1024:>9.1f} "
+              f"{dict_bytes // max(n, 1):>5} → {slot_bytes // max(n, 1):<4}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Wire format benchmark
+- Extracts every PDF in original/ and collects the unique strings that
+  process_pdf would send to Haiku
+- Encodes them as the old pretty JSON prompt and as each compact wire format
+- Reports input/output tokens per PDF and the cost saving vs pretty JSON
+
+USAGE:
+    python benchmarks/bench_wire_format.py          # local token estimate
+    python benchmarks/bench_wire_format.py --api    # exact counts via count_tokens (needs ANTHROPIC_API_KEY)
+
+Output tokens are estimated by encoding the French strings as the reply,
+since English translations are about the same length.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from anthropic_translator import MODEL, WIRE_FORMATS, build_user_prompt, estimate_tokens, get_client
+from translate_haiku_100 import extract_text_from_pdf, should_skip
+from translation_memory import normalize_text
+
+# Haiku pricing used across the app ($/1M tokens)
+INPUT_PRICE = 0.80
+OUTPUT_PRICE = 4.00
+
+
+def legacy_prompt(texts):
+    """Request as sent before compact wire formats (pretty-printed JSON)"""
+    return f"""French texts to translate:
+{json.dumps(texts, ensure_ascii=False, indent=2)}
+
+Return format:
+{{
+  "index1": "English translation 1",
+  "index2": "English translation 2",
+  ...
+}}
+
+Return ONLY the JSON, no markdown code blocks."""
+
+
+def reply(texts, wire_format):
+    """Reply the model is asked to produce, with the source strings as stand-in translations"""
+    if wire_format == "lines":
+        return "\n".join(f"{key}|{text}" for key, text in texts.items())
+    if wire_format == "json":
+        return json.dumps(texts, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(texts, ensure_ascii=False, indent=2)
+
+
+def unique_strings(pdf_path):
+    """Deduplicated strings process_pdf would send for this PDF"""
+    seen = {}
+    for elem in extract_text_from_pdf(str(pdf_path)):
+        if not should_skip(elem.text):
+            seen.setdefault(normalize_text(elem.text), str(len(seen)))
+    return {key: text for text, key in seen.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api", action="store_true", help="Count tokens with the API instead of estimating")
+    args = parser.parse_args()
+
+    if args.api:
+        client = get_client(os.environ["ANTHROPIC_API_KEY"])
+
+        def count(text):
+            return client.messages.count_tokens(
+                model=MODEL,
+                messages=[{"role": "user", "content": text}]
+            ).input_tokens
+    else:
+        count = estimate_tokens
+
+    formats = ("pretty",) + WIRE_FORMATS
+    print(f"{'PDF':<12} {'strings':>7} " + " ".join(f"{f + ' in/out':>16}" for f in formats) + "   saving")
+
+    totals = {f: [0, 0] for f in formats}
+    for pdf_path in sorted(Path("original").glob("*.pdf")):
+        texts = unique_strings(pdf_path)
+        row = {}
+        for wire_format in formats:
+            prompt = legacy_prompt(texts) if wire_format == "pretty" else build_user_prompt(texts, wire_format)
+            row[wire_format] = (count(prompt), count(reply(texts, wire_format)))
+            totals[wire_format][0] += row[wire_format][0]
+            totals[wire_format][1] += row[wire_format][1]
+
+        best = min(WIRE_FORMATS, key=lambda f: row[f][0] * INPUT_PRICE + row[f][1] * OUTPUT_PRICE)
+        base_cost = row["pretty"][0] * INPUT_PRICE + row["pretty"][1] * OUTPUT_PRICE
+        best_cost = row[best][0] * INPUT_PRICE + row[best][1] * OUTPUT_PRICE
+        saving = 1 - best_cost / base_cost if base_cost else 0
+        print(f"{pdf_path.stem[:12]:<12} {len(texts):>7} "
+              + " ".join(f"{row[f][0]:>7}/{row[f][1]:<8}" for f in formats)
+              + f"   {saving:6.1%} ({best})")
+
+    print("\nTotals (input / output tokens, cost at "
+          f"${INPUT_PRICE:.2f}/${OUTPUT_PRICE:.2f} per 1M):")
+    base_cost = totals["pretty"][0] * INPUT_PRICE + totals["pretty"][1] * OUTPUT_PRICE
+    for wire_format in formats:
+        cost = totals[wire_format][0] * INPUT_PRICE + totals[wire_format][1] * OUTPUT_PRICE
+        print(f"   {wire_format:<7} {totals[wire_format][0]:>8,} / {totals[wire_format][1]:<8,} "
+              f"${cost / 1_000_000:.4f}  ({1 - cost / base_cost:.1%} saved vs pretty)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compile the dictionary sources into one memory-mapped index
+- Reads the literal TRANSLATION_DICT of the legacy dictionary modules and
+  the TRANSLATION_DICTIONARIES JSON files (none unless set or passed with
+  --dictionaries); later sources override earlier ones on the same French text
+- Leaves the translation memory out unless --include-memory is given: the
+  index is consulted before the live memory, so a snapshot would hide
+  later corrections until the next rebuild
+- Drops entries that fail dictionary_tier.vet_entry and reports them
+- Writes DICTIONARY_INDEX, which the dictionary tier maps on first lookup
+  instead of parsing every source at each process start. Building it opts
+  in to the dictionary tier, which then runs ahead of memory and Haiku
+
+USAGE:
+    python build_dictionary_index.py
+    python build_dictionary_index.py --output dictionary.idx --include-memory
+
+Re-run after the dictionaries change (or the memory, with --include-memory).
+Do not pass archive/method12_data/translations.json: its pairs are misaligned.
+"""
+import argparse
+import ast
+import os
+import time
+from dictionary_tier import DICTIONARY_INDEX, DICTIONARY_PATHS, build_index, load_dictionary_entries, vet_entries
+from translation_memory import TRANSLATION_MEMORY_DB, TranslationMemory
+
+# Python modules holding a literal TRANSLATION_DICT = {...}
+LEGACY_DICTIONARIES = ["archive/old_translators/translation_dictionary_full.py"]
+
+
+def load_literal_dict(path: str, name: str = "TRANSLATION_DICT") -> dict:
+    """Read a module-level dict literal without importing (running) the module"""
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == name for t in node.targets):
+            return ast.literal_eval(node.value)
+    return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile dictionary sources into a memory-mapped index")
+    parser.add_argument("--output", default=DICTIONARY_INDEX, help="Index file to write")
+    parser.add_argument("--dictionaries", default=DICTIONARY_PATHS,
+                        help=f"Vetted JSON dictionaries, separated by '{os.pathsep}' (none by default)")
+    parser.add_argument("--memory", default=TRANSLATION_MEMORY_DB, help="Translation memory database")
+    parser.add_argument("--include-memory", action="store_true",
+                        help="Snapshot the translation memory into the index (hides later memory edits)")
+    args = parser.parse_args()
+
+    start = time.time()
+    sources = []
+    for path in LEGACY_DICTIONARIES:
+        if os.path.exists(path):
+            sources.append((path, load_literal_dict(path)))
+    for path in args.dictionaries.split(os.pathsep):
+        if path:
+            sources.append((path, load_dictionary_entries(path)))
+    if args.include_memory and os.path.exists(args.memory):
+        with TranslationMemory(args.memory) as memory:
+            sources.append((f"translation memory {args.memory}", memory.entries()))
+
+    print("Merging sources in order (later sources override earlier ones on the same French text):")
+    entries = {}
+    for position, (name, source) in enumerate(sources, 1):
+        kept, rejected = vet_entries(source)
+        overridden = sum(1 for french in kept if french in entries)
+        entries.update(kept)
+        details = ", ".join(f"{count} {reason}" for reason, count in rejected.most_common())
+        print(f"   {position}. {name}: {len(kept)} of {len(source)} entries kept"
+              f"{f' (rejected: {details})' if details else ''}, {overridden} override earlier sources")
+
+    count = build_index(args.output, entries)
+    size = os.path.getsize(args.output)
+    print(f"Indexed {count} templates from {len(entries)} entries into {args.output} "
+          f"({size / 1024:.0f} KB, {time.time() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
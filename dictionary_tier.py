@@ -0,0 +1,242 @@
+"""Local dictionary tier: exact and case-insensitive lookups ahead of the LLM"""
+import json
+import os
+import threading
+from collections import Counter
+from placeholders import PLACEHOLDER_PATTERN, has_words, mask
+from string_table import StringTableFile, write_string_tables
+from translation_memory import normalize_text
+
+# Text-keyed {french: english} JSON files, separated by os.pathsep (set TRANSLATION_DICTIONARIES to opt in).
+# Empty by default: archive/method12_data/translations.json has misaligned pairs (archive/ROOT_CAUSE_ANALYSIS.md)
+DICTIONARY_PATHS = os.environ.get("TRANSLATION_DICTIONARIES", "")
+
+# Compiled index written by build_dictionary_index.py; used instead of the JSON files when present
+DICTIONARY_INDEX = os.environ.get("DICTIONARY_INDEX", "dictionary.idx")
+
+# Entries whose English is more than MAX_LENGTH_RATIO times longer or shorter
+# than the French (plus LENGTH_SLACK characters) are rejected as misaligned
+MAX_LENGTH_RATIO = 2.0
+LENGTH_SLACK = 10
+
+# Case styles stored per casefold entry, in this order
+CASE_STYLES = ("upper", "lower", "title", "mixed")
+
+# Separates the fields of a casefold entry
+FIELD_SEPARATOR = "\x1f"
+
+# Process-wide dictionary built on first use
+_default_dictionary = None
+_default_lock = threading.Lock()
+
+
+def case_style(text: str) -> str:
+    """"upper", "lower", "title" (first letter capitalised) or "mixed", ignoring placeholders"""
+    letters = PLACEHOLDER_PATTERN.sub("", text)
+    if letters.isupper():
+        return "upper"
+    if letters.islower():
+        return "lower"
+    first = next((c for c in letters if c.isalpha()), "")
+    if first.isupper() and letters[letters.index(first) + 1:].islower():
+        return "title"
+    return "mixed"
+
+
+def recase(template: str, style: str) -> str:
+    """Apply a case style to the words of a template, leaving placeholders untouched"""
+    pieces = PLACEHOLDER_PATTERN.split(template)
+    placeholders = PLACEHOLDER_PATTERN.findall(template)
+    if style == "upper":
+        pieces = [piece.upper() for piece in pieces]
+    elif style in ("lower", "title"):
+        pieces = [piece.lower() for piece in pieces]
+        if style == "title":
+            for i, piece in enumerate(pieces):
+                first = next((j for j, c in enumerate(piece) if c.isalpha()), None)
+                if first is not None:
+                    pieces[i] = piece[:first] + piece[first].upper() + piece[first + 1:]
+                    break
+    result = [pieces[0]]
+    for placeholder, piece in zip(placeholders, pieces[1:]):
+        result.append(placeholder)
+        result.append(piece)
+    return "".join(result)
+
+
+def load_dictionary_entries(paths: str = None) -> dict:
+    """Merge the dictionary files (later files win); missing files are skipped"""
+    entries = {}
+    for path in (paths or DICTIONARY_PATHS).split(os.pathsep):
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                entries.update(json.load(f))
+    return entries
+
+
+def vet_entry(french: str, english) -> str:
+    """
+    Reason a dictionary entry cannot be trusted, or None if it looks sound
+
+    Catches what can be seen from one pair: English that is missing,
+    mojibake, French "translated" to itself, and lengths too far apart for
+    the two sides to say the same thing. Pairs shifted onto a neighbour of
+    similar length pass, so a source still has to be known to be aligned.
+    """
+    if not isinstance(english, str) or not english.strip():
+        return "empty"
+    if "\ufffd" in french or "\ufffd" in english:
+        return "encoding"
+    if french.casefold() == english.casefold() and has_words(mask(french)[0]):
+        return "untranslated"
+    if (len(english) > len(french) * MAX_LENGTH_RATIO + LENGTH_SLACK
+            or len(french) > len(english) * MAX_LENGTH_RATIO + LENGTH_SLACK):
+        return "length"
+    return None
+
+
+def vet_entries(entries: dict):
+    """
+    Drop the entries vet_entry rejects
+
+    Returns:
+        ({french: english} that passed, Counter of {reason: rejected entries})
+    """
+    kept = {}
+    rejected = Counter()
+    for french, english in entries.items():
+        reason = vet_entry(french, english)
+        if reason is None:
+            kept[french] = english
+        else:
+            rejected[reason] += 1
+    return kept, rejected
+
+
+def index_entries(entries: dict):
+    """
+    Exact and casefold lookup tables for a {french: english} dictionary
+
+    Returns:
+        ({template: english template},
+         {casefolded template: key style and English in every CASE_STYLES,
+          joined by FIELD_SEPARATOR})
+    """
+    exact = {}
+    for french, english in entries.items():
+        if not isinstance(english, str) or not english.strip():
+            continue
+        template, values = mask(normalize_text(french))
+        if values:
+            english_template, english_values = mask(english)
+            if english_values != values:
+                continue  # Values moved or changed in translation; only usable verbatim
+            english = english_template
+        exact.setdefault(template, english)
+
+    folded = {}
+    for template, english in exact.items():
+        key = template.casefold()
+        if key not in folded:
+            variants = [recase(english, style) for style in CASE_STYLES[:-1]] + [english]
+            folded[key] = FIELD_SEPARATOR.join([case_style(template)] + variants)
+    return exact, folded
+
+
+def build_index(path: str, entries: dict) -> int:
+    """
+    Compile a dictionary into a string table file for DictionaryIndex.open
+
+    Returns:
+        Number of indexed templates
+    """
+    exact, folded = index_entries(entries)
+    write_string_tables(path, [exact, folded])
+    return len(exact)
+
+
+class DictionaryIndex:
+    """
+    French → English dictionary indexed for fast lookups
+
+    Keys are masked the same way as request strings (see placeholders.py),
+    so "ESCALIER 4" in the dictionary also answers "ESCALIER {n1}". Besides
+    the exact index there is a casefold index whose entries carry their
+    English pre-rendered in every case style, so a case-insensitive hit
+    costs two lookups instead of a scan over the whole dictionary.
+
+    Built in memory from entries, or opened from a compiled index file
+    (build_dictionary_index.py) that is memory-mapped on first lookup.
+    """
+
+    def __init__(self, entries: dict = None, exact=None, folded=None):
+        if entries is not None:
+            exact, folded = index_entries(entries)
+        self._exact = exact
+        self._folded = folded
+
+    @classmethod
+    def open(cls, path: str):
+        """Index backed by a compiled string table file (mapped lazily)"""
+        tables = StringTableFile(path)
+        return cls(exact=_LazyTable(tables, 0), folded=_LazyTable(tables, 1))
+
+    def __len__(self):
+        return len(self._exact)
+
+    def lookup(self, template: str):
+        """
+        Resolve one request template
+
+        Returns:
+            (english template, "exact" | "casefold") or (None, None)
+        """
+        english = self._exact.get(template)
+        if english is not None:
+            return english, "exact"
+
+        entry = self._folded.get(template.casefold())
+        if entry is None:
+            return None, None
+        key_style, *variants = entry.split(FIELD_SEPARATOR)
+        style = case_style(template)
+        return variants[CASE_STYLES.index("mixed" if style == key_style else style)], "casefold"
+
+
+class _LazyTable:
+    """One table of a StringTableFile, mapped on first use"""
+
+    def __init__(self, tables: StringTableFile, index: int):
+        self._tables = tables
+        self._index = index
+
+    def __len__(self):
+        return len(self._tables.table(self._index))
+
+    def get(self, key: str, default=None):
+        return self._tables.table(self._index).get(key, default)
+
+
+def dictionary_sources():
+    """Files the default dictionary is read from: DICTIONARY_INDEX if it exists, else DICTIONARY_PATHS"""
+    if os.path.exists(DICTIONARY_INDEX):
+        return [DICTIONARY_INDEX]
+    return [path for path in DICTIONARY_PATHS.split(os.pathsep) if path]
+
+
+def get_default_dictionary():
+    """
+    Return the process-wide DictionaryIndex: the compiled DICTIONARY_INDEX
+    if it exists, otherwise one built from the vetted DICTIONARY_PATHS
+    files, or None if neither is configured (the tier is opt-in)
+    """
+    global _default_dictionary
+    with _default_lock:
+        if _default_dictionary is None:
+            if os.path.exists(DICTIONARY_INDEX):
+                _default_dictionary = DictionaryIndex.open(DICTIONARY_INDEX)
+            elif DICTIONARY_PATHS:
+                _default_dictionary = DictionaryIndex(vet_entries(load_dictionary_entries())[0])
+            else:
+                _default_dictionary = False
+        return _default_dictionary or None
@@ -0,0 +1,78 @@
+"""On-disk cache of extracted text elements keyed by PDF content hash"""
+import hashlib
+import json
+import os
+import pickle
+import fitz
+from text_element import TextElement
+
+# Cache location (override with EXTRACTION_CACHE_DIR)
+EXTRACTION_CACHE_DIR = os.environ.get("EXTRACTION_CACHE_DIR", ".extraction_cache")
+
+# Bump when the cache file layout changes
+CACHE_FORMAT = 3
+
+# Read size when hashing PDFs
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_hash(pdf_path: str) -> str:
+    """SHA256 of the PDF bytes, so renamed or re-saved copies of the same file hit the cache"""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(pdf_path: str, settings: dict) -> str:
+    """
+    Cache key for one PDF under given extraction settings
+
+    Combines the PDF content hash, the extraction/merging settings and the
+    PyMuPDF version, so changing any of them re-extracts instead of reusing
+    stale elements.
+    """
+    fingerprint = json.dumps({
+        "pdf": file_hash(pdf_path),
+        "settings": settings,
+        "pymupdf": fitz.VersionBind,
+        "format": CACHE_FORMAT
+    }, sort_keys=True)
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(EXTRACTION_CACHE_DIR, f"{key}.pkl")
+
+
+def load_elements(key: str):
+    """
+    Load cached elements
+
+    Returns:
+        List of fresh TextElement objects, or None on a cache miss
+    """
+    try:
+        with open(_cache_path(key), 'rb') as f:
+            rows = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+    return [
+        TextElement(page, text, (x0, y0, x1, y1), size, color, block, paragraph, cell)
+        for page, text, x0, y0, x1, y1, size, color, block, paragraph, cell in rows
+    ]
+
+
+def save_elements(key: str, elements) -> None:
+    """Store elements as a pickled list of plain tuples (written atomically)"""
+    os.makedirs(EXTRACTION_CACHE_DIR, exist_ok=True)
+    rows = [
+        (e.page, e.text, e.x0, e.y0, e.x1, e.y1, e.size, e.color, e.block, e.paragraph, e.cell)
+        for e in elements
+    ]
+    tmp_path = _cache_path(key) + f".{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, _cache_path(key))
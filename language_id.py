@@ -0,0 +1,101 @@
+"""Character n-gram language identifier (French / English / code) for bypassing the API"""
+import json
+import os
+import threading
+from placeholders import PLACEHOLDER_PATTERN, mask
+
+# Model written by train_language_id.py (override with LANGUAGE_MODEL)
+LANGUAGE_MODEL = os.environ.get("LANGUAGE_MODEL", "language_model.json")
+
+# Bump when the model layout or the n-gram features change
+LANGUAGE_MODEL_FORMAT = 1
+
+# Process-wide identifier loaded on first use
+_default_identifier = None
+_default_lock = threading.Lock()
+
+
+def strip_codes(text: str) -> str:
+    """Text with numbers, dimensions and codes masked out (see placeholders.py)"""
+    return PLACEHOLDER_PATTERN.sub(" ", mask(text)[0])
+
+
+def ngrams(words: str, n: int):
+    """
+    Character 1..n-grams of stripped text
+
+    Case is folded and the words are padded with spaces so word starts and
+    ends count.
+    """
+    padded = f" {' '.join(words.casefold().split())} "
+    return [padded[i:i + size] for size in range(1, n + 1) for i in range(len(padded) - size + 1)]
+
+
+class LanguageIdentifier:
+    """
+    Naive Bayes over character n-grams, trained on our own translation pairs
+
+    A text is only reported as non-French when it has enough letters and
+    its per-n-gram log-likelihood beats French by the model's margin; both
+    thresholds were tuned so held-out French is never bypassed.
+    """
+
+    def __init__(self, model: dict):
+        self.classes = model["classes"]
+        self.n = model["ngram"]
+        self.min_letters = model["min_letters"]
+        self.margin = model["margin"]
+        self._french = self.classes.index("fr")
+        self._log_probs = model["log_probs"]  # {ngram: [log P(ngram | class) per class]}
+
+    @classmethod
+    def load(cls, path: str = None):
+        """Load a trained model, or None if there is none (or it is from another format)"""
+        try:
+            with open(path or LANGUAGE_MODEL, 'r', encoding='utf-8') as f:
+                model = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if model.get("format") != LANGUAGE_MODEL_FORMAT:
+            return None
+        return cls(model)
+
+    def scores(self, words: str):
+        """Mean log-likelihood per known n-gram of stripped text for each class (None if none is known)"""
+        found = [log_probs for log_probs in map(self._log_probs.get, ngrams(words, self.n)) if log_probs]
+        if not found:
+            return None
+        return [sum(column) / len(found) for column in zip(*found)]
+
+    def _compare(self, words: str):
+        scores = self.scores(words)
+        if scores is None:
+            return None, 0.0
+        best = max((i for i in range(len(self.classes)) if i != self._french), key=scores.__getitem__)
+        return self.classes[best], scores[best] - scores[self._french]
+
+    def identify(self, text: str):
+        """
+        Most likely non-French class and how far it beats French
+
+        Returns:
+            (class, margin per n-gram), or (None, 0.0) if nothing is known
+        """
+        return self._compare(strip_codes(text))
+
+    def bypass(self, text: str):
+        """Class of a text that confidently is not French ("en" / "code"), else None"""
+        words = strip_codes(text)
+        if sum(map(str.isalpha, words)) < self.min_letters:
+            return None
+        language, margin = self._compare(words)
+        return language if margin >= self.margin else None
+
+
+def get_default_identifier():
+    """Return the process-wide LanguageIdentifier for LANGUAGE_MODEL, or None without a model"""
+    global _default_identifier
+    with _default_lock:
+        if _default_identifier is None:
+            _default_identifier = LanguageIdentifier.load() or False
+        return _default_identifier or None
@@ -0,0 +1,172 @@
+"""On-disk cache of translated pages keyed by page content hash"""
+import hashlib
+import json
+import os
+import re
+import fitz
+
+# Cache location (override with PAGE_CACHE_DIR)
+PAGE_CACHE_DIR = os.environ.get("PAGE_CACHE_DIR", ".page_cache")
+
+# Bump when the hashing or file layout changes
+PAGE_CACHE_FORMAT = 1
+
+# Indirect reference inside a PDF object definition
+REFERENCE_PATTERN = re.compile(r"(\d+) 0 R")
+
+# Keys that point back up the page tree (differ per file, not part of the look of a page)
+PARENT_PATTERN = re.compile(r"/(Parent|P|StructParents?)\s+(\d+ 0 R|\d+)")
+
+
+def _object_digest(doc, xref, memo, active):
+    """
+    Hash of one PDF object with its references resolved recursively
+
+    References are replaced by the digest of the referenced object, so the
+    same fonts/images hash the same in any file regardless of xref numbers.
+    """
+    if xref in memo:
+        return memo[xref]
+    if xref in active or xref <= 0 or xref >= doc.xref_length():
+        return "cycle"
+    active.add(xref)
+
+    source = PARENT_PATTERN.sub("", doc.xref_object(xref, compressed=True))
+    source = REFERENCE_PATTERN.sub(lambda m: _object_digest(doc, int(m.group(1)), memo, active), source)
+    digest = hashlib.sha256(source.encode('utf-8'))
+    if doc.xref_is_stream(xref):
+        digest.update(doc.xref_stream_raw(xref))
+
+    active.discard(xref)
+    memo[xref] = digest.hexdigest()
+    return memo[xref]
+
+
+def page_key(doc, page_num: int, settings: dict, memo=None) -> str:
+    """
+    Cache key for one page under given translation settings
+
+    Combines the page's decoded content streams, its resources (fonts,
+    images, XObjects), size and rotation with the settings that shape the
+    translated output.
+
+    Args:
+        doc: fitz document
+        page_num: Page index
+        settings: Extraction/translation settings (part of the key)
+        memo: Optional dict shared across pages of one document
+
+    Returns:
+        Hex key, or None for pages that inherit their resources from the
+        page tree (not cached)
+    """
+    memo = {} if memo is None else memo
+    page = doc[page_num]
+
+    kind, value = doc.xref_get_key(page.xref, "Resources")
+    if kind == "null":
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(page.read_contents())
+    resources = REFERENCE_PATTERN.sub(lambda m: _object_digest(doc, int(m.group(1)), memo, set()), value)
+    digest.update(f"{kind}:{resources}".encode('utf-8'))
+
+    digest.update(json.dumps({
+        "rect": list(page.rect),
+        "rotation": page.rotation,
+        "settings": settings,
+        "pymupdf": fitz.VersionBind,
+        "format": PAGE_CACHE_FORMAT
+    }, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _cache_path(key: str) -> str:
+    return os.path.join(PAGE_CACHE_DIR, f"{key}.pdf")
+
+
+def _units_path(key: str) -> str:
+    return os.path.join(PAGE_CACHE_DIR, f"{key}.units.json")
+
+
+def load_page(key: str):
+    """
+    Open a cached translated page
+
+    Returns:
+        One-page fitz document, or None on a cache miss
+    """
+    path = _cache_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        return fitz.open(path)
+    except Exception:
+        return None
+
+
+def load_page_units(key: str, page_num: int):
+    """
+    Revision record entries stored with a cached page (see revisions.py)
+
+    Returns:
+        List of entries moved to page_num, or None if the page has none
+    """
+    try:
+        with open(_units_path(key), 'r', encoding='utf-8') as f:
+            units = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return [dict(unit, page=page_num) for unit in units]
+
+
+def save_page(doc, page_num: int, key: str, units=None) -> None:
+    """
+    Store one translated page as a single-page PDF (written atomically)
+
+    Args:
+        doc: Translated document
+        page_num: Page to store
+        key: Page key (see page_key)
+        units: Optional revision record entries of the page, so runs that
+               copy it from the cache can still write a complete record
+    """
+    os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+    if units is not None:
+        tmp_path = _units_path(key) + f".{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(units, f, ensure_ascii=False)
+        os.replace(tmp_path, _units_path(key))
+    single = fitz.open()
+    single.insert_pdf(doc, from_page=page_num, to_page=page_num)
+    tmp_path = _cache_path(key) + f".{os.getpid()}.tmp"
+    single.save(tmp_path, garbage=4, deflate=True)
+    single.close()
+    os.replace(tmp_path, _cache_path(key))
+
+
+def replace_page(doc, page_num: int, cached) -> None:
+    """Swap page page_num of doc for the cached translated page"""
+    doc.delete_page(page_num)
+    doc.insert_pdf(cached, from_page=0, to_page=0, start_at=page_num)
+
+
+def lookup_pages(pdf_path: str, settings: dict):
+    """
+    Page keys of a PDF and the pages already in the cache
+
+    Returns:
+        (keys [key or None per page], hits {page_num: one-page fitz document})
+    """
+    doc = fitz.open(pdf_path)
+    memo = {}
+    keys = [page_key(doc, page_num, settings, memo) for page_num in range(len(doc))]
+    doc.close()
+
+    hits = {}
+    for page_num, key in enumerate(keys):
+        cached = load_page(key) if key else None
+        if cached is not None:
+            hits[page_num] = cached
+    return keys, hits
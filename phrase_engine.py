@@ -0,0 +1,179 @@
+"""Compiled phrase replacement (Aho–Corasick) for dictionary phrase passes"""
+import hashlib
+import json
+import os
+import pickle
+from collections import deque
+
+# Compiled automaton location (override with PHRASE_CACHE_DIR)
+PHRASE_CACHE_DIR = os.environ.get("PHRASE_CACHE_DIR", ".phrase_cache")
+
+# Bump when the automaton layout changes
+PHRASE_CACHE_FORMAT = 1
+
+
+def _is_word(c: str) -> bool:
+    """Same notion of a word character as the re module's \\w"""
+    return c.isalnum() or c == "_"
+
+
+class PhraseEngine:
+    """
+    Multi-phrase matcher built once over a {french: english} term table
+
+    Replaces the "sort terms by length, then one re.sub(r'\\bTERM\\b') per
+    term" loop: every term is found in a single scan of the text, matches
+    must sit on word boundaries (same rule as \\b), and the longest phrase
+    wins where matches overlap. Replacements are never re-scanned, so an
+    English word cannot be translated a second time.
+    """
+
+    def __init__(self, terms: dict, ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        self._goto = [{}]       # {char: state} per state
+        self._fail = [0]
+        self._out = [()]        # Term ids ending at each state, including via fail links
+        self._lengths = []
+        self._replacements = []
+
+        terminal = {}
+        for phrase, replacement in terms.items():
+            key = phrase.lower() if ignore_case else phrase
+            if not key:
+                continue
+            state = 0
+            for c in key:
+                nxt = self._goto[state].get(c)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][c] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            if state not in terminal:  # First entry wins, as in the sorted loop
+                terminal[state] = len(self._lengths)
+                self._lengths.append(len(key))
+                self._replacements.append(replacement)
+                self._out[state] = (terminal[state],)
+
+        # Breadth-first so a state's fail target is complete before the state itself
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for c, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and c not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(c, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def find(self, text: str):
+        """
+        Matches to replace in text
+
+        Returns:
+            Non-overlapping [(start, end, english)] in text order
+        """
+        haystack = text.lower() if self.ignore_case else text
+        if len(haystack) != len(text):
+            haystack = text  # Lowercasing changed offsets; match as written
+
+        def boundary(i):
+            before = i > 0 and _is_word(text[i - 1])
+            after = i < len(text) and _is_word(text[i])
+            return before != after
+
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        candidates = []
+        state = 0
+        for end, c in enumerate(haystack, 1):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            for term in out[state]:
+                start = end - lengths[term]
+                if boundary(start) and boundary(end):
+                    candidates.append((-lengths[term], start, term))
+
+        # Longest phrase first, then leftmost
+        taken = bytearray(len(text))
+        matches = []
+        for negative_length, start, term in sorted(candidates):
+            end = start - negative_length
+            if any(taken[start:end]):
+                continue
+            taken[start:end] = b"\x01" * (end - start)
+            matches.append((start, end, self._replacements[term]))
+        matches.sort()
+        return matches
+
+    def replace(self, text: str) -> str:
+        """Text with every matched phrase replaced by its English"""
+        pieces = []
+        last = 0
+        for start, end, english in self.find(text):
+            pieces.append(text[last:start])
+            pieces.append(english)
+            last = end
+        if not pieces:
+            return text
+        pieces.append(text[last:])
+        return "".join(pieces)
+
+    def save(self, path: str) -> None:
+        """Store the compiled automaton as plain lists (written atomically)"""
+        state = (self.ignore_case, self._goto, self._fail, self._out, self._lengths, self._replacements)
+        tmp_path = path + f".{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str):
+        """Load a compiled automaton, or None if missing or unreadable"""
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        engine = cls.__new__(cls)
+        (engine.ignore_case, engine._goto, engine._fail, engine._out,
+         engine._lengths, engine._replacements) = state
+        return engine
+
+
+def phrase_key(terms: dict, ignore_case: bool = False) -> str:
+    """Cache key for a term table (changes whenever any term or replacement does)"""
+    fingerprint = json.dumps({
+        "terms": list(terms.items()),
+        "ignore_case": ignore_case,
+        "format": PHRASE_CACHE_FORMAT
+    }, ensure_ascii=False)
+    return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+
+def compile_phrases(terms: dict, ignore_case: bool = False) -> PhraseEngine:
+    """
+    PhraseEngine for a term table, loaded from PHRASE_CACHE_DIR when the
+    same table was compiled before
+
+    Args:
+        terms: {french: english}; earlier entries win on duplicate keys
+        ignore_case: Match regardless of case (like re.IGNORECASE)
+
+    Returns:
+        PhraseEngine
+    """
+    path = os.path.join(PHRASE_CACHE_DIR, f"{phrase_key(terms, ignore_case)}.pkl")
+    engine = PhraseEngine.load(path)
+    if engine is None:
+        engine = PhraseEngine(terms, ignore_case)
+        os.makedirs(PHRASE_CACHE_DIR, exist_ok=True)
+        engine.save(path)
+    return engine
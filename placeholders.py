@@ -0,0 +1,84 @@
+"""Typed placeholders for numbers, dimensions and reference codes
+
+"VOIR 5 / A-171b" and "VOIR 12 / A-505" differ only in values the model
+copies verbatim, so both are masked to "VOIR {n1} / {sheet1}" before dedup,
+translation memory lookup and translation; each element gets its own
+values back afterwards.
+
+Values are restored exactly as written, so decimal commas stay French
+("13,9 m²" is not rendered "13.9 m²"): the model never sees the number to
+convert it. That is the price of sharing one translation across every
+value. Ordinal markers are left out of the number placeholder ("2e",
+"1er", "3ème" stay in the text) so the model translates them.
+"""
+import re
+from collections import Counter
+
+# Units and measurement abbreviations (also used by should_skip)
+UNITS = {'MM', 'CM', 'M', 'KG', 'LB', 'FT', 'IN', 'SQ', 'MIN', 'MAX', 'NO', 'QTY', 'TYP', 'REF',
+         'GA', 'CAL', 'PSI', 'KPA', 'MPH', 'KPH', 'DEG', 'TEMP', 'DIA', 'THK', 'EA'}
+
+# Units that follow a number in a dimension ("406 mm", "13,9 m²", "45 MIN")
+MEASUREMENT_UNITS = ('mm', 'cm', 'm²', 'm2', 'm', 'kg', 'lb', 'ft', 'in', 'psi', 'kpa', 'mph', 'kph',
+                     'deg', 'min', '°')
+
+# Reference codes such as "PL1", "MF2", "G485" and sheet numbers such as "A-505" (also used by should_skip)
+REFERENCE_CODE = r"[A-Z]{1,3}\d+[a-z]?"
+SHEET_NUMBER = r"[A-Z]-\d+[a-z]?"
+
+# Placeholder types, tried in this order at each position
+PLACEHOLDER_TYPES = (
+    ("sheet", SHEET_NUMBER),
+    ("code", r"(?:[A-Z]{2,4}\.)+[A-Za-z0-9]*\d[A-Za-z0-9]*(?:\.[A-Za-z0-9]+)*"),  # JT.201.02.01B
+    ("dim", r"\d+(?:[.,]\d+)?\s?(?i:" + "|".join(map(re.escape, MEASUREMENT_UNITS)) + ")"),
+    ("ref", REFERENCE_CODE),
+    ("n", r"\d+(?:[.,]\d+)*[a-df-z]?"),  # "221a"; not "e", so ordinals ("2e étage") stay words
+)
+
+MASK_PATTERN = re.compile(
+    r"(?<![\w{])(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in PLACEHOLDER_TYPES) + r")(?![\w²°}])"
+)
+
+# A placeholder in a template or translation
+PLACEHOLDER_PATTERN = re.compile(r"\{(?:" + "|".join(name for name, _ in PLACEHOLDER_TYPES) + r")\d+\}")
+
+
+def mask(text: str):
+    """
+    Replace numbers, dimensions and codes with typed placeholders
+
+    Returns:
+        (template, {placeholder: original value}); text that already
+        contains placeholder-like tokens is returned unmasked
+    """
+    if PLACEHOLDER_PATTERN.search(text):
+        return text, {}
+
+    values = {}
+    counts = {}
+
+    def substitute(match):
+        kind = match.lastgroup
+        counts[kind] = counts.get(kind, 0) + 1
+        placeholder = f"{{{kind}{counts[kind]}}}"
+        values[placeholder] = match.group(0)
+        return placeholder
+
+    return MASK_PATTERN.sub(substitute, text), values
+
+
+def fill(template: str, values: dict) -> str:
+    """Put the original values back into a (translated) template"""
+    if not values:
+        return template
+    return PLACEHOLDER_PATTERN.sub(lambda m: values.get(m.group(0), m.group(0)), template)
+
+
+def placeholders_intact(template: str, translation: str) -> bool:
+    """True if the translation kept every placeholder of the template exactly once"""
+    return Counter(PLACEHOLDER_PATTERN.findall(template)) == Counter(PLACEHOLDER_PATTERN.findall(translation))
+
+
+def has_words(template: str) -> bool:
+    """True if anything besides placeholders is left to translate"""
+    return any(c.isalpha() for c in PLACEHOLDER_PATTERN.sub("", template))
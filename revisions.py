@@ -0,0 +1,180 @@
+"""Revision records for incremental re-translation of re-issued drawings"""
+import json
+import os
+from translation_memory import normalize_text
+
+# Same text whose centre moved less than this (pt) counts as unchanged
+POSITION_TOLERANCE = 2.0
+
+# Element types whose English is worth keeping for the next revision
+RECORDED_TYPES = ("dictionary", "memory", "haiku", "previous")
+
+
+def revision_path(output_path: str) -> str:
+    """Revision record stored next to a translated PDF"""
+    return os.path.splitext(output_path)[0] + ".revision.json"
+
+
+def _unit_bbox(lines):
+    return [
+        round(min(line.x0 for line in lines), 1),
+        round(min(line.y0 for line in lines), 1),
+        round(max(line.x1 for line in lines), 1),
+        round(max(line.y1 for line in lines), 1)
+    ]
+
+
+def _centre(bbox):
+    return ((bbox[0] + bbox[2]) / 2, (bbox[1] + bbox[3]) / 2)
+
+
+def _overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def revision_units(text_elements, units) -> list:
+    """
+    Record entries for the translated units of some elements
+
+    Args:
+        text_elements: Translated elements
+        units: Index lists from translation_units()
+
+    Returns:
+        List of {"page", "text", "bbox", "english"} dicts
+    """
+    records = []
+    for unit in units:
+        lines = [text_elements[idx] for idx in unit]
+        if lines[0].type not in RECORDED_TYPES:
+            continue
+        records.append({
+            "page": lines[0].page,
+            "text": normalize_text(" ".join(line.text for line in lines)),
+            "bbox": _unit_bbox(lines),
+            "english": normalize_text(" ".join(line.translated or "" for line in lines))
+        })
+    return records
+
+
+def save_revision(path: str, source: str, text_elements, units, extra_units=()) -> int:
+    """
+    Write the translated units of one PDF as its revision record
+
+    Args:
+        path: Record file (see revision_path)
+        source: Name of the PDF the record belongs to
+        text_elements: Translated elements
+        units: Index lists from translation_units()
+        extra_units: Record entries of pages that were not extracted this
+                     run (e.g. copied from the page cache)
+
+    Returns:
+        Number of units recorded
+    """
+    records = revision_units(text_elements, units) + list(extra_units)
+    records.sort(key=lambda record: record["page"])
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({"source": source, "units": records}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+class PreviousRevision:
+    """
+    Translated units of the previous issue of a drawing, indexed per page
+
+    diff() pairs the units of the new extraction with the old ones by text
+    and position, so unchanged units keep their English and only added or
+    changed ones need translating.
+    """
+
+    def __init__(self, record: dict):
+        self.source = record.get("source")
+        self._pages = {}  # {page: {text: [(bbox, english), ...]}}
+        for unit in record.get("units", []):
+            self._pages.setdefault(unit["page"], {}).setdefault(unit["text"], []).append(
+                (unit["bbox"], unit["english"])
+            )
+
+    def page_units(self, page: int) -> list:
+        """Record entries of one page, to carry forward when the page is not re-extracted"""
+        return [
+            {"page": page, "text": text, "bbox": bbox, "english": english}
+            for text, entries in self._pages.get(page, {}).items()
+            for bbox, english in entries
+        ]
+
+    @classmethod
+    def load(cls, path: str):
+        """Load a revision record, or None if there is none"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def diff(self, text_elements, units):
+        """
+        Match new units against the previous revision
+
+        Args:
+            text_elements: Newly extracted elements
+            units: Index lists still needing a translation
+
+        Returns:
+            ({unit position in units: english} for reusable units,
+             counts of unchanged / moved / changed / added / removed units)
+        """
+        reused = {}
+        counts = {"unchanged": 0, "moved": 0, "changed": 0, "added": 0, "removed": 0}
+        claimed = set()  # (page, text, index) of old units already paired
+        unmatched = []
+
+        for pos, unit in enumerate(units):
+            lines = [text_elements[idx] for idx in unit]
+            page = lines[0].page
+            text = normalize_text(" ".join(line.text for line in lines))
+            bbox = _unit_bbox(lines)
+            cx, cy = _centre(bbox)
+
+            # Nearest unclaimed old unit with the same text on the same page
+            best = None
+            for old_idx, (old_bbox, english) in enumerate(self._pages.get(page, {}).get(text, [])):
+                if (page, text, old_idx) in claimed:
+                    continue
+                ox, oy = _centre(old_bbox)
+                distance = max(abs(ox - cx), abs(oy - cy))
+                if best is None or distance < best[0]:
+                    best = (distance, old_idx, english)
+
+            if best is None:
+                unmatched.append((page, bbox))
+                continue
+            claimed.add((page, text, best[1]))
+            reused[pos] = best[2]
+            counts["unchanged" if best[0] <= POSITION_TOLERANCE else "moved"] += 1
+
+        # Old units left over (on the pages being diffed) were edited or removed
+        pages = {elem.page for elem in text_elements}
+        leftovers = [
+            (page, old_bbox)
+            for page, texts in self._pages.items() if page in pages
+            for text, entries in texts.items()
+            for old_idx, (old_bbox, _) in enumerate(entries)
+            if (page, text, old_idx) not in claimed
+        ]
+        replaced = set()
+        for page, bbox in unmatched:
+            hit = next((i for i, (old_page, old_bbox) in enumerate(leftovers)
+                        if i not in replaced and old_page == page and _overlaps(bbox, old_bbox)), None)
+            if hit is None:
+                counts["added"] += 1
+            else:
+                replaced.add(hit)
+                counts["changed"] += 1
+        counts["removed"] = len(leftovers) - len(replaced)
+
+        return reused, counts
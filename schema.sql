@@ -17,13 +17,24 @@ CREATE TABLE IF NOT EXISTS translations (
     -- Translation metadata
     input_tokens INTEGER NOT NULL DEFAULT 0,
     output_tokens INTEGER NOT NULL DEFAULT 0,
-    total_tokens INTEGER GENERATED ALWAYS AS (input_tokens + output_tokens) STORED,
+    cache_creation_input_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_read_input_tokens INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER GENERATED ALWAYS AS (
+        input_tokens + output_tokens + cache_creation_input_tokens + cache_read_input_tokens
+    ) STORED,
 
-    -- Cost tracking (Haiku 4.5 pricing: $0.80/1M input, $4.00/1M output)
-    cost_input_usd DECIMAL(10, 4) GENERATED ALWAYS AS ((input_tokens::DECIMAL / 1000000) * 0.80) STORED,
+    -- Cost tracking (Haiku 4.5 pricing: $0.80/1M input, $4.00/1M output;
+    -- prompt cache writes at 1.25x and reads at 0.1x the input price)
+    cost_input_usd DECIMAL(10, 4) GENERATED ALWAYS AS (
+        ((input_tokens::DECIMAL / 1000000) * 0.80) +
+        ((cache_creation_input_tokens::DECIMAL / 1000000) * 1.00) +
+        ((cache_read_input_tokens::DECIMAL / 1000000) * 0.08)
+    ) STORED,
     cost_output_usd DECIMAL(10, 4) GENERATED ALWAYS AS ((output_tokens::DECIMAL / 1000000) * 4.00) STORED,
     cost_total_usd DECIMAL(10, 4) GENERATED ALWAYS AS (
         ((input_tokens::DECIMAL / 1000000) * 0.80) +
+        ((cache_creation_input_tokens::DECIMAL / 1000000) * 1.00) +
+        ((cache_read_input_tokens::DECIMAL / 1000000) * 0.08) +
         ((output_tokens::DECIMAL / 1000000) * 4.00)
     ) STORED,
 
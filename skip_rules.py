@@ -0,0 +1,133 @@
+"""Rule-driven classifier for text that is left untranslated (numbers, units, codes)"""
+import json
+import os
+import re
+import threading
+from placeholders import REFERENCE_CODE, SHEET_NUMBER, UNITS
+
+# Extra rules appended to SKIP_RULES, as a JSON list in the same format (override with SKIP_RULES_FILE)
+SKIP_RULES_FILE = os.environ.get("SKIP_RULES_FILE", "skip_rules.json")
+
+# Material codes of the finish schedules ("ac", "pvb", ...)
+MATERIAL_CODES = ('ac', 'aci', 'al', 'ar', 'asp', 'bo', 'br', 'bv', 'bz',
+                  'ca', 'cc', 'cf', 'cg', 'ci', 'cp', 'cr', 'cs', 'ct', 'cu', 'cv',
+                  'ea', 'ec', 'ei', 'pbo', 'pfs', 'pi', 'pla', 'prt', 'ps', 'pt', 'pvb',
+                  'rm', 'rv', 'st', 'ta', 'tc', 'te', 'ti', 'tm', 'tn', 'tep', 'tr',
+                  'vac', 'vc', 'vcr')
+
+# Punctuation ignored around unit abbreviations ("MM.", "(TYP)")
+UNIT_PUNCTUATION = '.,;:()[]{}!?-'
+
+# Skip rules, checked in order. Each rule has a "reason" and either
+#   "words": texts to skip, compared after "key" normalization
+#            ("upper_stripped": uppercased, UNIT_PUNCTUATION stripped; "lower"; "exact")
+#   "pattern": regex the whole text must match ("ignore_case" for re.IGNORECASE)
+# plus optional conditions "max_length" (characters) and "lowercase" (the
+# text must not be all caps, so "AC" is a word while "ac" is a code).
+SKIP_RULES = (
+    {"reason": "unit", "words": sorted(UNITS), "key": "upper_stripped"},
+    {"reason": "short_code", "pattern": r".*\d.*", "max_length": 4, "lowercase": True},  # "1a", "2b"
+    {"reason": "material_code", "words": MATERIAL_CODES, "key": "lower", "max_length": 4, "lowercase": True},
+    {"reason": "reference_code", "pattern": REFERENCE_CODE, "ignore_case": True},  # "PL1", "G485"
+    {"reason": "sheet_number", "pattern": SHEET_NUMBER, "ignore_case": True},  # "A-505"
+)
+
+# Checked ahead of SKIP_RULES
+BUILTIN_RULES = (
+    {"reason": "empty", "pattern": r"\s*"},
+    {"reason": "no_letters", "pattern": None},  # Filled in by _no_letters_pattern()
+)
+
+# Process-wide classifier compiled on first use
+_default_classifier = None
+_default_lock = threading.Lock()
+
+
+def load_rules(path: str = None):
+    """SKIP_RULES plus the rules of the JSON rule file, if there is one"""
+    rules = list(SKIP_RULES)
+    path = path or SKIP_RULES_FILE
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            rules.extend(json.load(f))
+    return rules
+
+
+def _no_letters_pattern() -> str:
+    """
+    Regex for text without letters (str.isalpha)
+
+    \\w also covers numeric characters such as "²" or "½" that are not
+    letters, so those are listed explicitly next to digits and underscore.
+    """
+    numeric = "".join(chr(c) for c in range(0x10000) if chr(c).isalnum() and not chr(c).isalpha()
+                      and not chr(c).isdecimal())
+    return f"(?:\\W|[\\d_{re.escape(numeric)}])*"
+
+
+def _rule_pattern(rule: dict) -> str:
+    """One rule as a regex matching the whole text (conditions as lookaheads)"""
+    if rule["reason"] == "no_letters" and rule["pattern"] is None:
+        body = _no_letters_pattern()
+    elif "words" in rule:
+        words = "|".join(map(re.escape, sorted(set(rule["words"]), key=len, reverse=True)))
+        key = rule.get("key", "exact")
+        if key == "upper_stripped":
+            punctuation = f"[{re.escape(UNIT_PUNCTUATION)}]*"
+            body = f"{punctuation}(?i:{words}){punctuation}"
+        elif key == "lower":
+            body = f"(?i:{words})"
+        else:
+            body = f"(?:{words})"
+    elif rule.get("ignore_case"):
+        body = f"(?i:{rule['pattern']})"
+    else:
+        body = f"(?:{rule['pattern']})"
+
+    guards = ""
+    if rule.get("max_length"):
+        guards += f"(?=.{{1,{int(rule['max_length'])}}}$)"
+    if rule.get("lowercase"):
+        guards += r"(?=.*[^\W\d_A-ZÀ-ÖØ-Þ])"
+    return guards + body
+
+
+class SkipClassifier:
+    """
+    Skip rules compiled once into a single alternation regex
+
+    Each rule (word list or pattern) is one named branch, tried in rule
+    order, so the branch that matches names the skip reason and every text
+    costs a single anchored match, with no per-rule Python checks.
+    """
+
+    def __init__(self, rules=SKIP_RULES):
+        rules = list(BUILTIN_RULES) + list(rules)
+        self._reasons = {f"r{i}": rule["reason"] for i, rule in enumerate(rules)}
+        alternation = "|".join(f"(?P<r{i}>{_rule_pattern(rule)})" for i, rule in enumerate(rules))
+        self._match = re.compile(f"(?:{alternation})$").match
+
+    def classify(self, text: str):
+        """Skip reason for one text, or None if it should be translated"""
+        match = self._match(text.replace("\n", " "))
+        return self._reasons[match.lastgroup] if match else None
+
+    def classify_all(self, texts):
+        """
+        Skip reasons for many texts (e.g. one page's elements) at once
+
+        Returns:
+            List of skip reasons (None = translate), aligned with texts
+        """
+        reasons = self._reasons.get
+        return [reasons(match.lastgroup) if match else None
+                for match in map(self._match, (text.replace("\n", " ") for text in texts))]
+
+
+def get_default_classifier() -> SkipClassifier:
+    """Return the process-wide SkipClassifier for SKIP_RULES and SKIP_RULES_FILE"""
+    global _default_classifier
+    with _default_lock:
+        if _default_classifier is None:
+            _default_classifier = SkipClassifier(load_rules())
+        return _default_classifier
@@ -0,0 +1,124 @@
+"""Sorted string tables in one memory-mapped file, for read-only lookups shared between processes"""
+import bisect
+import mmap
+import os
+import struct
+import threading
+
+# File signature and layout version
+MAGIC = b"PDTSTR01"
+
+# Header: magic, table count; then per table: entry count, offset of its entry array
+_HEADER = struct.Struct("<8sI")
+_TABLE = struct.Struct("<IQ")
+
+# Entry: key start, value start (= key end), value end; offsets are absolute
+_ENTRY = struct.Struct("<QQQ")
+
+
+def write_string_tables(path: str, tables) -> None:
+    """
+    Write {key: value} string mappings as sorted tables (written atomically)
+
+    Args:
+        path: Output file
+        tables: List of dicts of str → str, addressed by position when read back
+    """
+    header_size = _HEADER.size + _TABLE.size * len(tables)
+    table_headers = []
+    entry_arrays = []
+    blobs = []
+    offset = header_size + sum(_ENTRY.size * len(table) for table in tables)
+
+    for table in tables:
+        items = sorted((key.encode('utf-8'), value.encode('utf-8')) for key, value in table.items())
+        entries = []
+        for key, value in items:
+            entries.append(_ENTRY.pack(offset, offset + len(key), offset + len(key) + len(value)))
+            blobs.append(key)
+            blobs.append(value)
+            offset += len(key) + len(value)
+        table_headers.append((len(items), entries))
+
+    entry_offset = header_size
+    for count, entries in table_headers:
+        entry_arrays.append(_TABLE.pack(count, entry_offset))
+        entry_offset += _ENTRY.size * count
+
+    tmp_path = path + f".{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, len(tables)))
+        f.writelines(entry_arrays)
+        for _, entries in table_headers:
+            f.writelines(entries)
+        f.writelines(blobs)
+    os.replace(tmp_path, path)
+
+
+class _SortedKeys:
+    """Sequence view of one table's keys, so bisect can search the map in place"""
+
+    def __init__(self, buffer, count, entry_offset):
+        self._buffer = buffer
+        self._count = count
+        self._entry_offset = entry_offset
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        key_start, value_start, _ = _ENTRY.unpack_from(self._buffer, self._entry_offset + i * _ENTRY.size)
+        return self._buffer[key_start:value_start]
+
+
+class StringTable:
+    """
+    Read-only view of one table of a string table file
+
+    Lookups are a binary search over the mapped file, so nothing is parsed
+    at start-up and every process reading the same file shares its pages.
+    """
+
+    def __init__(self, buffer, count, entry_offset):
+        self._buffer = buffer
+        self._keys = _SortedKeys(buffer, count, entry_offset)
+        self._entry_offset = entry_offset
+
+    def __len__(self):
+        return len(self._keys)
+
+    def get(self, key: str, default=None):
+        encoded = key.encode('utf-8')
+        i = bisect.bisect_left(self._keys, encoded)
+        if i == len(self._keys) or self._keys[i] != encoded:
+            return default
+        _, value_start, value_end = _ENTRY.unpack_from(self._buffer, self._entry_offset + i * _ENTRY.size)
+        return self._buffer[value_start:value_end].decode('utf-8')
+
+
+class StringTableFile:
+    """String table file mapped into memory on first access"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._tables = None
+        self._lock = threading.Lock()
+
+    def table(self, index: int) -> StringTable:
+        """Table by position (as passed to write_string_tables)"""
+        if self._tables is None:
+            with self._lock:
+                if self._tables is None:
+                    self._tables = self._open()
+        return self._tables[index]
+
+    def _open(self):
+        with open(self.path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a string table file")
+        return [
+            StringTable(buffer, *_TABLE.unpack_from(buffer, _HEADER.size + i * _TABLE.size))
+            for i in range(count)
+        ]
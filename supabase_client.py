@@ -69,7 +69,9 @@ class SupabaseHelper:
         output_tokens: int,
         file_size_bytes: Optional[int] = None,
         status: str = "completed",
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0
     ) -> Dict[str, Any]:
         """
         Log a translation job to the database
@@ -78,11 +80,13 @@ class SupabaseHelper:
             user_id: UUID of the user
             original_filename: Original French PDF filename
             translated_filename: Translated English PDF filename
-            input_tokens: Number of input tokens used
+            input_tokens: Number of input tokens used (excluding prompt cache)
             output_tokens: Number of output tokens used
             file_size_bytes: Size of original file in bytes
             status: Status of translation (processing, completed, failed)
             error_message: Error message if failed
+            cache_creation_input_tokens: Prompt cache writes (billed at 1.25x input)
+            cache_read_input_tokens: Prompt cache reads (billed at 0.1x input)
 
         Returns:
             Dict with the created translation record
@@ -93,6 +97,8 @@ class SupabaseHelper:
             "translated_filename": translated_filename,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
+            "cache_creation_input_tokens": cache_creation_input_tokens,
+            "cache_read_input_tokens": cache_read_input_tokens,
             "status": status,
         }
 
@@ -0,0 +1,35 @@
+"""Compact text element shared by extraction, translation and rendering"""
+
+
+class TextElement:
+    """
+    One merged run of text on a page
+
+    Uses __slots__ with the bounding box stored as four floats, so an element
+    costs a fixed handful of pointers instead of a dict plus a bbox list.
+    Extraction, span merging, translation and rendering all update the same
+    object in place; nothing is copied along the way.
+    """
+
+    __slots__ = ("page", "text", "x0", "y0", "x1", "y1", "size", "color", "block", "paragraph",
+                 "cell", "translated", "type")
+
+    def __init__(self, page, text, bbox, size, color=0, block=None, paragraph=None, cell=None):
+        self.page = page
+        self.text = text
+        self.x0, self.y0, self.x1, self.y1 = bbox
+        self.size = size
+        self.color = color
+        self.block = block          # PyMuPDF text block number on the page
+        self.paragraph = paragraph  # Paragraph id shared by wrapped lines (None = standalone)
+        self.cell = cell            # (table, row, column) in table mode, else None
+        self.translated = None      # English text once resolved
+        self.type = None            # "skip", "memory", "haiku", ...
+
+    @property
+    def bbox(self):
+        """Bounding box as an (x0, y0, x1, y1) tuple"""
+        return (self.x0, self.y0, self.x1, self.y1)
+
+    def __repr__(self):
+        return f"TextElement(page={self.page}, text={self.text!r}, bbox={self.bbox})"
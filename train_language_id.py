@@ -0,0 +1,165 @@
+"""
+Train the French / English / code language identifier offline
+- Pairs the hash-keyed archive/*_translations.json files with their
+  *_pending_translations.json sources (hash → French), and adds the
+  legacy and JSON dictionaries (only which side is French matters here)
+- French sides are "fr", English sides that differ from the French are
+  "en", and unchanged strings made of codes (every word has a digit or is
+  at most 3 letters) are "code"
+- Cross-validates the bypass thresholds: how much held-out French would be
+  bypassed (should be 0) and how much English is caught
+- Writes LANGUAGE_MODEL (JSON), loaded by language_id.py
+
+USAGE:
+    python train_language_id.py
+    python train_language_id.py --margin 0.5 --min-letters 12 --folds 5
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import random
+from build_dictionary_index import LEGACY_DICTIONARIES, load_literal_dict
+from dictionary_tier import load_dictionary_entries
+from language_id import LANGUAGE_MODEL, LANGUAGE_MODEL_FORMAT, LanguageIdentifier, ngrams, strip_codes
+
+# Features and smoothing
+NGRAM = 3
+SMOOTHING = 0.5
+MIN_COUNT = 2   # N-grams seen fewer times across all classes are dropped
+
+CLASSES = ["fr", "en", "code"]
+
+# JSON dictionaries read for their language sides only, so misaligned pairs still label correctly
+TRAINING_DICTIONARIES = "archive/method12_data/translations.json"
+
+
+def load_pairs():
+    """(french, english) pairs from the archived translation files and dictionaries"""
+    pairs = []
+    for path in sorted(glob.glob("archive/*_translations.json")):
+        if path.endswith("_pending_translations.json"):
+            continue
+        source_path = path.replace("_translations.json", "_pending_translations.json")
+        if not os.path.exists(source_path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            english = json.load(f)
+        with open(source_path, 'r', encoding='utf-8') as f:
+            french = json.load(f)
+        pairs.extend((french[key], english[key]) for key in english if key in french)
+
+    for path in LEGACY_DICTIONARIES:
+        if os.path.exists(path):
+            pairs.extend(load_literal_dict(path).items())
+    pairs.extend(load_dictionary_entries(TRAINING_DICTIONARIES).items())
+    return pairs
+
+
+def is_code(text: str) -> bool:
+    """Every word carries a digit or punctuation, or is at most 3 letters"""
+    return all(not word.isalpha() or len(word) <= 3 for word in text.split())
+
+
+def label_pairs(pairs):
+    """{class: sorted distinct texts}"""
+    labelled = {name: set() for name in CLASSES}
+    for french, english in pairs:
+        if not isinstance(english, str):
+            continue
+        french = " ".join(french.split())
+        english = " ".join(english.split())
+        if not any(c.isalpha() for c in french):
+            continue
+        if french.casefold() == english.casefold():
+            # Unchanged: codes are safe to label, words may be untranslated French
+            if any(c.isdigit() for c in french) and is_code(french):
+                labelled["code"].add(french)
+            continue
+        labelled["fr"].add(french)
+        if english:
+            labelled["en"].add(english)
+    labelled["en"] -= labelled["fr"]
+    return {name: sorted(texts) for name, texts in labelled.items()}
+
+
+def train(labelled, n=NGRAM, smoothing=SMOOTHING, min_count=MIN_COUNT):
+    """{ngram: [log P(ngram | class)]} with add-smoothing"""
+    counts = {name: {} for name in CLASSES}
+    for name, texts in labelled.items():
+        for text in texts:
+            for gram in ngrams(strip_codes(text), n):
+                counts[name][gram] = counts[name].get(gram, 0) + 1
+
+    vocabulary = {gram for name in CLASSES for gram in counts[name]}
+    vocabulary = {gram for gram in vocabulary if sum(counts[name].get(gram, 0) for name in CLASSES) >= min_count}
+    totals = {name: sum(counts[name].get(gram, 0) for gram in vocabulary) for name in CLASSES}
+    return {
+        gram: [round(math.log((counts[name].get(gram, 0) + smoothing) / (totals[name] + smoothing * len(vocabulary))), 3)
+               for name in CLASSES]
+        for gram in vocabulary
+    }
+
+
+def build_model(log_probs, min_letters, margin):
+    return {
+        "format": LANGUAGE_MODEL_FORMAT,
+        "classes": CLASSES,
+        "ngram": NGRAM,
+        "min_letters": min_letters,
+        "margin": margin,
+        "log_probs": log_probs
+    }
+
+
+def cross_validate(labelled, folds, min_letters, margin):
+    """{true class: {bypass class or "kept": count}} over held-out folds, plus wrongly bypassed French"""
+    items = [(name, text) for name in CLASSES for text in labelled[name]]
+    random.Random(0).shuffle(items)
+    results = {name: {} for name in CLASSES}
+    leaked = []
+    for fold in range(folds):
+        training = {name: [] for name in CLASSES}
+        for i, (name, text) in enumerate(items):
+            if i % folds != fold:
+                training[name].append(text)
+        identifier = LanguageIdentifier(build_model(train(training), min_letters, margin))
+        for name, text in items[fold::folds]:
+            verdict = identifier.bypass(text) or "kept"
+            results[name][verdict] = results[name].get(verdict, 0) + 1
+            if name == "fr" and verdict != "kept":
+                leaked.append(text)
+    return results, leaked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the language identifier used to bypass non-French text")
+    parser.add_argument("--output", default=LANGUAGE_MODEL, help="Model file to write")
+    parser.add_argument("--margin", type=float, default=0.5, help="Per-n-gram log-likelihood margin over French")
+    parser.add_argument("--min-letters", type=int, default=12, help="Shorter texts are never bypassed")
+    parser.add_argument("--folds", type=int, default=5, help="Cross-validation folds (0 to skip)")
+    args = parser.parse_args()
+
+    labelled = label_pairs(load_pairs())
+    print("Training texts: " + ", ".join(f"{len(labelled[name])} {name}" for name in CLASSES))
+
+    if args.folds:
+        results, leaked = cross_validate(labelled, args.folds, args.min_letters, args.margin)
+        for name in CLASSES:
+            total = sum(results[name].values())
+            bypassed = total - results[name].get("kept", 0)
+            print(f"   Held-out {name}: {bypassed}/{total} bypassed {results[name]}")
+        for text in leaked[:10]:
+            print(f"      French bypassed: {text!r}")
+
+    model = build_model(train(labelled), args.min_letters, args.margin)
+    tmp_path = args.output + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(model, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    os.replace(tmp_path, args.output)
+    print(f"Wrote {args.output}: {len(model['log_probs'])} n-grams ({os.path.getsize(args.output) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,191 +1,1005 @@
 """
-100% Haiku Translation Test
-- NO dictionary lookup
-- NO indexed files
-- EVERYTHING gets translated by Haiku 4.5
+Haiku Translation Test
+- Numbers, units, codes and confidently non-French text are kept as is
+- Every other string goes through a tiered resolver, cheapest first:
+  previous revision of the drawing, opt-in local dictionary, SQLite
+  translation memory, then Haiku 4.5 for whatever is left
+- Whole pages already translated can come from the page cache
 - Purpose: Identify source of translation gaps
 """
+import argparse
 import fitz
+import hashlib
+import json
+import multiprocessing
 import os
 import sys
 import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from anthropic_translator import translate_batch
+from anthropic_translator import (CACHE_USAGE_KEYS, MAX_CONCURRENCY, MODEL, WIRE_FORMAT, build_system_prompt,
+                                  estimate_cost, estimate_request_tokens, load_glossary, set_request_limiter,
+                                  translate_batch)
+from dictionary_tier import dictionary_sources, get_default_dictionary
+from language_id import LANGUAGE_MODEL, get_default_identifier
+from extraction_cache import cache_key, file_hash, load_elements, save_elements
+from page_cache import load_page_units, lookup_pages, replace_page, save_page
+from placeholders import MASK_PATTERN, fill, has_words, mask, placeholders_intact
+from revisions import PreviousRevision, revision_path, revision_units, save_revision
+from skip_rules import SKIP_RULES_FILE, get_default_classifier
+from text_element import TextElement
+from translation_memory import get_default_memory, normalize_text
 
 # Folders
 TRANSLATED_FOLDER = "translated_pdfs"
 
+# Bump when extract_page/merge_text_spans change their output, to invalidate cached extractions
+EXTRACTION_VERSION = 4
+
+# Line building thresholds for merge_text_spans (PDF points)
+MERGE_SETTINGS = {
+    "baseline_tolerance": 2.0,  # max baseline difference within one line
+    "min_gap": -1.0,            # overlap allowed between neighbouring spans
+    "max_gap": 5.0,             # widest horizontal gap still merged
+    "space_gap": 0.5            # gaps wider than this are joined with a space
+}
+
+# Wrapped-line detection for paragraph reconstruction
+PARAGRAPH_SETTINGS = {
+    "enabled": True,
+    "size_tolerance": 0.5,     # Same font size (pt)
+    "indent_tolerance": 3.0,   # Same left edge (pt)
+    "max_line_pitch": 1.6,     # Baseline-to-baseline distance, in multiples of the font size
+    "min_fill": 0.7,           # A wrapped line spans at least this share of the widest line
+    "min_chars": 25            # ...and is long enough to be prose rather than a label
+}
+
+# Table mode: which detected tables count as schedules
+TABLE_SETTINGS = {
+    "min_rows": 3,
+    "min_cols": 3,
+    "max_page_share": 0.5      # Larger "tables" are the sheet frame / title block
+}
+
+# Sheets whose file name contains this get table mode automatically
+SCHEDULE_SHEET_MARKER = "BORDEREAU"
+
 def should_skip(text):
-    """Skip empty, numbers only, units, acronyms, technical codes"""
-    if not text or not text.strip():
-        return True
-
-    # Skip if no letters (pure numbers, symbols, etc.)
-    if not any(c.isalpha() for c in text):
-        return True
-
-    # Skip common units and measurement abbreviations
-    units = {'MM', 'CM', 'M', 'KG', 'LB', 'FT', 'IN', 'SQ', 'MIN', 'MAX', 'NO', 'QTY', 'TYP', 'REF',
-             'GA', 'CAL', 'PSI', 'KPA', 'MPH', 'KPH', 'DEG', 'TEMP', 'DIA', 'THK', 'EA'}
-    if text.upper().strip('.,;:()[]{}!?-') in units:
-        return True
-
-    # Skip material codes ONLY if they match specific patterns
-    if len(text) <= 4 and not text.isupper():
-        # Skip only if it has numbers (like "1a", "2b")
-        if any(c.isdigit() for c in text):
-            return True
-        # Skip ONLY known material code patterns
-        material_codes = {'ac', 'aci', 'al', 'ar', 'asp', 'bo', 'br', 'bv', 'bz',
-                         'ca', 'cc', 'cf', 'cg', 'ci', 'cp', 'cr', 'cs', 'ct', 'cu', 'cv',
-                         'ea', 'ec', 'ei', 'pbo', 'pfs', 'pi', 'pla', 'prt', 'ps', 'pt', 'pvb',
-                         'rm', 'rv', 'st', 'ta', 'tc', 'te', 'ti', 'tm', 'tn', 'tep', 'tr',
-                         'vac', 'vc', 'vcr'}
-        if text.lower() in material_codes:
-            return True
-
-    # Skip reference codes like "PL1", "MF2", "A-505", "G485"
-    import re
-    if re.match(r'^[A-Z]{1,3}\d+[a-z]?$', text, re.IGNORECASE):
-        return True
-    if re.match(r'^[A-Z]-\d+[a-z]?$', text, re.IGNORECASE):
-        return True
-
-    return False
-
-def merge_text_spans(spans):
-    """Merge adjacent text spans"""
+    """Skip empty, numbers only, units, acronyms, technical codes (see skip_rules.py)"""
+    return get_default_classifier().classify(text) is not None
+
+def skip_breakdown(stats):
+    """ " (unit 12, reference_code 40, ...)" from the skip_<reason> counts of a stats dict"""
+    counts = sorted(((key[5:], value) for key, value in stats.items() if key.startswith("skip_") and value),
+                    key=lambda item: -item[1])
+    return f" ({', '.join(f'{reason} {count}' for reason, count in counts)})" if counts else ""
+
+def merge_text_spans(spans, baseline_tolerance=None, min_gap=None, max_gap=None, space_gap=None):
+    """
+    Build lines from text spans (in place: merged spans absorb their neighbours)
+
+    Spans are swept in baseline order and grouped into rows whose baselines
+    (bbox bottom) lie within baseline_tolerance of the row's first span; each
+    row is then ordered left to right and neighbours whose horizontal gap
+    falls in [min_gap, max_gap] are joined. Grouping the whole page by
+    baseline first means spans from interleaved columns no longer break each
+    other's lines apart. O(n log n) in the number of spans.
+
+    Args:
+        spans: TextElements of one page
+        baseline_tolerance / min_gap / max_gap / space_gap: Override MERGE_SETTINGS
+
+    Returns:
+        Merged TextElements, top to bottom then left to right
+    """
     if not spans:
         return []
 
-    spans.sort(key=lambda s: (round(s["bbox"][1], 1), s["bbox"][0]))
+    baseline_tolerance = MERGE_SETTINGS["baseline_tolerance"] if baseline_tolerance is None else baseline_tolerance
+    min_gap = MERGE_SETTINGS["min_gap"] if min_gap is None else min_gap
+    max_gap = MERGE_SETTINGS["max_gap"] if max_gap is None else max_gap
+    space_gap = MERGE_SETTINGS["space_gap"] if space_gap is None else space_gap
+
+    # Sweep by baseline into rows
+    spans.sort(key=lambda s: s.y1)
+    rows = []
+    row_baseline = None
+    for span in spans:
+        if row_baseline is None or span.y1 - row_baseline > baseline_tolerance:
+            rows.append([])
+            row_baseline = span.y1
+        rows[-1].append(span)
 
+    # Merge horizontal neighbours within each row
     merged = []
-    current = spans[0].copy()
-    current["bbox"] = list(current["bbox"])
+    for row in rows:
+        row.sort(key=lambda s: s.x0)
+        current = row[0]
+        for next_span in row[1:]:
+            x_gap = next_span.x0 - current.x1
+            if min_gap <= x_gap <= max_gap:
+                if x_gap > space_gap:
+                    current.text += " " + next_span.text
+                else:
+                    current.text += next_span.text
+                current.x1 = max(current.x1, next_span.x1)
+                current.y0 = min(current.y0, next_span.y0)
+                current.y1 = max(current.y1, next_span.y1)
+            else:
+                merged.append(current)
+                current = next_span
+        merged.append(current)
 
-    for next_span in spans[1:]:
-        same_line = abs(current["bbox"][1] - next_span["bbox"][1]) < 2
-        x_gap = next_span["bbox"][0] - current["bbox"][2]
-        close_horizontal = -1 <= x_gap <= 5
+    merged.sort(key=lambda s: (round(s.y0, 1), s.x0))
+    return merged
 
-        if same_line and close_horizontal:
-            if x_gap > 0.5:
-                current["text"] += " " + next_span["text"]
-            else:
-                current["text"] += next_span["text"]
-            current["bbox"][2] = max(current["bbox"][2], next_span["bbox"][2])
-        else:
-            merged.append(current)
-            current = next_span.copy()
-            current["bbox"] = list(current["bbox"])
+def _is_caps(text):
+    """True for upper-case text, allowing a few lower-case units such as mm"""
+    letters = [c for c in text if c.isalpha()]
+    return sum(c.islower() for c in letters) * 5 <= len(letters)
+
+def build_paragraphs(lines, group=lambda line: line.block, first_id=0):
+    """
+    Tag wrapped lines of the same text block with a shared paragraph id
+
+    A line continues the paragraph above it when both come from the same
+    group (PyMuPDF block, or table cell in table mode), share font size and
+    left edge, have baselines no further apart than max_line_pitch, and the
+    line above is long prose that fills most of the group's width (i.e. it
+    wrapped rather than ended). In mixed-case text a line starting with a
+    capital starts a new entry. Short stacked labels such as legend entries
+    stay standalone.
+
+    Args:
+        lines: Merged TextElements of one page (paragraph set in place)
+        group: Key lines must share to be joined (None = never joined)
+        first_id: Paragraph id to start numbering from
+
+    Returns:
+        Number of paragraphs found
+    """
+    size_tolerance = PARAGRAPH_SETTINGS["size_tolerance"]
+    indent_tolerance = PARAGRAPH_SETTINGS["indent_tolerance"]
+
+    blocks = {}
+    for line in lines:
+        key = group(line)
+        if key is not None:
+            blocks.setdefault(key, []).append(line)
+
+    paragraph_count = 0
+    for block_lines in blocks.values():
+        if len(block_lines) < 2:
+            continue
+        block_lines.sort(key=lambda l: l.y0)
+        widest = max(l.x1 - l.x0 for l in block_lines)
+
+        run = [block_lines[0]]
+        for line in block_lines[1:] + [None]:
+            prev = run[-1]
+            continues = (
+                line is not None
+                and abs(line.size - prev.size) <= size_tolerance
+                and abs(line.x0 - prev.x0) <= indent_tolerance
+                and 0 < line.y1 - prev.y1 <= PARAGRAPH_SETTINGS["max_line_pitch"] * prev.size
+                and prev.x1 - prev.x0 >= PARAGRAPH_SETTINGS["min_fill"] * widest
+                and len(prev.text) >= PARAGRAPH_SETTINGS["min_chars"]
+                and not (line.text[:1].isupper() and not _is_caps(prev.text))
+            )
+            if continues:
+                run.append(line)
+                continue
+            if len(run) > 1:
+                for member in run:
+                    member.paragraph = first_id + paragraph_count
+                paragraph_count += 1
+            run = [line]
+
+    return paragraph_count
+
+def flow_text(text, lines):
+    """
+    Split a translated paragraph back across its original line boxes
+
+    Words are laid out greedily, filling each line to about its own width.
+    When the translation is longer than the lines can hold, every width is
+    scaled up by the same factor so the overflow spreads over all boxes
+    instead of piling into the last one, which takes whatever is left.
+
+    Args:
+        text: Translated paragraph
+        lines: The paragraph's TextElements, top to bottom
+
+    Returns:
+        One string per line (trailing lines may be empty)
+    """
+    words = text.split()
+    if len(lines) == 1:
+        return [" ".join(words)]
+
+    space = fitz.get_text_length(" ", fontsize=lines[0].size)
+    widths = [fitz.get_text_length(word, fontsize=lines[0].size) for word in words]
+    capacity = sum(line.x1 - line.x0 for line in lines)
+    needed = sum(widths) + space * max(len(words) - 1, 0)
+    scale = max(needed / capacity, 1.0) if capacity > 0 else 1.0
+
+    result = []
+    pos = 0
+    for line in lines[:-1]:
+        target = (line.x1 - line.x0) * scale
+        start = pos
+        width = 0.0
+        while pos < len(words):
+            added = widths[pos] + (space if pos > start else 0)
+            # Stop at whichever side of the target width is closer
+            if pos > start and width + added - target > target - width:
+                break
+            width += added
+            pos += 1
+        result.append(" ".join(words[start:pos]))
+    result.append(" ".join(words[pos:]))
+    return result
+
+def is_schedule_sheet(pdf_path):
+    """Schedule sheets (BORDEREAU in the file name), extracted in table mode with --tables auto"""
+    return SCHEDULE_SHEET_MARKER in Path(pdf_path).name.upper()
+
+def find_schedule_tables(page):
+    """
+    Tables on a page that look like schedules
+
+    Uses PyMuPDF table detection, dropping the sheet frame (anything covering
+    more than max_page_share of the page) and grids too small to be a table.
+    """
+    page_area = page.rect.width * page.rect.height
+    return [
+        table for table in page.find_tables().tables
+        if table.row_count >= TABLE_SETTINGS["min_rows"]
+        and table.col_count >= TABLE_SETTINGS["min_cols"]
+        and fitz.Rect(table.bbox).get_area() <= TABLE_SETTINGS["max_page_share"] * page_area
+    ]
+
+def locate_cell(tables, x, y):
+    """(table, row, column) of the cell containing a point, or None"""
+    for table_idx, table in enumerate(tables):
+        tx0, ty0, tx1, ty1 = table.bbox
+        if not (tx0 <= x <= tx1 and ty0 <= y <= ty1):
+            continue
+        for row_idx, row in enumerate(table.rows):
+            if not (row.bbox[1] <= y <= row.bbox[3]):
+                continue
+            for col_idx, cell in enumerate(row.cells):
+                if cell is not None and cell[0] <= x <= cell[2] and cell[1] <= y <= cell[3]:
+                    return (table_idx, row_idx, col_idx)
+    return None
+
+def extract_page(page, page_num, fragment_counts=None, tables=False):
+    """
+    Extract and merge the text spans of one page
+
+    In table mode, spans inside schedule table cells are merged per cell,
+    so neighbouring cells are never glued together, and each line is tagged
+    with its (table, row, column). Wrapped text inside a cell is joined the
+    same way as paragraphs and written back cell by cell.
+
+    Args:
+        page: fitz page
+        page_num: Page index stored on each element
+        fragment_counts: Optional list that receives (spans, merged elements)
+        tables: Detect schedule tables and extract them cell by cell
+    """
+    blocks = page.get_text("dict")["blocks"]
+
+    page_spans = []
+    for block in blocks:
+        if block.get("type") == 0:
+            for line in block.get("lines", []):
+                for span in line.get("spans", []):
+                    text = span.get("text", "").strip()
+                    if text:
+                        page_spans.append(TextElement(
+                            page_num,
+                            text,
+                            span["bbox"],
+                            span["size"],
+                            span.get("color", 0),
+                            block.get("number")
+                        ))
+
+    span_count = len(page_spans)
+    cell_spans = {}
+    if tables:
+        schedule_tables = find_schedule_tables(page)
+        if schedule_tables:
+            free_spans = []
+            for span in page_spans:
+                cell = locate_cell(schedule_tables, (span.x0 + span.x1) / 2, (span.y0 + span.y1) / 2)
+                if cell is None:
+                    free_spans.append(span)
+                else:
+                    cell_spans.setdefault(cell, []).append(span)
+            page_spans = free_spans
 
-    merged.append(current)
+    merged = merge_text_spans(page_spans)
+    paragraph_count = build_paragraphs(merged) if PARAGRAPH_SETTINGS["enabled"] else 0
+
+    if cell_spans:
+        cell_lines = []
+        for cell, spans in cell_spans.items():
+            for line in merge_text_spans(spans):
+                line.cell = cell
+                cell_lines.append(line)
+        if PARAGRAPH_SETTINGS["enabled"]:
+            build_paragraphs(cell_lines, group=lambda line: line.cell, first_id=paragraph_count)
+        merged.extend(cell_lines)
+        merged.sort(key=lambda s: (round(s.y0, 1), s.x0))
+
+    if fragment_counts is not None:
+        fragment_counts.append((span_count, len(merged)))
     return merged
 
-def extract_text_from_pdf(pdf_path):
-    """Extract all text with positions"""
+def _extract_page_range(pdf_path, start, stop, tables=False):
+    """Extract pages [start, stop) with their own fitz document (safe in a worker process)"""
     doc = fitz.open(pdf_path)
-    all_text = []
+    elements = []
+    timings = []
 
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        blocks = page.get_text("dict")["blocks"]
-
-        page_spans = []
-        for block in blocks:
-            if block.get("type") == 0:
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        text = span.get("text", "").strip()
-                        if text:
-                            page_spans.append({
-                                "text": text,
-                                "bbox": list(span["bbox"]),
-                                "size": span["size"],
-                                "color": span.get("color", 0)
-                            })
-
-        merged = merge_text_spans(page_spans)
-
-        for item in merged:
-            all_text.append({
-                "page": page_num,
-                "text": item["text"],
-                "bbox": item["bbox"],
-                "size": item["size"],
-                "color": item["color"]
-            })
+    for page_num in range(start, stop):
+        page_start = time.perf_counter()
+        counts = []
+        elements.extend(extract_page(doc[page_num], page_num, counts, tables))
+        spans, merged = counts[0]
+        timings.append((page_num, time.perf_counter() - page_start, spans, merged))
 
     doc.close()
-    return all_text
+    return elements, timings
 
-def process_pdf(input_path, output_path, api_key):
-    """Process single PDF with 100% Haiku translation"""
-    print(f"\n{'='*80}")
-    print(f"100% HAIKU TRANSLATION TEST")
-    print(f"Processing: {os.path.basename(input_path)}")
-    print('='*80)
+def extraction_settings(tables=False):
+    """Settings that change extraction output (part of the extraction cache key)"""
+    settings = {"version": EXTRACTION_VERSION, "merge": MERGE_SETTINGS, "paragraphs": PARAGRAPH_SETTINGS}
+    if tables:
+        settings["tables"] = TABLE_SETTINGS
+    return settings
 
-    # Extract text
-    print("Extracting text...")
-    text_elements = extract_text_from_pdf(input_path)
-    print(f"   Found {len(text_elements)} text elements")
+def page_cache_settings(tables=False):
+    """
+    Settings that change a translated page (part of the page cache key)
+
+    Besides extraction and model, this covers the system prompt with the
+    glossary, the wire format, the placeholder rules and the contents of
+    the dictionary, skip rule and language model files, so changing any of
+    them translates the pages again instead of reusing old English.
+    """
+    prompt = json.dumps(build_system_prompt(load_glossary()), sort_keys=True)
+    files = dictionary_sources() + [SKIP_RULES_FILE, LANGUAGE_MODEL]
+    return {
+        "extraction": extraction_settings(tables),
+        "model": MODEL,
+        "prompt": hashlib.sha256(prompt.encode('utf-8')).hexdigest(),
+        "wire_format": WIRE_FORMAT,
+        "placeholders": MASK_PATTERN.pattern,
+        "files": {path: file_hash(path) for path in files if os.path.exists(path)}
+    }
+
+def extract_text_from_pdf(pdf_path, workers=1, page_timings=None, use_cache=True, tables=False):
+    """
+    Extract all text with positions
+
+    Args:
+        pdf_path: PDF to read
+        workers: Processes to split the page ranges across (1 = serial)
+        page_timings: Optional list that receives (page_num, seconds, spans, merged)
+                      per page (left empty when the extraction comes from the cache)
+        use_cache: Reuse/store the extraction in the on-disk extraction cache
+        tables: Extract schedule tables cell by cell (see extract_page)
+
+    Returns:
+        List of text elements in page order
+    """
+    if use_cache:
+        key = cache_key(pdf_path, extraction_settings(tables))
+        cached = load_elements(key)
+        if cached is not None:
+            return cached
+
+    doc = fitz.open(pdf_path)
+    page_count = len(doc)
+    doc.close()
+
+    if workers <= 1 or page_count < 2:
+        results = [_extract_page_range(pdf_path, 0, page_count, tables)]
+    else:
+        # Contiguous page ranges, one fitz document per worker; map() keeps
+        # the ranges in order so the elements come back in page order
+        workers = min(workers, page_count)
+        step = -(-page_count // workers)
+        starts = list(range(0, page_count, step))
+        stops = [min(start + step, page_count) for start in starts]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_extract_page_range, [pdf_path] * len(starts), starts, stops,
+                                        [tables] * len(starts)))
+
+    all_text = []
+    for elements, timings in results:
+        all_text.extend(elements)
+        if page_timings is not None:
+            page_timings.extend(timings)
+
+    if use_cache:
+        save_elements(key, all_text)
+
+    return all_text
+
+def translation_units(text_elements):
+    """
+    Group element indices into translation units
 
-    # Process each element - EVERYTHING goes to Haiku (no dictionary!)
-    needs_translation = {}  # {index: french_text}
-    skipped = 0
+    Lines tagged with the same paragraph (on the same page) form one unit;
+    every other element is a unit of its own.
 
+    Returns:
+        List of index lists, in reading order of each unit's first line
+    """
+    units = {}
     for idx, elem in enumerate(text_elements):
-        text = elem["text"]
+        unit_id = (elem.page, elem.paragraph) if elem.paragraph is not None else idx
+        units.setdefault(unit_id, []).append(idx)
+    return list(units.values())
+
+def unit_text(text_elements, unit):
+    """Normalized French text of one translation unit"""
+    return normalize_text(" ".join(text_elements[idx].text for idx in unit))
+
+def group_translation_requests(text_elements, bypassed=None):
+    """
+    Mark skippable elements and collapse the rest into unique request strings
+
+    Wrapped lines of one paragraph are joined into a single request so the
+    model sees whole sentences. Numbers, dimensions and codes are masked
+    with placeholders (see placeholders.py), and identical templates share
+    one request key, so "Porte 221a" and "Porte 223b" are translated once
+    as "Porte {n1}" and the answer is fanned back out to every unit with
+    its own values afterwards. Text the language identifier is confident
+    is not French (see language_id.py) is kept as is.
+
+    Args:
+        text_elements: Extracted elements
+        bypassed: Optional dict filled with {template: language} for the
+                  non-French text kept as is
 
-        # Skip only numbers/units
-        if should_skip(text):
-            elem["translated"] = text
-            elem["type"] = "skip"
-            skipped += 1
+    Returns:
+        (needs_translation {request_key: french_template},
+         targets {request_key: [unit index lists]},
+         skipped {skip reason: element count})
+    """
+    needs_translation = {}
+    targets = {}
+    key_for_text = {}  # {template: request_key}
+    skipped = Counter()
+
+    units = translation_units(text_elements)
+    texts = [unit_text(text_elements, unit) for unit in units]
+    reasons = get_default_classifier().classify_all(texts)
+    identifier = get_default_identifier()
+    languages = {}  # {template: non-French language or None}
+
+    for unit, text, reason in zip(units, texts, reasons):
+        template, _ = mask(text)
+        if reason is None and not has_words(template):
+            reason = "placeholders_only"
+        if reason is None and identifier is not None:
+            if template not in languages:
+                languages[template] = identifier.bypass(template)
+            if languages[template]:
+                reason = f"language_{languages[template]}"
+                if bypassed is not None:
+                    bypassed[template] = languages[template]
+
+        # Skip only numbers/units/codes
+        if reason is not None:
+            for idx in unit:
+                text_elements[idx].translated = text_elements[idx].text
+                text_elements[idx].type = "skip"
+            skipped[reason] += len(unit)
         else:
-            # EVERYTHING ELSE → Haiku (NO dictionary check!)
-            elem["type"] = "needs_haiku"
-            needs_translation[str(idx)] = text
+            # Everything else goes to the resolver tiers (translate_elements)
+            for idx in unit:
+                text_elements[idx].type = "needs_haiku"
+            key = key_for_text.get(template)
+            if key is None:
+                key = str(len(key_for_text))
+                key_for_text[template] = key
+                needs_translation[key] = template
+                targets[key] = []
+            targets[key].append(unit)
 
-    print(f"   Skipped (numbers/units): {skipped}")
-    print(f"   Sending to Haiku: {len(needs_translation)}")
+    return needs_translation, targets, skipped
 
-    # Translate with Haiku
-    input_tokens = 0
-    output_tokens = 0
+def translate_elements(text_elements, api_key, memory=None, verbose=True, previous=None, dictionary=None):
+    """
+    Fill in .translated/.type on every element
+
+    Tiers, cheapest first: previous revision, local dictionary (exact, then
+    case-insensitive), translation memory, then Haiku.
+
+    Args:
+        text_elements: Elements from extract_text_from_pdf (modified in place)
+        api_key: Anthropic API key
+        memory: TranslationMemory (defaults to the shared translation_memory.db)
+        verbose: Print progress
+        previous: PreviousRevision of the same drawing; units whose text is
+                  unchanged keep their earlier English
+        dictionary: DictionaryIndex (defaults to DICTIONARY_INDEX or the
+                    TRANSLATION_DICTIONARIES files; skipped if neither is set)
+
+    Returns:
+        Dict of counts and token usage
+
+    Raises:
+        Exception from the API if Haiku translation fails
+    """
+    # Group what needs translating; the tiers below resolve it, Haiku last
+    bypassed = {}
+    needs_translation, targets, skipped = group_translation_requests(text_elements, bypassed)
+
+    def apply_unit(unit, english, source):
+        """Write a translation (with the unit's own placeholder values) to the lines of one unit"""
+        english = fill(english, mask(unit_text(text_elements, unit))[1])
+        lines = [text_elements[idx] for idx in unit]
+        for elem, line_text in zip(lines, flow_text(english, lines) if len(lines) > 1 else [english]):
+            elem.translated = line_text
+            elem.type = source
+        return len(unit)
+
+    def apply_translation(key, english, source):
+        """Write one translation to every unit that shares the string"""
+        return sum(apply_unit(unit, english, source) for unit in targets.get(key, []))
+
+    all_units = [unit for units in targets.values() for unit in units]
+    paragraph_units = [unit for unit in all_units if len(unit) > 1]
+    cell_units = [unit for unit in all_units if text_elements[unit[0]].cell is not None]
+
+    # Distinct values per table column ({(page, table, column): {value}})
+    column_vocabulary = {}
+    for key, units in targets.items():
+        for unit in units:
+            first = text_elements[unit[0]]
+            if first.cell is not None:
+                table, _, column = first.cell
+                column_vocabulary.setdefault((first.page, table, column), set()).add(key)
+    stats = {
+        "elements": len(text_elements),
+        "skipped": sum(skipped.values()),
+        "bypassed": len(bypassed),
+        "bypass_tokens": sum(estimate_request_tokens(template) for template in bypassed),
+        "candidates": sum(len(unit) for units in targets.values() for unit in units),
+        "units": sum(len(units) for units in targets.values()),
+        "paragraphs": len(paragraph_units),
+        "paragraph_lines": sum(len(unit) for unit in paragraph_units),
+        "cells": len(cell_units),
+        "columns": len(column_vocabulary),
+        "column_values": sum(len(values) for values in column_vocabulary.values()),
+        "unique": len(targets),
+        "variants": len({unit_text(text_elements, unit) for unit in all_units}),
+        "previous": 0,
+        "dictionary_exact": 0,
+        "dictionary_casefold": 0,
+        "memory": 0,
+        "haiku": 0,
+        "unresolved": 0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cache_read_input_tokens": 0,
+        "cache_creation_input_tokens": 0
+    }
+    for reason, count in skipped.items():
+        stats[f"skip_{reason}"] = count
+
+    # Reuse the previous revision for units that did not change
+    if previous is not None:
+        pending = [(key, unit) for key, units in targets.items() for unit in units]
+        reused, revision_counts = previous.diff(text_elements, [unit for _, unit in pending])
+        stats.update(revision_counts)
+
+        remaining = {}
+        for pos, (key, unit) in enumerate(pending):
+            if pos in reused:
+                stats["previous"] += apply_unit(unit, reused[pos], "previous")
+            else:
+                remaining.setdefault(key, []).append(unit)
+        targets = remaining
+        for key in list(needs_translation):
+            if key not in targets:
+                del needs_translation[key]
 
+        if verbose:
+            print(f"   From previous revision: {stats['previous']} ({stats['unchanged']} unchanged, "
+                  f"{stats['moved']} moved; {stats['changed']} changed, {stats['added']} added, "
+                  f"{stats['removed']} removed)")
+
+    # Local dictionary: exact match, then the casefold index
+    if dictionary is None:
+        dictionary = get_default_dictionary()
+    if dictionary is not None:
+        for key in list(needs_translation):
+            english, tier = dictionary.lookup(needs_translation[key])
+            if english is not None:
+                stats[f"dictionary_{tier}"] += apply_translation(key, english, "dictionary")
+                del needs_translation[key]
+
+    # Consult translation memory before paying for Haiku
+    if memory is None:
+        memory = get_default_memory()
+
+    remembered = memory.lookup(needs_translation.values())
+    for key in list(needs_translation):
+        english = remembered.get(needs_translation[key])
+        if english is not None and placeholders_intact(needs_translation[key], english):
+            stats["memory"] += apply_translation(key, english, "memory")
+            del needs_translation[key]
+
+    if verbose:
+        print(f"   Skipped (numbers/units): {stats['skipped']}{skip_breakdown(stats)}")
+        if stats["bypassed"]:
+            print(f"   Language ID: {stats['bypassed']} non-French strings kept as is "
+                  f"(~{stats['bypass_tokens']:,} tokens saved)")
+        if stats["paragraphs"]:
+            print(f"   Paragraphs: {stats['paragraph_lines']} wrapped lines joined into {stats['paragraphs']} items")
+        if stats["cells"]:
+            print(f"   Table cells: {stats['cells']} cells in {stats['columns']} columns -> "
+                  f"{stats['column_values']} distinct column values")
+        if stats["variants"] > stats["unique"]:
+            print(f"   Placeholders: {stats['variants']} distinct strings -> {stats['unique']} templates")
+        print(f"   From dictionary: {stats['dictionary_exact']} exact + "
+              f"{stats['dictionary_casefold']} case-insensitive")
+        print(f"   From translation memory: {stats['memory']}")
+        print(f"   Sending to Haiku: {len(needs_translation)}")
+
+    def remember_batch(batch, result):
+        """Write each successful batch to memory as soon as it lands"""
+        memory.store({
+            batch[key]: english
+            for key, english in result["translations"].items()
+            if key in batch and placeholders_intact(batch[key], english)
+        })
+
+    # Translate with Haiku
     if needs_translation:
-        print(f"\nTranslating {len(needs_translation)} items with Haiku 4.5...")
+        if verbose:
+            print(f"\nTranslating {len(needs_translation)} items with Haiku 4.5...")
+        result = translate_batch(needs_translation, api_key, on_batch=remember_batch)
+        for key in ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens"):
+            stats[key] = result[key]
+
+        # Apply Haiku translations; a template whose placeholders came back
+        # damaged is retranslated with its real values instead
+        damaged = {}
+        for key, english in result["translations"].items():
+            if placeholders_intact(needs_translation[key], english):
+                stats["haiku"] += apply_translation(key, english, "haiku")
+            else:
+                for unit in targets[key]:
+                    damaged.setdefault(unit_text(text_elements, unit), []).append(unit)
+        unresolved = len(result["unresolved"])
+
+        if damaged:
+            if verbose:
+                print(f"   Placeholders damaged in {len(damaged)} strings, retranslating them unmasked")
+            texts = dict(zip(map(str, range(len(damaged))), damaged))
+            retry = translate_batch(texts, api_key)
+            for key, english in retry["translations"].items():
+                for unit in damaged[texts[key]]:
+                    stats["haiku"] += apply_unit(unit, english, "haiku")
+            unresolved += len(retry["unresolved"])
+            for key in ("input_tokens", "output_tokens", "cache_read_input_tokens", "cache_creation_input_tokens"):
+                stats[key] += retry[key]
+        stats["unresolved"] = unresolved
+
+        if verbose:
+            print(f"   Got {len(result['translations'])} translations from Haiku")
+            if result["unresolved"]:
+                print(f"   Unresolved after retries: {len(result['unresolved'])} (left in French)")
+            print(f"   Tokens: {stats['input_tokens']} input + {stats['output_tokens']} output = "
+                  f"{stats['input_tokens'] + stats['output_tokens']} total")
+            print(f"   Prompt cache: {stats['cache_read_input_tokens']} read + "
+                  f"{stats['cache_creation_input_tokens']} written")
+
+    return stats
+
+def render_page(page, page_elements):
+    """
+    Cover the French text on one page and draw the translations over it
+
+    Everything is drawn through a single Shape committed once per page;
+    committing per rectangle/text rewrites the page contents each time,
+    which made rendering quadratic in the number of elements.
+
+    Returns:
+        Number of texts inserted
+    """
+    shape = page.new_shape()
+
+    # Cover original text with white rectangles
+    for elem in page_elements:
+        shape.draw_rect(fitz.Rect(elem.x0 - 1, elem.y0 - 1, elem.x1 + 1, elem.y1 + 1))
+        shape.finish(color=(1, 1, 1), fill=(1, 1, 1))
+
+    # Insert translated text
+    success_count = 0
+    for elem in page_elements:
+        translated = elem.translated if elem.translated is not None else elem.text
+
+        if not translated:
+            continue
+
+        # Color conversion
+        color_int = elem.color
+        color = (
+            ((color_int >> 16) & 0xFF) / 255.0,
+            ((color_int >> 8) & 0xFF) / 255.0,
+            (color_int & 0xFF) / 255.0
+        )
+
         try:
-            result = translate_batch(needs_translation, api_key, batch_size=100)
-            translations = result["translations"]
-            input_tokens = result["input_tokens"]
-            output_tokens = result["output_tokens"]
+            shape.insert_text(
+                (elem.x0, elem.y1 - 1),
+                translated,
+                fontsize=elem.size,
+                color=color,
+                render_mode=0
+            )
+            success_count += 1
+        except:
+            pass
+
+    shape.commit()
+    return success_count
+
+def store_page(doc, page_num, page_elements, key):
+    """Add a rendered page to the page cache unless some of its text was left untranslated"""
+    if key is None or any(elem.translated is None for elem in page_elements):
+        return False
+    save_page(doc, page_num, key, revision_units(page_elements, translation_units(page_elements)))
+    return True
+
+def cached_page_units(page_keys, cached_pages, previous):
+    """
+    Revision record entries of the pages copied from the page cache
+
+    Taken from the units stored with each cached page, or carried forward
+    from the previous revision for pages cached without them.
+    """
+    units = []
+    for page_num in sorted(cached_pages):
+        page_units = load_page_units(page_keys[page_num], page_num)
+        if page_units is None and previous is not None:
+            page_units = previous.page_units(page_num)
+        if page_units is None:
+            print(f"   Page {page_num + 1}: cached without revision units; not in the record")
+            continue
+        units.extend(page_units)
+    return units
+
+def iter_pages(pdf_path, tables=False, skip=()):
+    """Yield (page_num, elements) as soon as each page is extracted"""
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in range(len(doc)):
+            if page_num not in skip:
+                yield page_num, extract_page(doc[page_num], page_num, tables=tables)
+    finally:
+        doc.close()
+
+def _process_pdf_streaming(input_path, output_path, api_key, memory, pages_in_flight, tables, previous,
+                           page_keys, cached_pages, record, source_name):
+    """
+    Page-by-page pipeline: extract → translate → render without waiting for the whole document
+
+    Each page is handed to a translation thread as soon as it is extracted,
+    and pages are rendered in order as their translations complete. At most
+    pages_in_flight pages are held in memory at once. Strings repeated across
+    pages are caught by the translation memory once an earlier page lands.
+    The page threads share the process-wide request limit, so no more than
+    MAX_CONCURRENCY requests are in flight however many pages are.
+    """
+    start_time = time.time()
+    first_page_latency = None
+    totals = {}
+    pending = deque()
+    all_elements = []
+
+    doc = fitz.open(input_path)
+
+    def render_next():
+        nonlocal first_page_latency
+        page_num, page_elements, future = pending.popleft()
+        stats = future.result()
+        all_elements.extend(page_elements)
+        inserted = render_page(doc[page_num], page_elements)
+        if page_keys:
+            store_page(doc, page_num, page_elements, page_keys[page_num])
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+
+        if first_page_latency is None:
+            first_page_latency = time.time() - start_time
+        print(f"   Page {page_num + 1}: {len(page_elements)} elements, "
+              f"{stats['dictionary_exact'] + stats['dictionary_casefold']} from dictionary, {stats['memory']} from memory, "
+              f"{stats['haiku']} by Haiku, {inserted} inserted")
+
+    try:
+        with ThreadPoolExecutor(max_workers=pages_in_flight) as executor:
+            for page_num, page_elements in iter_pages(input_path, tables, cached_pages):
+                future = executor.submit(translate_elements, page_elements, api_key, memory, False, previous)
+                pending.append((page_num, page_elements, future))
+
+                # Render finished pages in order; block when too many are in flight
+                while pending and (len(pending) >= pages_in_flight or pending[0][2].done()):
+                    render_next()
+
+            while pending:
+                render_next()
 
-            print(f"   Got {len(translations)} translations from Haiku")
-            print(f"   Tokens: {input_tokens} input + {output_tokens} output = {input_tokens + output_tokens} total")
+        for page_num, cached in cached_pages.items():
+            replace_page(doc, page_num, cached)
+    except Exception as e:
+        print(f"   Haiku translation failed: {e}")
+        doc.close()
+        return False, 0, 0, dict.fromkeys(CACHE_USAGE_KEYS, 0)
 
-            # Apply Haiku translations
-            for idx_str, english in translations.items():
-                idx_int = int(idx_str)
-                if idx_int < len(text_elements):
-                    text_elements[idx_int]["translated"] = english
-                    text_elements[idx_int]["type"] = "haiku"
+    print(f"\n--- TRANSLATION STATS ---")
+    print(f"   Total elements: {totals.get('elements', 0)}")
+    print(f"   Translated by Haiku: {totals.get('haiku', 0)}")
+    if previous is not None:
+        print(f"   From previous revision: {totals.get('previous', 0)} ({totals.get('changed', 0)} changed, "
+              f"{totals.get('added', 0)} added, {totals.get('removed', 0)} removed)")
+    print(f"   From dictionary: {totals.get('dictionary_exact', 0)} exact + "
+          f"{totals.get('dictionary_casefold', 0)} case-insensitive")
+    print(f"   From translation memory: {totals.get('memory', 0)}")
+    print(f"   Skipped (numbers/units): {totals.get('skipped', 0)}{skip_breakdown(totals)}")
+    if totals.get("bypassed"):
+        print(f"   Language ID: {totals['bypassed']} non-French strings kept as is "
+              f"(~{totals['bypass_tokens']:,} tokens saved)")
+    if totals.get("paragraphs"):
+        print(f"   Paragraphs: {totals['paragraph_lines']} lines -> {totals['paragraphs']} items")
+    if totals.get("cells"):
+        print(f"   Table cells: {totals['cells']} cells -> {totals['column_values']} column values "
+              f"in {totals['columns']} columns")
+    print(f"   Unresolved (left in French): {totals.get('unresolved', 0)}")
+    print(f"   Tokens: {totals.get('input_tokens', 0)} input + {totals.get('output_tokens', 0)} output")
+    print(f"   Prompt cache: {totals.get('cache_read_input_tokens', 0)} read + "
+          f"{totals.get('cache_creation_input_tokens', 0)} written")
+    if first_page_latency is not None:
+        print(f"   First page rendered after {first_page_latency:.1f}s")
+
+    print(f"\nSaving to: {output_path}")
+    doc.save(output_path, garbage=4, deflate=True, clean=True)
+    doc.close()
+    if record:
+        save_revision(record, source_name, all_elements, translation_units(all_elements),
+                      cached_page_units(page_keys, cached_pages, previous))
+    print("Done!")
+    return (True, totals.get("input_tokens", 0), totals.get("output_tokens", 0),
+            {key: totals.get(key, 0) for key in CACHE_USAGE_KEYS})
+
+def process_pdf(input_path, output_path, api_key, memory=None, extract_workers=1,
+                stream=False, pages_in_flight=MAX_CONCURRENCY, tables=False, previous=None, page_cache=True,
+                source_name=None, record=None):
+    """
+    Process single PDF through the translation tiers
+
+    Args:
+        input_path: French PDF
+        output_path: Where to save the translated PDF
+        api_key: Anthropic API key
+        memory: TranslationMemory to consult before calling Haiku
+                (defaults to the shared translation_memory.db)
+        extract_workers: Processes used to extract pages in parallel
+        stream: Translate and render page by page as pages are extracted
+        pages_in_flight: Pages extracted but not yet rendered (stream mode)
+        tables: Table mode for schedule sheets (off by default: find_tables
+                costs seconds per sheet and has not reduced requests yet;
+                None = on for BORDEREAU sheets, judged by source_name)
+        previous: Revision record of the previous issue (see revisions.py);
+                  only units added or changed since then are translated
+        page_cache: Copy pages already translated elsewhere (identical content
+                    hash) from the page cache instead of translating them again
+        source_name: Original file name when input_path is a temporary copy
+                     (e.g. an upload); used for tables=None, the log and the
+                     revision record
+        record: Where to write this run's revision record for a later
+                incremental run (e.g. revision_path(output_path)); None
+                writes no record
+
+    Returns:
+        (success, input tokens, output tokens, {cache_creation_input_tokens,
+        cache_read_input_tokens}); input tokens exclude prompt cache reads
+        and writes, which are billed at different rates (see estimate_cost)
+    """
+    source_name = source_name or os.path.basename(input_path)
+    print(f"\n{'='*80}")
+    print(f"HAIKU TRANSLATION TEST")
+    print(f"Processing: {source_name}")
+    print('='*80)
 
-        except Exception as e:
-            print(f"   Haiku translation failed: {e}")
-            return False, 0, 0
+    if memory is None:
+        memory = get_default_memory()
+
+    if tables is None:
+        tables = is_schedule_sheet(source_name)
+    if tables:
+        print("Table mode: schedule tables are translated cell by cell")
+
+    previous_revision = None
+    if previous:
+        previous_revision = PreviousRevision.load(previous)
+        if previous_revision is None:
+            print(f"No previous revision at {previous}; translating everything")
+        else:
+            print(f"Incremental: diffing against {previous_revision.source or previous}")
+
+    page_keys, cached_pages = [], {}
+    if page_cache:
+        page_keys, cached_pages = lookup_pages(input_path, page_cache_settings(tables))
+        print(f"Page cache: {len(cached_pages)} hit(s), {len(page_keys) - len(cached_pages)} miss(es)")
+
+    if stream:
+        print("Streaming pages (extract → translate → render)...")
+        return _process_pdf_streaming(input_path, output_path, api_key, memory, max(1, pages_in_flight),
+                                      tables, previous_revision, page_keys, cached_pages, record, source_name)
+
+    # Extract text (not needed at all when every page comes from the page cache)
+    page_timings = []
+    if cached_pages and len(cached_pages) == len(page_keys):
+        text_elements = []
+    else:
+        print("Extracting text...")
+        text_elements = extract_text_from_pdf(input_path, workers=extract_workers, page_timings=page_timings,
+                                              tables=tables)
+        if cached_pages:
+            text_elements = [elem for elem in text_elements if elem.page not in cached_pages]
+    print(f"   Found {len(text_elements)} text elements")
+    if page_timings:
+        slowest_page, slowest_time, _, _ = max(page_timings, key=lambda timing: timing[1])
+        total_time = sum(timing[1] for timing in page_timings)
+        span_count = sum(timing[2] for timing in page_timings)
+        print(f"   Extraction: {total_time:.2f}s over {len(page_timings)} page(s), "
+              f"slowest page {slowest_page + 1} ({slowest_time:.2f}s)")
+        print(f"   Line building: {span_count} span fragments -> {len(text_elements)} elements")
+        if len(page_timings) > 1:
+            for page_num, seconds, spans, merged in page_timings:
+                print(f"      Page {page_num + 1}: {seconds:.2f}s, {spans} spans -> {merged} elements")
+    elif text_elements:
+        print("   Extraction: loaded from extraction cache")
+
+    try:
+        stats = translate_elements(text_elements, api_key, memory, previous=previous_revision)
+    except Exception as e:
+        print(f"   Haiku translation failed: {e}")
+        return False, 0, 0, dict.fromkeys(CACHE_USAGE_KEYS, 0)
 
     # Count results
-    haiku_count = sum(1 for e in text_elements if e.get("type") == "haiku")
-    untranslated_count = sum(1 for e in text_elements if "translated" not in e)
+    untranslated_count = sum(1 for e in text_elements if e.translated is None)
+    dedup_ratio = stats["candidates"] / stats["unique"] if stats["unique"] else 1.0
 
     print(f"\n--- TRANSLATION STATS ---")
     print(f"   Total elements: {len(text_elements)}")
-    print(f"   Translated by Haiku: {haiku_count}")
-    print(f"   Skipped (numbers/units): {skipped}")
+    print(f"   Translated by Haiku: {stats['haiku']}")
+    if previous_revision is not None:
+        print(f"   From previous revision: {stats['previous']}")
+    print(f"   From dictionary: {stats['dictionary_exact'] + stats['dictionary_casefold']}")
+    print(f"   From translation memory: {stats['memory']}")
+    print(f"   Skipped (numbers/units): {stats['skipped']}{skip_breakdown(stats)}")
+    if stats["bypassed"]:
+        print(f"   Language ID: {stats['bypassed']} non-French strings kept as is "
+              f"(~{stats['bypass_tokens']:,} tokens saved)")
+    if stats["paragraphs"]:
+        print(f"   Paragraphs: {stats['paragraph_lines']} lines -> {stats['paragraphs']} items")
+    if stats["cells"]:
+        print(f"   Table cells: {stats['cells']} cells -> {stats['column_values']} column values "
+              f"in {stats['columns']} columns")
+    print(f"   Dedup ratio: {dedup_ratio:.1f}x ({stats['candidates']} elements -> {stats['unique']} unique strings)")
     print(f"   UNTRANSLATED (gaps): {untranslated_count}")
 
     # Show untranslated items if any
@@ -193,8 +1007,8 @@ def process_pdf(input_path, output_path, api_key):
         print(f"\n⚠️ WARNING: {untranslated_count} items were NOT translated!")
         print("These are the GAPS we're investigating:")
         for idx, elem in enumerate(text_elements):
-            if "translated" not in elem:
-                print(f"   - '{elem['text']}'")
+            if elem.translated is None:
+                print(f"   - '{elem.text}'")
                 if idx >= 10:
                     print(f"   ... and {untranslated_count - 10} more")
                     break
@@ -203,50 +1017,19 @@ def process_pdf(input_path, output_path, api_key):
     print("\nApplying translations to PDF...")
     doc = fitz.open(input_path)
 
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        page_elements = [e for e in text_elements if e["page"] == page_num]
-
-        # Cover original text with white rectangles
-        for elem in page_elements:
-            bbox = elem["bbox"]
-            rect = fitz.Rect(bbox[0] - 1, bbox[1] - 1, bbox[2] + 1, bbox[3] + 1)
-            page.draw_rect(rect, color=(1, 1, 1), fill=(1, 1, 1))
-
-        # Insert translated text
-        try:
-            font = fitz.Font("helv")
-        except:
-            font = fitz.Font()
-
-        success_count = 0
-        for elem in page_elements:
-            translated = elem.get("translated", elem["text"])
-            bbox = elem["bbox"]
-            size = elem["size"]
+    elements_by_page = {}
+    for elem in text_elements:
+        elements_by_page.setdefault(elem.page, []).append(elem)
 
-            if not translated:
-                continue
-
-            # Color conversion
-            color_int = elem["color"]
-            color = (
-                ((color_int >> 16) & 0xFF) / 255.0,
-                ((color_int >> 8) & 0xFF) / 255.0,
-                (color_int & 0xFF) / 255.0
-            )
+    for page_num in range(len(doc)):
+        if page_num in cached_pages:
+            replace_page(doc, page_num, cached_pages[page_num])
+            continue
 
-            try:
-                page.insert_text(
-                    (bbox[0], bbox[3] - 1),
-                    translated,
-                    fontsize=size,
-                    color=color,
-                    render_mode=0
-                )
-                success_count += 1
-            except:
-                pass
+        page_elements = elements_by_page.get(page_num, [])
+        success_count = render_page(doc[page_num], page_elements)
+        if page_keys:
+            store_page(doc, page_num, page_elements, page_keys[page_num])
 
         if page_num == 0:
             print(f"   Inserted {success_count}/{len(page_elements)} texts on page 1")
@@ -254,11 +1037,45 @@ def process_pdf(input_path, output_path, api_key):
     print(f"\nSaving to: {output_path}")
     doc.save(output_path, garbage=4, deflate=True, clean=True)
     doc.close()
+    if record:
+        save_revision(record, source_name, text_elements, translation_units(text_elements),
+                      cached_page_units(page_keys, cached_pages, previous_revision))
     print("Done!")
-    return True, input_tokens, output_tokens
+    return True, stats["input_tokens"], stats["output_tokens"], {key: stats[key] for key in CACHE_USAGE_KEYS}
+
+def _init_worker(request_limiter):
+    """Process pool initializer: share the global API request limit"""
+    set_request_limiter(request_limiter)
+
+def _process_pdf_job(pdf_path, output_path, api_key, extract_workers, stream, tables, previous, page_cache):
+    """Run process_pdf in a worker process"""
+    return process_pdf(pdf_path, output_path, api_key, extract_workers=extract_workers, stream=stream,
+                       tables=tables, previous=previous, page_cache=page_cache,
+                       record=revision_path(output_path))
 
 def main():
-    """Process PDF with 100% Haiku translation"""
+    """Process PDFs through the translation tiers (Haiku for what is left)"""
+    parser = argparse.ArgumentParser(description="Translate French PDFs with Haiku")
+    parser.add_argument("pdf", nargs="?", help="Single PDF to translate (default: all of original/)")
+    parser.add_argument("--jobs", type=int, default=1, help="PDFs processed in parallel (process pool)")
+    parser.add_argument("--max-requests", type=int, default=MAX_CONCURRENCY,
+                        help="API requests in flight across all jobs")
+    parser.add_argument("--extract-workers", type=int, default=1,
+                        help="Processes used to extract the pages of each PDF")
+    parser.add_argument("--stream", action="store_true",
+                        help="Translate and render page by page while extraction continues")
+    parser.add_argument("--tables", choices=["auto", "on", "off"], default="off",
+                        help="Extract schedule tables cell by cell (auto: BORDEREAU sheets only)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only translate what changed since the last run of each PDF")
+    parser.add_argument("--previous", help="Revision record of the previous issue (single PDF, implies --incremental)")
+    parser.add_argument("--no-page-cache", action="store_true",
+                        help="Translate every page even if an identical page was translated before")
+    args = parser.parse_args()
+    if args.previous and not args.pdf:
+        parser.error("--previous applies to a single PDF")
+    tables = {"auto": None, "on": True, "off": False}[args.tables]
+
     # Get API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
@@ -269,9 +1086,9 @@ def main():
     os.makedirs(TRANSLATED_FOLDER, exist_ok=True)
 
     # Get files to process
-    if len(sys.argv) > 1:
+    if args.pdf:
         # Single file mode
-        pdf_files = [Path(sys.argv[1])]
+        pdf_files = [Path(args.pdf)]
     else:
         # Process all PDFs in original folder
         pdf_files = list(Path("original").glob("*.pdf"))
@@ -281,9 +1098,9 @@ def main():
         sys.exit(1)
 
     print(f"\n{'='*80}")
-    print("100% HAIKU TRANSLATION TEST")
+    print("HAIKU TRANSLATION TEST")
     print("Purpose: Identify source of translation gaps")
-    print("Method: Translate EVERYTHING with Haiku (no dictionary, no indexed files)")
+    print("Method: Previous revision -> dictionary (opt-in) -> translation memory -> Haiku")
     print(f"Found {len(pdf_files)} PDF(s) to process")
     print('='*80)
 
@@ -291,13 +1108,10 @@ def main():
     success_count = 0
     total_input_tokens = 0
     total_output_tokens = 0
+    total_cache_tokens = dict.fromkeys(CACHE_USAGE_KEYS, 0)
 
-    for idx, pdf_path in enumerate(pdf_files, 1):
-        # Show progress with timer
-        elapsed = time.time() - start_time
-        print(f"\n[{idx}/{len(pdf_files)}] Processing: {pdf_path.name}")
-        print(f"⏱️  Elapsed time: {elapsed:.1f}s")
-
+    jobs = []
+    for pdf_path in pdf_files:
         if not pdf_path.exists():
             print(f"Error: File not found: {pdf_path}")
             continue
@@ -305,12 +1119,58 @@ def main():
         # Create output filename
         output_name = pdf_path.stem + " - HAIKU100TEST.pdf"
         output_path = os.path.join(TRANSLATED_FOLDER, output_name)
+        previous = args.previous or (revision_path(output_path) if args.incremental else None)
+        jobs.append((str(pdf_path), output_path, previous))
 
-        success, input_tokens, output_tokens = process_pdf(str(pdf_path), output_path, api_key)
-        if success:
-            success_count += 1
-            total_input_tokens += input_tokens
-            total_output_tokens += output_tokens
+    if args.jobs <= 1:
+        for idx, (pdf_path, output_path, previous) in enumerate(jobs, 1):
+            # Show progress with timer
+            elapsed = time.time() - start_time
+            print(f"\n[{idx}/{len(jobs)}] Processing: {Path(pdf_path).name}")
+            print(f"⏱️  Elapsed time: {elapsed:.1f}s")
+
+            success, input_tokens, output_tokens, cache_tokens = process_pdf(
+                pdf_path, output_path, api_key, extract_workers=args.extract_workers, stream=args.stream,
+                tables=tables, previous=previous, page_cache=not args.no_page_cache,
+                record=revision_path(output_path)
+            )
+            if success:
+                success_count += 1
+                total_input_tokens += input_tokens
+                total_output_tokens += output_tokens
+                for key, value in cache_tokens.items():
+                    total_cache_tokens[key] += value
+    else:
+        # Extraction and rendering are CPU-bound, so PDFs run in separate
+        # processes; one semaphore caps API requests across all of them
+        print(f"Running {args.jobs} jobs, at most {args.max_requests} API requests in flight")
+        with multiprocessing.Manager() as manager:
+            request_limiter = manager.BoundedSemaphore(args.max_requests)
+            with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                                     initargs=(request_limiter,)) as executor:
+                futures = {
+                    executor.submit(
+                        _process_pdf_job, pdf_path, output_path, api_key, args.extract_workers, args.stream,
+                        tables, previous, not args.no_page_cache
+                    ): pdf_path
+                    for pdf_path, output_path, previous in jobs
+                }
+                for idx, future in enumerate(as_completed(futures), 1):
+                    pdf_name = Path(futures[future]).name
+                    elapsed = time.time() - start_time
+                    try:
+                        success, input_tokens, output_tokens, cache_tokens = future.result()
+                    except Exception as e:
+                        print(f"\n[{idx}/{len(jobs)}] Failed: {pdf_name}: {e}")
+                        continue
+
+                    print(f"\n[{idx}/{len(jobs)}] Finished: {pdf_name} (⏱️  {elapsed:.1f}s)")
+                    if success:
+                        success_count += 1
+                        total_input_tokens += input_tokens
+                        total_output_tokens += output_tokens
+                        for key, value in cache_tokens.items():
+                            total_cache_tokens[key] += value
 
     # Final summary
     total_time = time.time() - start_time
@@ -322,23 +1182,25 @@ def main():
     else:
         time_str = f"{seconds:.1f}s"
 
-    # Calculate cost (Haiku 4.5 pricing: $0.80/1M input, $4.00/1M output)
-    total_tokens = total_input_tokens + total_output_tokens
-    cost_input = (total_input_tokens / 1_000_000) * 0.80
-    cost_output = (total_output_tokens / 1_000_000) * 4.00
-    total_cost = cost_input + cost_output
+    # Calculate cost (Haiku 4.5 pricing, prompt cache writes/reads at their own rates)
+    total_tokens = total_input_tokens + total_output_tokens + sum(total_cache_tokens.values())
+    cost = estimate_cost(total_input_tokens, total_output_tokens, **total_cache_tokens)
 
     print(f"\n{'='*80}")
     print(f"ALL TESTS COMPLETE! Successfully processed {success_count}/{len(pdf_files)} PDFs")
     print(f"⏱️  Total time: {time_str}")
     print(f"\n📊 TOKEN USAGE:")
     print(f"   Input tokens:  {total_input_tokens:,}")
+    print(f"   Cache writes:  {total_cache_tokens['cache_creation_input_tokens']:,}")
+    print(f"   Cache reads:   {total_cache_tokens['cache_read_input_tokens']:,}")
     print(f"   Output tokens: {total_output_tokens:,}")
     print(f"   Total tokens:  {total_tokens:,}")
     print(f"\n💰 ESTIMATED COST:")
-    print(f"   Input:  ${cost_input:.4f}")
-    print(f"   Output: ${cost_output:.4f}")
-    print(f"   TOTAL:  ${total_cost:.4f} USD")
+    print(f"   Input:  ${cost['input']:.4f}")
+    print(f"   Cache:  ${cost['cache_write'] + cost['cache_read']:.4f} "
+          f"(${cost['cache_write']:.4f} written + ${cost['cache_read']:.4f} read)")
+    print(f"   Output: ${cost['output']:.4f}")
+    print(f"   TOTAL:  ${cost['total']:.4f} USD")
     print(f"\nOutput folder: {TRANSLATED_FOLDER}")
     print("\nNext step: Check the PDFs for any remaining French words")
     print("If there are NO gaps → Problem was missing dictionary/indexed entries")
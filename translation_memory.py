@@ -0,0 +1,157 @@
+"""Persistent SQLite translation memory keyed by normalized-text hash"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+# Default database location (override with TRANSLATION_MEMORY_DB)
+TRANSLATION_MEMORY_DB = os.environ.get("TRANSLATION_MEMORY_DB", "translation_memory.db")
+
+# SQLite limits the number of host parameters per statement
+LOOKUP_CHUNK_SIZE = 500
+
+# Process-wide memory opened on first use
+_default_memory = None
+_default_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for consistent hashing (collapse whitespace)"""
+    return ' '.join(text.split())
+
+
+def hash_text(text: str) -> str:
+    """Create SHA256 hash of normalized text for memory lookup"""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """
+    French → English translation memory stored in SQLite
+
+    The database runs in WAL mode with a busy timeout, so several processes
+    can read and write the same file at once. A single connection is shared
+    by the threads of one process and guarded by a lock.
+    """
+
+    def __init__(self, db_path: str = None, timeout: float = 30.0):
+        """
+        Open (or create) the translation memory
+
+        Args:
+            db_path: SQLite file path (defaults to TRANSLATION_MEMORY_DB)
+            timeout: Seconds to wait for another writer to release the lock
+        """
+        self.db_path = db_path or TRANSLATION_MEMORY_DB
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=timeout,
+            isolation_level=None,  # Explicit transactions only
+            check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA busy_timeout={int(timeout * 1000)}")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                hash TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+
+    def lookup(self, texts) -> dict:
+        """
+        Look up translations for many texts at once
+
+        Args:
+            texts: Iterable of French texts
+
+        Returns:
+            Dict of {french_text: english_translation} for texts found in memory
+        """
+        hashes = {}
+        for text in texts:
+            hashes.setdefault(hash_text(text), []).append(text)
+
+        found = {}
+        keys = list(hashes)
+        with self._lock:
+            for i in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+                chunk = keys[i:i + LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT hash, translation FROM translations WHERE hash IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for text_hash, translation in rows:
+                    for text in hashes[text_hash]:
+                        found[text] = translation
+        return found
+
+    def store(self, translations: dict) -> int:
+        """
+        Save translations in a single transaction
+
+        Args:
+            translations: Dict of {french_text: english_translation}
+
+        Returns:
+            Number of entries written
+        """
+        now = time.time()
+        rows = [
+            (hash_text(source), normalize_text(source), english, now)
+            for source, english in translations.items()
+            if english
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front so concurrent
+            # writers wait on busy_timeout instead of failing mid-transaction
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO translations (hash, source, translation, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def entries(self) -> dict:
+        """All stored translations as {normalized french: english}"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT source, translation FROM translations").fetchall())
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def get_default_memory() -> TranslationMemory:
+    """Return the process-wide TranslationMemory at TRANSLATION_MEMORY_DB"""
+    global _default_memory
+    with _default_lock:
+        if _default_memory is None:
+            _default_memory = TranslationMemory()
+        return _default_memory